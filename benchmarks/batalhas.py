@@ -0,0 +1,66 @@
+"""Confrontos entre as classes com os bônus iniciais, simulados em lote (model.batalha).
+
+Uso (na raiz do projeto):
+    python -m benchmarks.batalhas [--batalhas 1000000] [--dano 10] [--rodadas 3] [--seed 0]
+
+Para cada par (atacante, defensor) mostra a taxa de vitórias, empates e
+mortes e a perda média de vida, para ajustar o dano e os bônus de
+SistemaHabilidades.aplicar_bonus_iniciais.
+
+Referência (seed 0, 1 milhão de batalhas por confronto, bônus de cada classe
+aplicados como no MotorJogo): todos os 16 confrontos dão 0,466 de vitória,
+0,068 de empate, nenhuma morte e -14,25 de vida média para cada lado. Com
+vida de 100 a 130 e no máximo 30 de dano por batalha, o bônus de vida não
+muda uma batalha isolada; ele pesa ao longo da partida, junto com a
+velocidade.
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from core.enums import ClassePersonagem
+from model.batalha import RODADAS, DANO_RODADA, Lutador, simular_batalhas
+from model.characters import Personagem
+from model.habilidades import SistemaHabilidades
+
+CLASSES = [ClassePersonagem.GUERREIRO, ClassePersonagem.MAGO, ClassePersonagem.LADINO, ClassePersonagem.CLERIGO]
+
+
+def _media(deltas, total):
+    return sum(d * q for d, q in deltas.items()) / max(1, total)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batalhas", type=int, default=1_000_000, help="batalhas por confronto")
+    parser.add_argument("--dano", type=int, default=DANO_RODADA, help="dano por rodada vencida")
+    parser.add_argument("--rodadas", type=int, default=RODADAS)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    bonus = SistemaHabilidades(None)
+    lutadores = {}
+    for classe in CLASSES:
+        p = Personagem(classe.name, (0, 0), classe)
+        bonus.aplicar_bonus_iniciais(p)
+        lutadores[classe] = Lutador(p.vida_atual, 0, args.dano)
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{args.batalhas} batalhas por confronto, {args.rodadas} rodadas, dano {args.dano}")
+    print(f"{'atacante':>10} {'defensor':>10} {'vitória':>8} {'empate':>8} {'morte A':>8} {'morte D':>8}"
+          f" {'ΔA':>7} {'ΔD':>7} {'ms':>7}")
+    for a in CLASSES:
+        for d in CLASSES:
+            t0 = time.perf_counter()
+            r = simular_batalhas(lutadores[a], lutadores[d], args.batalhas, args.rodadas, rng=rng)
+            ms = (time.perf_counter() - t0) * 1000
+            print(f"{a.name:>10} {d.name:>10} {r.vitorias / r.total:8.3f} {r.empates / r.total:8.3f}"
+                  f" {r.mortes_atacante / r.total:8.3f} {r.mortes_defensor / r.total:8.3f}"
+                  f" {_media(r.delta_atacante, r.total):7.2f} {_media(r.delta_defensor, r.total):7.2f} {ms:7.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
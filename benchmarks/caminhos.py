@@ -0,0 +1,73 @@
+"""Compara o A* padrão com a busca com saltos (model.saltos): nós expandidos e tempo.
+
+Uso (na raiz do projeto):
+    python -m benchmarks.caminhos [--mapa 12] [--largura 200] [--altura 200] [--consultas 300]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from model.board import Tabuleiro
+from model.mapas import MAPAS
+from model.movement import a_estrela_ids, celulas_bloqueadas
+from model.saltos import GradeSaltos, saltos_ids
+
+
+def _medir(busca, consultas):
+    """(expandidos, segundos, custos) de `busca(s, alvo, fechados)` sobre as consultas."""
+    expandidos = 0
+    custos = []
+    t0 = time.perf_counter()
+    for s, alvo in consultas:
+        fechados = set()
+        achou, _, g = busca(s, alvo, fechados)
+        expandidos += len(fechados)
+        custos.append(g[alvo] if achou else None)
+    return expandidos, time.perf_counter() - t0, custos
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mapa", type=int, nargs="+", default=[12, 6],
+                        help="mapa_id (um ou mais; ver model/mapas.py)")
+    parser.add_argument("--largura", type=int, default=200)
+    parser.add_argument("--altura", type=int, default=200)
+    parser.add_argument("--consultas", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    for mapa_id in args.mapa:
+        tabuleiro = Tabuleiro(args.largura, args.altura, mapa_id=mapa_id, seed=args.seed)
+        grafo = tabuleiro.grafo
+        bloqueadas = celulas_bloqueadas(tabuleiro)
+
+        t0 = time.perf_counter()
+        grade = GradeSaltos(grafo)
+        montagem = time.perf_counter() - t0
+
+        livres = [i for i, c in enumerate(grafo.custo_celula) if c]
+        rng = random.Random(args.seed)
+        consultas = [(rng.choice(livres), rng.choice(livres)) for _ in range(args.consultas)]
+
+        exp_a, t_a, custos_a = _medir(
+            lambda s, alvo, f: a_estrela_ids(grafo, bloqueadas, s, alvo, fechados=f), consultas)
+        exp_s, t_s, custos_s = _medir(
+            lambda s, alvo, f: saltos_ids(grade, bloqueadas, s, alvo, fechados=f), consultas)
+        if custos_a != custos_s:
+            raise SystemExit(f"custos divergem no mapa {mapa_id}")
+
+        nome = MAPAS[mapa_id].nome if mapa_id in MAPAS else "?"
+        print(f"Mapa {mapa_id} ({nome}) {args.largura}x{args.altura}, {args.consultas} consultas")
+        print(f"  retângulos: {len(grade.custo)}, montagem {montagem * 1000:.1f} ms")
+        print(f"  a_estrela: {exp_a / args.consultas:9.1f} expandidos/consulta, {t_a * 1000 / args.consultas:7.2f} ms/consulta")
+        print(f"  saltos:    {exp_s / args.consultas:9.1f} expandidos/consulta, {t_s * 1000 / args.consultas:7.2f} ms/consulta"
+              f"  ({exp_a / max(1, exp_s):.2f}x menos nós, {t_a / max(t_s, 1e-9):.2f}x no tempo)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+"""Mede a memória do tabuleiro e das entidades.
+
+Uso (na raiz do projeto):
+    python -m benchmarks.memoria [--largura 600] [--altura 600] [--entidades 5000] [--chunk 32]
+"""
+import argparse
+import os
+import sys
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from core.enums import ClassePersonagem
+from model.board import Tabuleiro
+from model.characters import Personagem
+from model.items import Tesouro, Armadilha, Vida
+
+
+def _medir(fabrica):
+    """Bytes alocados (e ainda vivos) pela chamada `fabrica()`."""
+    tracemalloc.start()
+    antes, _ = tracemalloc.get_traced_memory()
+    obj = fabrica()
+    depois, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, depois - antes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--largura", type=int, default=600)
+    parser.add_argument("--altura", type=int, default=600)
+    parser.add_argument("--entidades", type=int, default=5000)
+    parser.add_argument("--chunk", type=int, default=None,
+                        help="usa armazenamento em chunks N x N (só aloca o que for visitado)")
+    args = parser.parse_args(argv)
+
+    n_celulas = args.largura * args.altura
+    tabuleiro, total = _medir(lambda: Tabuleiro(args.largura, args.altura, mapa_id=4, seed=0,
+                                                chunk=args.chunk))
+    print(f"Tabuleiro {args.largura}x{args.altura} ({n_celulas} células): "
+          f"{total / 1e6:.1f} MB, {total / n_celulas:.1f} bytes/célula")
+    if args.chunk:
+        print(f"  chunks alocados: {tabuleiro.chunks_alocados}, camadas: {tabuleiro.memoria_bytes()} bytes")
+
+    _, total = _medir(lambda: [tabuleiro.get_celula((i % args.largura, 0)) for i in range(args.entidades)])
+    print(f"Celula (visão): {total / args.entidades:.1f} bytes/instância")
+
+    classes = list(ClassePersonagem)
+    _, total = _medir(lambda: [Personagem(f"P{i}", (0, 0), classes[i % len(classes)])
+                               for i in range(args.entidades)])
+    print(f"Personagem: {total / args.entidades:.1f} bytes/instância")
+
+    for cls, extra in ((Tesouro, 50), (Armadilha, 20), (Vida, 20)):
+        _, total = _medir(lambda: [cls("item", (0, 0), extra) for _ in range(args.entidades)])
+        print(f"{cls.__name__}: {total / args.entidades:.1f} bytes/instância")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
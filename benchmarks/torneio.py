@@ -0,0 +1,181 @@
+"""Torneio: partidas completas entre bots, em paralelo, com resultados em arquivo.
+
+Uso (na raiz do projeto):
+    python -m benchmarks.torneio [--mapas 1 2 ...] [--seeds 0-99] [--bots guloso aleatorio ...]
+                                 [--prob-vida 0.1] [--prob-tesouro 0.3] [--prob-carta 0.5]
+                                 [--max-turnos 400] [--processos N] [--saida torneio.jsonl]
+
+Cada partida (mapa, seed) roda num processo do pool e vira uma linha JSON
+no arquivo de saída, gravada assim que termina: vencedor, turnos, troféus
+por herói, mortos, batalhas e como acabou ("vitoria", "sem_sobreviventes" ou
+"limite"). O arquivo só recebe linhas novas; rodando de novo com a mesma
+configuração, as partidas já gravadas são puladas, então um torneio
+interrompido continua de onde parou. Linhas de outra configuração (outros
+bots, chances ou tamanho) ficam no arquivo, mas não contam como feitas.
+
+As chances --prob-* são as de MotorJogo.repor_itens: valem para os itens
+repostos depois de cada coleta. Os dez itens iniciais seguem a distribuição
+original do jogo (metade cartas, metade armadilhas), qualquer que seja a
+configuração.
+
+A mesma seed gera o tabuleiro e semeia o serviço de sorteios do motor, então
+cada linha pode ser reproduzida isoladamente. As partidas são independentes
+e só o resultado (algumas centenas de bytes) volta ao processo principal:
+o tempo total cai na proporção dos núcleos.
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from model.board import Tabuleiro
+from model.bots import BOTS
+from model.motor import MotorJogo, ProbabilidadesItens, PROBABILIDADES, contar_trofeus
+
+# tamanho do tabuleiro da tela padrão do jogo
+LARGURA, ALTURA = 43, 25
+# os 15 mapas fixos do Tabuleiro; o procedural (16, model/mapas.py) só se pedido em --mapas
+MAPAS_TORNEIO = list(range(1, 16))
+# partidas no pool por processo: mantém todos ocupados sem enfileirar o torneio inteiro
+PENDENTES_POR_PROCESSO = 4
+
+
+def jogar(mapa_id, seed, bots, probabilidades, largura=LARGURA, altura=ALTURA, max_turnos=400) -> dict:
+    """Joga uma partida inteira; `bots[i]` controla o Herói i+1."""
+    tabuleiro = Tabuleiro(largura, altura, mapa_id=mapa_id, seed=seed)
+    motor = MotorJogo(tabuleiro, seed=seed, probabilidades=ProbabilidadesItens(*probabilidades))
+    herois = list(motor.jogador.personagens)
+    controle = {p: BOTS[bots[i % len(bots)]] for i, p in enumerate(herois)}
+    rng = motor.aleatorio.fluxo("bots")
+    mortos, batalhas = [], 0
+    while not motor.jogo_finalizado and motor.turno_atual <= max_turnos:
+        p = motor.personagem_selecionado
+        for evento in motor.step(controle[p](motor, rng)):
+            if evento.tipo == "batalha":
+                batalhas += 1
+            elif evento.tipo == "morte":
+                mortos.append(evento.dados["personagem"].nome)
+    if motor.vencedor:
+        fim = "vitoria"
+    elif motor.jogo_finalizado:
+        fim = "sem_sobreviventes"
+    else:
+        fim = "limite"
+    return {
+        "mapa": mapa_id,
+        "seed": seed,
+        "vencedor": motor.vencedor,
+        "fim": fim,
+        "turnos": motor.turno_atual,
+        "trofeus": {p.nome: contar_trofeus(p) for p in herois},
+        "mortos": mortos,
+        "batalhas": batalhas,
+        "bots": {p.nome: bots[i % len(bots)] for i, p in enumerate(herois)},
+    }
+
+
+def _jogar_partida(args):
+    mapa_id, seed, config = args
+    t0 = time.perf_counter()
+    resultado = jogar(mapa_id, seed, config["bots"], config["probabilidades"],
+                      config["largura"], config["altura"], config["max_turnos"])
+    resultado["ms"] = round((time.perf_counter() - t0) * 1000, 1)
+    return resultado
+
+
+def assinatura(config: dict) -> str:
+    """Identifica a configuração nas linhas do arquivo (para retomar só o que é dela)."""
+    return hashlib.sha1(json.dumps(config, sort_keys=True).encode()).hexdigest()[:12]
+
+
+def partidas_feitas(caminho: str, config_id: str) -> set:
+    """(mapa, seed) já gravados com esta configuração; ignora linhas cortadas no meio."""
+    feitas = set()
+    if not os.path.exists(caminho):
+        return feitas
+    with open(caminho, encoding="utf-8") as f:
+        for linha in f:
+            try:
+                r = json.loads(linha)
+            except ValueError:
+                continue
+            if r.get("config") == config_id:
+                feitas.add((r["mapa"], r["seed"]))
+    return feitas
+
+
+def _intervalo_seeds(texto: str) -> list:
+    """"0-99" ou "1,5,9" (ou os dois misturados) -> lista de seeds."""
+    seeds = []
+    for parte in texto.split(","):
+        inicio, _, fim = parte.partition("-")
+        seeds.extend(range(int(inicio), int(fim) + 1) if fim else [int(inicio)])
+    return seeds
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mapas", type=int, nargs="+", default=MAPAS_TORNEIO,
+                        help="mapa_id (ver model/mapas.py; padrão: os 15 fixos)")
+    parser.add_argument("--seeds", default="0-9", help='ex.: "0-999" ou "3,7,11"')
+    parser.add_argument("--bots", nargs="+", default=["guloso"], choices=sorted(BOTS),
+                        help="bot de cada herói, em ordem (repete se faltar)")
+    parser.add_argument("--prob-vida", type=float, default=PROBABILIDADES.vida, help="chance de vida ao repor itens")
+    parser.add_argument("--prob-tesouro", type=float, default=PROBABILIDADES.tesouro,
+                        help="chance de tesouro ao repor itens")
+    parser.add_argument("--prob-carta", type=float, default=PROBABILIDADES.carta, help="chance de carta ao repor itens")
+    parser.add_argument("--largura", type=int, default=LARGURA)
+    parser.add_argument("--altura", type=int, default=ALTURA)
+    parser.add_argument("--max-turnos", type=int, default=400)
+    parser.add_argument("--processos", type=int, default=os.cpu_count())
+    parser.add_argument("--saida", default="torneio.jsonl")
+    args = parser.parse_args(argv)
+
+    config = {
+        "bots": args.bots,
+        "probabilidades": [args.prob_vida, args.prob_tesouro, args.prob_carta],
+        "largura": args.largura, "altura": args.altura, "max_turnos": args.max_turnos,
+    }
+    config_id = assinatura(config)
+    feitas = partidas_feitas(args.saida, config_id)
+    fila = [(m, s, config) for m in args.mapas for s in _intervalo_seeds(args.seeds) if (m, s) not in feitas]
+    print(f"{len(feitas)} partidas já feitas, {len(fila)} a jogar em {args.processos} processos -> {args.saida}")
+
+    t0 = time.perf_counter()
+    jogadas = vitorias = 0
+    with open(args.saida, "a+", encoding="utf-8") as saida, \
+            ProcessPoolExecutor(args.processos) as pool:
+        # uma linha cortada por interrupção fica isolada: a próxima começa em linha nova
+        saida.seek(0, os.SEEK_END)
+        if saida.tell():
+            saida.seek(saida.tell() - 1)
+            if saida.read(1) != "\n":
+                saida.write("\n")
+        proximas = iter(fila)
+        pendentes = set()
+        while True:
+            while len(pendentes) < args.processos * PENDENTES_POR_PROCESSO:
+                partida = next(proximas, None)
+                if partida is None:
+                    break
+                pendentes.add(pool.submit(_jogar_partida, partida))
+            if not pendentes:
+                break
+            prontas, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+            for futuro in prontas:
+                r = futuro.result()
+                r["config"] = config_id
+                saida.write(json.dumps(r, ensure_ascii=False) + "\n")
+                saida.flush()
+                jogadas += 1
+                vitorias += r["fim"] == "vitoria"
+    dt = time.perf_counter() - t0
+    print(f"{jogadas} partidas em {dt:.1f} s ({jogadas / max(dt, 1e-9):.1f}/s), {vitorias} com vencedor")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,35 +1,15 @@
 import pygame
-import random
-from controller.cartaEfeitoController import CartaEfeitoController
+
 
 class CartaController:
+    """Popup das cartas sorteadas pelo motor (evento "carta")."""
+
     def __init__(self, game):
         self.game = game
-        self.carta_efeito = CartaEfeitoController(game)
         self.font_titulo = pygame.font.SysFont("arial", 40, bold=True)
         self.font_texto = pygame.font.SysFont("arial", 26)
-        self.cartas = self._carregar_cartas()
-
-    def _carregar_cartas(self):
-        return [
-            ("Sorte", "Ganhe 30 de vida!"),
-            ("Sorte", "Ganhe 1 troféu extra!"),
-            ("Sorte", "Teleporte para uma posição aleatória!"),
-            ("Azar", "Perde 25 de vida!"),
-            ("Azar", "Perde um turno!"),
-            ("Sorte", "Ganhe 50 de vida!"),
-            ("Azar", "Perde 15 de vida!"),
-            ("Sorte", "Teleporte mágico para lugar seguro!"),
-        ]
-
-    def sortear_carta(self, personagem):
-        """Sorteia e aplica uma carta ao personagem."""
-        tipo, descricao = random.choice(self.cartas)
-        self._mostrar_popup(tipo, descricao)
-        carta = type("CartaTemp", (), {"descricao": descricao})  # carta temporária
-        self.carta_efeito.aplicar_efeito(personagem, carta)
 
-    def _mostrar_popup(self, tipo, descricao):
+    def mostrar_popup(self, tipo, descricao):
         """Exibe o popup visual da carta."""
         tela = self.game.tela
         clock = pygame.time.Clock()
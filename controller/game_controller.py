@@ -1,5 +1,4 @@
 # controller/game_controller.py
-import random
 import pygame
 import sys
 
@@ -8,41 +7,61 @@ from core.constants import (
     AREA_JOGO_ALTURA, AREA_JOGO_LARGURA, UI_MARGEM_LATERAL, UI_PANEL_ALTURA,
     HUD_W, HUD_H, HUD_PADDING, TURNO_DUR_MS
 )
-from core.enums import TipoItem, ClassePersonagem
+from core.enums import TipoItem
 from core.messenger import Mensageiro
+from core.regras_terreno import REGRAS
 from model.board import Tabuleiro
-from model.items import Tesouro, Armadilha, Vida, Carta
-from model.characters import Jogador, Personagem
-from model.movement import SistemaMovimento
+from model.mapas import MAPAS
+from model.characters import Personagem
+from model.motor import MotorJogo
 from view.assets import sprite_manager, obter_animacao_personagem
 from view.renderer import Renderer
 from controller.cartaController import CartaController
-from controller.classeController import ClasseController
 from view.gif_player import GifPlayer
+from view.miniaturas import GeradorMiniaturas
 
-PROB_VIDA = 0.10
-PROB_TESOURO = 0.30
-PROB_ARMADILHA = 0.30
-PROB_CARTA = 0.50
+# intervalo entre passos ao andar por um caminho clicado
+PASSO_ANIMACAO_MS = 110
 
 
 class GameController:
-    def __init__(self):
+    """Janela, entrada e animações sobre um MotorJogo (model/motor.py).
+
+    As regras e o estado da partida ficam no motor; aqui cada tecla ou
+    clique vira uma ação para `motor.step`, e os eventos devolvidos viram
+    mensagens, popups e animações.
+    """
+
+    # estado da partida, lido do motor
+    jogador = property(lambda self: self.motor.jogador)
+    sistema_movimento = property(lambda self: self.motor.sistema_movimento)
+    habilidades = property(lambda self: self.motor.habilidades)
+    fase_atual = property(lambda self: self.motor.fase_atual)
+    personagem_selecionado = property(lambda self: self.motor.personagem_selecionado)
+    turno_atual = property(lambda self: self.motor.turno_atual)
+    jogo_finalizado = property(lambda self: self.motor.jogo_finalizado)
+    vencedor = property(lambda self: self.motor.vencedor)
+
+    def __init__(self, arquivo_mapa=None):
         pygame.init()
         self.tela = pygame.display.set_mode((LARGURA_TELA, ALTURA_TELA))
         pygame.display.set_caption("Jogo de Fantasia")
         self.clock = pygame.time.Clock()
 
-        mapa_id = self.selecionar_mapa_visual()
-        if mapa_id is None:
-            pygame.quit()
-            return
+        if arquivo_mapa:
+            # mapa pronto (.gpmap): pula a seleção visual
+            self.tabuleiro = Tabuleiro.carregar(arquivo_mapa)
+        else:
+            mapa_id = self.selecionar_mapa_visual()
+            if mapa_id is None:
+                pygame.quit()
+                return
 
-        self.tabuleiro = Tabuleiro(
-            AREA_JOGO_LARGURA // TAMANHO_CELULA,
-            AREA_JOGO_ALTURA // TAMANHO_CELULA,
-            mapa_id=mapa_id
-        )
+            self.tabuleiro = Tabuleiro(
+                AREA_JOGO_LARGURA // TAMANHO_CELULA,
+                AREA_JOGO_ALTURA // TAMANHO_CELULA,
+                mapa_id=mapa_id
+            )
         self.gameplay_rect = pygame.Rect(
             UI_MARGEM_LATERAL, 0, AREA_JOGO_LARGURA, AREA_JOGO_ALTURA
         )
@@ -66,23 +85,22 @@ class GameController:
         self.turno_deadline = 0
         self.caindo = None
 
-        # Estados principais
-        self.jogador = Jogador("Jogador")
-        self.turno_atual = 1
-        self.fase_atual = "selecao"
-        self.personagem_selecionado = None
-        self.jogo_finalizado = False
-        self.vencedor = None
         self.jogo_rodando = True
+        self.msg = Mensageiro()
+        self.motor = MotorJogo(self.tabuleiro, msg=self.msg, relogio=pygame.time.get_ticks)
 
         # Subsistemas
         self.renderer = Renderer(self.tela, self)
-        self.sistema_movimento = SistemaMovimento()
-        self.ultimo_resultado_dado = 0
         self.mostrar_alcance = False
+        # prévia do caminho sob o mouse e passos pendentes de um clique
+        self.caminho_hover = []
+        self.custo_hover = 0
+        self.dano_hover = 0
+        self._chave_hover = None
+        self.passos_pendentes = []
+        self.tempo_proximo_passo = 0
         self.tempo_ultima_acao = pygame.time.get_ticks()
         self.delay_transicao = 2500
-        self.msg = Mensageiro()
         self.transicao_ativa = False
         self.transicao_alpha = 0
         self.transicao_inicio = 0
@@ -90,7 +108,6 @@ class GameController:
         self.transicao_personagem = None
 
         self.carta_controller = CartaController(self)
-        self.classe_controller = ClasseController(self)
 
         # Inicialização
         self._inicializar_jogo()
@@ -109,35 +126,13 @@ class GameController:
         mini_altura = 9
         cel_tam = 12
 
-        nomes_mapas = {
-            1: "Arquipélago",
-            2: "Cordilheiras",
-            3: "Floresta Densa",
-            4: "Reino Central",
-            5: "Caos Total",
-            6: "Deserto",
-            7: "Caverna",
-            8: "Ruínas Antigas",
-            9: "Vulcão",
-            10: "Pântano",
-            11: "Terras Geladas",
-            12: "Planície Real",
-            13: "Cidade Antiga",
-            14: "Campos de Lava",
-            15: "Fortaleza de Gelo"
-        }
+        nomes_mapas = {mapa_id: gerador.nome for mapa_id, gerador in MAPAS.items()}
 
         total_mapas = len(nomes_mapas)
 
-    # === Pré-renderiza miniaturas ===
-        previews = {}
-        for mapa_id in range(1, total_mapas + 1):
-            tabuleiro_preview = Tabuleiro(mini_largura, mini_altura, mapa_id=mapa_id)
-            surface = pygame.Surface((mini_largura * cel_tam, mini_altura * cel_tam))
-            for (x, y), cel in tabuleiro_preview.celulas.items():
-                cor1, _ = cel.get_cores_terreno()
-                pygame.draw.rect(surface, cor1, (x * cel_tam, y * cel_tam, cel_tam - 1, cel_tam - 1))
-            previews[mapa_id] = surface
+    # === Miniaturas: geradas em segundo plano (com cache em disco) ===
+        miniaturas = GeradorMiniaturas(mini_largura, mini_altura, cel_tam)
+        miniaturas.iniciar(nomes_mapas)
 
         rodando = True
         fade_surface = pygame.Surface((LARGURA_TELA, ALTURA_TELA))
@@ -173,7 +168,11 @@ class GameController:
                 if pos_y + mini_h < 100 or pos_y > ALTURA_TELA - 80:
                     continue
 
-                self.tela.blit(previews[mapa_id], (pos_x, pos_y))
+                preview = miniaturas.obter(mapa_id)
+                if preview:
+                    self.tela.blit(preview, (pos_x, pos_y))
+                else:
+                    pygame.draw.rect(self.tela, (40, 40, 50), rect)
 
             # Destaque hover
                 if rect.collidepoint(mouse_x, mouse_y):
@@ -221,108 +220,58 @@ class GameController:
     # -----------------------------------------------------------
     # Setup inicial
     # -----------------------------------------------------------
-    def _posicoes_iniciais_borda(self):
-        midx = self.tabuleiro.largura // 2
-        midy = self.tabuleiro.altura // 2
-        return [
-            (0, midy),
-            (self.tabuleiro.largura - 1, midy),
-            (midx, 0),
-            (midx, self.tabuleiro.altura - 1)
-        ]
-
-    def _posicoes_iniciais_seguras(self):
-        alvos = self._posicoes_iniciais_borda()
-        seguras = []
-        for (x, y) in alvos:
-            dx, dy = 0, 0
-            if x == 0: dx = 1
-            elif x == self.tabuleiro.largura - 1: dx = -1
-            elif y == 0: dy = 1
-            elif y == self.tabuleiro.altura - 1: dy = -1
-            cx, cy = x, y
-            for _ in range(max(self.tabuleiro.largura, self.tabuleiro.altura)):
-                cel = self.tabuleiro.get_celula((cx, cy))
-                if cel and cel.tipo_terreno.name != 'AGUA' and not cel.esta_ocupado():
-                    seguras.append((cx, cy))
-                    break
-                cx += dx
-                cy += dy
-                if cx < 0 or cy < 0 or cx >= self.tabuleiro.largura or cy >= self.tabuleiro.altura:
-                    break
-        while len(seguras) < 4:
-            seguras.append((self.tabuleiro.largura // 2, self.tabuleiro.altura // 2))
-        return seguras
-
     def _inicializar_jogo(self):
-        posicoes_iniciais = self._posicoes_iniciais_seguras()
-        classes = [
-            ClassePersonagem.GUERREIRO,
-            ClassePersonagem.MAGO,
-            ClassePersonagem.LADINO,
-            ClassePersonagem.CLERIGO
-        ]
-
-        for i, (pos, classe) in enumerate(zip(posicoes_iniciais, classes)):
-            p = Personagem(f"Herói {i + 1}", pos, classe)
-            p.vida_maxima = 100
-            p.vida_atual = 100
-            p.velocidade = 3
-
-            sprite = sprite_manager.obter_sprite_personagem(classe, TAMANHO_CELULA)
+        """Sprites e animações dos heróis criados pelo motor; mostra o primeiro turno."""
+        for p in self.jogador.personagens:
+            sprite = sprite_manager.obter_sprite_personagem(p.classe, TAMANHO_CELULA)
             if sprite:
                 p.sprite = sprite
                 
-            sprite_hd = sprite_manager.obter_sprite_personagem(classe, 180)
+            sprite_hd = sprite_manager.obter_sprite_personagem(p.classe, 180)
             if sprite_hd:
                 p.sprite_hd = sprite_hd
 
-            if not hasattr(p, "animations"):
-                p.animations = {}
-            walk = obter_animacao_personagem(classe, "walk", tamanho=64, fps=10)
-            act = obter_animacao_personagem(classe, "action", tamanho=64, fps=10)
+            walk = obter_animacao_personagem(p.classe, "walk", tamanho=64, fps=10)
+            act = obter_animacao_personagem(p.classe, "action", tamanho=64, fps=10)
             if walk: p.animations['walk'] = walk
             if act: p.animations['action'] = act
 
-            self.jogador.adicionar_personagem(p)
-            cel = self.tabuleiro.get_celula(pos)
-            if cel:
-                cel.adicionar_ocupante(p)
-                
-                
-        self.classe_controller.aplicar_bonus_iniciais(p)
-
-        self.ordem_turnos = self.jogador.personagens[:]
-        random.shuffle(self.ordem_turnos)
-        self.indice_turno = 0
-        self.personagem_selecionado = self.ordem_turnos[self.indice_turno]
-
-        self._gerar_itens()
         self.msg.add("Mapa selecionado com sucesso! Boa sorte!", (255, 255, 255), 2500)
-        self._mostrar_transicao_turno(self.personagem_selecionado)
+        self._apresentar(self.motor.coletar_eventos())
+
+    def _executar(self, acao):
+        """Passa a ação ao motor e apresenta o que ela causou."""
+        self.tempo_ultima_acao = pygame.time.get_ticks()
+        self._apresentar(self.motor.step(acao))
+
+    def _apresentar(self, eventos):
+        for evento in eventos:
+            tipo, dados = evento
+            if tipo == "dado":
+                self.mostrar_alcance = True
+            elif tipo == "fase":
+                self.mostrar_alcance = dados["fase"] == "movimento"
+            elif tipo == "selecao":
+                self.mostrar_alcance = False
+                self._resetar_cronometro_turno()
+            elif tipo == "batalha":
+                self._mostrar_animacao_batalha(dados)
+            elif tipo == "item":
+                if dados["item"].tipo == TipoItem.TESOURO:
+                    self._mostrar_animacao_bau(dados["personagem"], "tesouro")
+                elif dados["item"].tipo == TipoItem.ARMADILHA:
+                    self._mostrar_animacao_bau(dados["personagem"], "armadilha")
+            elif tipo == "carta":
+                self.carta_controller.mostrar_popup(dados["tipo"], dados["descricao"])
+            elif tipo == "turno":
+                self.mostrar_alcance = False
+                self.passos_pendentes = []
+                self._mostrar_transicao_turno(dados["personagem"])
+                self._resetar_cronometro_turno()
         
      # -----------------------------------------------------------
     # Exibição de transição de turno
     # -----------------------------------------------------------
-    def _transicao_turno(self):
-        now = pygame.time.get_ticks()
-
-        if now - self.tempo_transicao_turno < self.fade_duration:
-            self.fade_alpha = int(255 * (now - self.tempo_transicao_turno) / self.fade_duration)
-        else:
-            self.fade_alpha = 255
-
-        if self.fade_alpha == 255 and self.fade_in:
-            self.fade_in = False
-            self.tempo_transicao_turno = now
-
-        if self.fade_alpha == 0 and not self.fade_in:
-            self.fade_in = True
-            self.turno_atual += 1
-            self.indice_turno = (self.indice_turno + 1) % len(self.ordem_turnos)
-            self.personagem_selecionado = self.ordem_turnos[self.indice_turno]
-            self.tempo_transicao_turno = now
-
     def _mostrar_legenda_heroi(self):
         fonte = pygame.font.Font(None, 64)
         nome_heroi = self.personagem_selecionado.nome
@@ -334,75 +283,6 @@ class GameController:
             heroi_sprite.set_alpha(self.fade_alpha)
             self.tela.blit(heroi_sprite, (LARGURA_TELA // 2 - heroi_sprite.get_width() // 2, ALTURA_TELA // 2 + 50))
 
-    # -----------------------------------------------------------
-    # Geração de itens (inclui carta misteriosa)
-    # -----------------------------------------------------------
-    def _gerar_itens(self):
-        posicoes = [
-            pos for pos, cel in self.tabuleiro.celulas.items()
-            if (not cel.esta_ocupado())
-            and cel.tipo_terreno.name != 'AGUA'
-            and not self._eh_borda(pos)
-        ]
-
-        for _ in range(10):
-            if not posicoes:
-                break
-            rnd = random.random()
-            pos = random.choice(posicoes)
-            posicoes.remove(pos)
-
-            # --- 10% de chance de gerar carta ---
-            if rnd < 0.50:
-                item = Carta("📜 Carta Misteriosa", pos, self)
-                sprite = sprite_manager.obter_sprite_item("carta.png", TAMANHO_CELULA // 2)
-                item.controller = self
-            elif rnd < 0.15 + PROB_VIDA:
-                item = Vida("❤️ Poção de Vida", pos, vida=20)
-                sprite = sprite_manager.obter_sprite_item("vida.png", TAMANHO_CELULA // 2)
-            elif rnd < 0.10 + PROB_VIDA + PROB_TESOURO:
-                item = Tesouro("🏆 Tesouro", pos, 50)
-                sprite = sprite_manager.obter_sprite_item("tesouro.png", TAMANHO_CELULA // 2)
-            else:
-                item = Armadilha("💀 Armadilha", pos, 20)
-                sprite = sprite_manager.obter_sprite_item("armadilha.png", TAMANHO_CELULA // 2)
-
-            if sprite:
-                item.sprite = sprite
-            self.tabuleiro.celulas[pos].adicionar_item(item)
-
-    def repor_itens(self):
-        itens = sum(len(c.itens) for c in self.tabuleiro.celulas.values())
-        while itens < 10:
-            posicoes = [
-                pos for pos, cel in self.tabuleiro.celulas.items()
-                if (not cel.esta_ocupado())
-                and (not cel.itens)
-                and cel.tipo_terreno.name != 'AGUA'
-                and not self._eh_borda(pos)
-            ]
-            if not posicoes:
-                break
-            pos = random.choice(posicoes)
-            rnd = random.random()
-            if rnd < PROB_VIDA:
-                item = Vida("❤️ Poção de Vida", pos, vida=20)
-                sprite = sprite_manager.obter_sprite_item("vida.png", TAMANHO_CELULA // 2)
-            elif rnd < PROB_VIDA + PROB_TESOURO:
-                item = Tesouro("🏆 Troféu", pos, 50)
-                sprite = sprite_manager.obter_sprite_item("tesouro.png", TAMANHO_CELULA // 2)
-            elif rnd < PROB_VIDA + PROB_TESOURO + PROB_CARTA:
-                item = Carta("Carta Misteriosa", pos, self)
-                sprite = sprite_manager.obter_sprite_item("carta.png", TAMANHO_CELULA // 2)
-                item.controller = self
-            else:
-                item = Armadilha("💀 Armadilha", pos, 20)
-                sprite = sprite_manager.obter_sprite_item("armadilha.png", TAMANHO_CELULA // 2)
-            if sprite:
-                item.sprite = sprite
-            self.tabuleiro.celulas[pos].adicionar_item(item)
-            itens += 1
-
     # -----------------------------------------------------------
     # Loop principal
     # -----------------------------------------------------------
@@ -414,18 +294,8 @@ class GameController:
             if self.jogo_finalizado:
                 self.renderer.desenhar_tela_vitoria(self.vencedor)
             else:
-                self._verificar_transicoes_automaticas()
-                
-                batalha = getattr(self.sistema_movimento, "batalha_em_andamento", None)
-                if batalha and all(k in batalha for k in ("atacante", "defensor", "dado1", "dado2", "vencedor")):
-                    self._mostrar_animacao_batalha(
-                        batalha["atacante"],
-                        batalha["defensor"],
-                        batalha["dado1"],
-                        batalha["dado2"],
-                        batalha["vencedor"]
-                    )
-                    self.sistema_movimento.batalha_em_andamento = None  # evita repetir animação
+                self._avancar_passos_pendentes()
+                self._atualizar_hover()
     
             
                 self.renderer.desenhar_tabuleiro()
@@ -461,24 +331,21 @@ class GameController:
                         self._rolar_dados_movimento()
 
                 elif self.fase_atual == "movimento" and self.personagem_selecionado and not self.jogo_finalizado:
+                    if self.passos_pendentes:
+                        continue  # ainda andando pelo caminho clicado
                     self._teclas_movimento(e.key)
                     if e.key == pygame.K_RETURN:
-                        self.fase_atual = "acao"
-                        self.mostrar_alcance = False
-                        self.tempo_ultima_acao = pygame.time.get_ticks()
-                        self.msg.add("➡ Fase de AÇÃO", (255, 255, 255))
+                        self._executar(("encerrar_movimento",))
                         
                 elif self.fase_atual == "acao" and e.key == pygame.K_RETURN:
                     # ENTER pula o turno manualmente
-                    self.msg.add(f" {self.personagem_selecionado.nome} passou o turno.", (200, 200, 200))
-                    self._finalizar_turno()
-                    self._resetar_cronometro_turno()
+                    self._executar(("passar",))
                     return
 
 
                 elif self.fase_atual == "acao" and self.personagem_selecionado and not self.jogo_finalizado:
                     if e.key == pygame.K_x:
-                        self.classe_controller.usar_habilidade(self.personagem_selecionado)
+                        self._executar(("habilidade",))
 
                     if e.key == pygame.K_SPACE:
                         self._tentar_coletar_bau(self.personagem_selecionado.posicao)
@@ -511,25 +378,12 @@ class GameController:
                 rect = getattr(self, "botao_habilidade_rect", None)
                 if rect and rect.collidepoint(mx, my):
                     if self.fase_atual == "acao" and self.personagem_selecionado:
-                        self.classe_controller.usar_habilidade(self.personagem_selecionado)
-                        
-            elif e.type == pygame.USEREVENT and e.dict.get("tipo") == "batalha":
-                batalha = getattr(self.sistema_movimento, "batalha_em_andamento", None)
-                if batalha and all(k in batalha for k in ("atacante", "defensor", "vencedor")):
-                    self._mostrar_animacao_batalha(
-                        batalha["atacante"],
-                        batalha["defensor"],
-                        batalha["rodadas"][0].split()[0],  # só pra mostrar o 1º resultado
-                        "",  # sem necessidade dos dados
-                        batalha["vencedor"] or batalha["defensor"]
-                    )
-
-
-    def _mostrar_animacao_batalha(self, atacante, defensor, *_):
-        """Anima uma batalha em 3 rodadas com texto de dano flutuante."""
-        batalha = getattr(self.sistema_movimento, "batalha_em_andamento", None)
-        if not batalha:
-            return
+                        self._executar(("habilidade",))
+
+
+    def _mostrar_animacao_batalha(self, batalha):
+        """Anima uma batalha (evento do motor) em 3 rodadas com texto de dano flutuante."""
+        atacante, defensor = batalha["atacante"], batalha["defensor"]
 
         clock = pygame.time.Clock()
         fonte_titulo = pygame.font.SysFont("arial", 46, bold=True)
@@ -537,20 +391,21 @@ class GameController:
         fonte_dano = pygame.font.SysFont("arial", 50, bold=True)
         fonte_dados = pygame.font.SysFont("arial", 60, bold=True)
 
-        sprite_a = getattr(atacante, "sprite_hd", atacante.sprite)
-        sprite_d = getattr(defensor, "sprite_hd", defensor.sprite)
+        sprite_a = atacante.sprite_hd or atacante.sprite
+        sprite_d = defensor.sprite_hd or defensor.sprite
 
         rodadas = batalha.get("rodadas", [])
         vencedor_final = batalha.get("vencedor")
         perdedor_final = batalha.get("perdedor")
+        dados = batalha.get("dados", [])
 
     # loop de cada rodada
         for i, resultado in enumerate(rodadas, start=1):
             start = pygame.time.get_ticks()
             duracao = 1800  # tempo da rodada
             
-            dado1 = random.randint(1, 20)
-            dado2 = random.randint(1, 20)
+            # os dados que decidiram a rodada no motor
+            dado1, dado2 = dados[i - 1]
 
             dano_txt = None
             dano_y = 0
@@ -639,9 +494,6 @@ class GameController:
             pygame.display.flip()
             clock.tick(60)
 
-    # encerra a flag
-        self.sistema_movimento.batalha_em_andamento = None
-
     
     # -----------------------------------------------------------
     # Menu de pausa
@@ -726,12 +578,86 @@ class GameController:
         destino = (x + dx, y + dy)
         alc = self.sistema_movimento.posicoes_alcancaveis.get(self.personagem_selecionado, [])
         if destino in alc:
-            self.sistema_movimento.mover_personagem(self.tabuleiro, self.personagem_selecionado, destino)
-            self.tempo_ultima_acao = pygame.time.get_ticks()
-            pts = self.sistema_movimento.movimentos_disponiveis.get(self.personagem_selecionado, 0)
-            self.msg.add(f"{self.personagem_selecionado.nome} foi para {destino} | Restante: {pts}", (173, 216, 230))
-            if pts > 0:
-                self.sistema_movimento.calcular_alcance(self.tabuleiro, self.personagem_selecionado)
+            self._executar(("mover", destino))
+            self._avisar_posicao()
+
+    def _avisar_posicao(self):
+        p = self.personagem_selecionado
+        pts = self.sistema_movimento.movimentos_disponiveis.get(p, 0)
+        self.msg.add(f"{p.nome} foi para {p.posicao} | Restante: {pts}", (173, 216, 230))
+
+    def _atualizar_hover(self):
+        """Caminho ótimo até a célula sob o mouse, lido da árvore de alcance em cache.
+
+        Só refaz a leitura (O(tamanho do caminho)) quando a célula ou a árvore mudam.
+        O caminho mostrado é o que o clique anda de fato (ver _caminho_clicavel),
+        com o custo e o dano de terreno somados pelo caminho.
+        """
+        p = self.personagem_selecionado
+        if (self.fase_atual != "movimento" or not p or self.passos_pendentes
+                or self.caindo or not self.mostrar_alcance):
+            self.caminho_hover = []
+            self._chave_hover = None
+            return
+        pos = self._pixel_para_coordenadas_celula(*pygame.mouse.get_pos())
+        alcance = self.sistema_movimento.obter_alcance(self.tabuleiro, p)
+        # id(alcance) pode ser reusado depois da coleta; a árvore se identifica assim
+        chave = (pos, None if alcance is None else (alcance.origem, alcance.pontos, alcance.revisao))
+        if chave == self._chave_hover:
+            return
+        self._chave_hover = chave
+        self.caminho_hover = []
+        if pos is None or alcance is None or pos == p.posicao:
+            return
+        self.caminho_hover = self._caminho_clicavel(p, pos)
+        if self.caminho_hover:
+            self.custo_hover = alcance.dist[self.tabuleiro.grafo.id_de(self.caminho_hover[-1])]
+            self.dano_hover = sum(REGRAS.danos[self.tabuleiro.get_celula(c).codigo_terreno]
+                                  for c in self.caminho_hover[1:])
+
+    def _caminho_clicavel(self, p, destino):
+        """Caminho da árvore de alcance até `destino`, cortado na primeira célula
+        com outro ocupante: entrar nela abre uma batalha e a caminhada para ali."""
+        caminho = self.sistema_movimento.caminho_alcance(self.tabuleiro, p, destino)
+        for i, pos in enumerate(caminho[1:], start=1):
+            if any(oc is not p for oc in self.tabuleiro.get_celula(pos).ocupantes):
+                return caminho[:i + 1]
+        return caminho
+
+    def _iniciar_movimento_clicado(self, pos_celula):
+        p = self.personagem_selecionado
+        if not p or pos_celula == p.posicao:
+            return
+        caminho = self._caminho_clicavel(p, pos_celula)
+        if len(caminho) < 2:
+            return
+        self.passos_pendentes = caminho[1:]
+        self.tempo_proximo_passo = pygame.time.get_ticks()
+        self.caminho_hover = []
+
+    def _avancar_passos_pendentes(self):
+        """Dá no máximo um passo por quadro, a cada PASSO_ANIMACAO_MS."""
+        if not self.passos_pendentes:
+            return
+        p = self.personagem_selecionado
+        agora = pygame.time.get_ticks()
+        if agora < self.tempo_proximo_passo:
+            return
+        passo = self.passos_pendentes.pop(0)
+        # cada passo segue as regras de uma tecla: terreno, batalha e árvore re-enraizada
+        if self.fase_atual != "movimento" or not p or not p.esta_vivo():
+            self.passos_pendentes = []
+            return
+        batalha = any(oc is not p for oc in self.tabuleiro.get_celula(passo).ocupantes)
+        self._executar(("mover", passo))
+        if batalha or p.posicao != passo or self.personagem_selecionado is not p:
+            self.passos_pendentes = []
+            if p.posicao == passo:
+                self._avisar_posicao()
+            return
+        self.tempo_proximo_passo = agora + PASSO_ANIMACAO_MS
+        if not self.passos_pendentes:
+            self._avisar_posicao()
 
     def _clique_mouse(self, pos_mouse):
         mx, my = pos_mouse
@@ -741,10 +667,7 @@ class GameController:
 
         for p, rect in zip(self.jogador.personagens, self.huds_rects):
             if rect.collidepoint(mx, my) and p.esta_vivo():
-                self.personagem_selecionado = p
-                self.mostrar_alcance = False
-                self._resetar_cronometro_turno()
-                self.msg.add(f"{p.nome} selecionado", (255, 255, 255))
+                self._executar(("selecionar", p))
                 return
 
         # clique no tabuleiro
@@ -756,13 +679,13 @@ class GameController:
         if self.fase_atual == "selecao":
             for oc in cel.ocupantes:
                 if isinstance(oc, Personagem) and oc in self.jogador.personagens and oc.esta_vivo():
-                    self.personagem_selecionado = oc
-                    self.mostrar_alcance = False
-                    self.tempo_ultima_acao = pygame.time.get_ticks()
-                    self._resetar_cronometro_turno()
-                    self.msg.add(f"{oc.nome} selecionado", (255, 255, 255))
+                    self._executar(("selecionar", oc))
                     return
 
+        elif self.fase_atual == "movimento":
+            if self.personagem_selecionado and not self.passos_pendentes:
+                self._iniciar_movimento_clicado(pos_celula)
+
         elif self.fase_atual == "acao":
             if not self.personagem_selecionado or not self.personagem_selecionado.esta_vivo():
                 return
@@ -773,51 +696,9 @@ class GameController:
     # Ação de coletar item (baú/vida/armadilha/carta)
     # -----------------------------------------------------------
     def _tentar_coletar_bau(self, pos_celula):
-        cel = self.tabuleiro.get_celula(pos_celula)
-        if not cel:
-            return
-
-        for item in list(cel.itens):
-            # Carta misteriosa (item de ação)
-            if getattr(item, "tipo", None) == "CARTA":
-                item.controller = self  # garante referência
-                item.usar(self.personagem_selecionado)  # abre popup + aplica efeito
-                cel.remover_item(item)
-                return
-
-            # Itens padrão
-            if item.usar(self.personagem_selecionado):
-                cel.remover_item(item)
-                self.personagem_selecionado.inventario.append(item)
-
-                if item.tipo == TipoItem.TESOURO:
-                    self.msg.add("🏆 Tesouro coletado!", (255, 215, 0))
-                    self._mostrar_animacao_bau(self.personagem_selecionado, "tesouro")
-                elif item.tipo == TipoItem.VIDA:
-                    self.msg.add(f"❤️ +{getattr(item,'vida',0)} de Vida!", (0, 200, 0))
-                else:
-                    self.msg.add(f"💥 Armadilha! -{getattr(item,'dano',0)} HP", (255, 100, 100))
-                    self._mostrar_animacao_bau(self.personagem_selecionado, "armadilha")
-
-                self.tempo_ultima_acao = pygame.time.get_ticks()
-                self.repor_itens()
-
-                # vitória
-                trofeus = sum(1 for i in self.personagem_selecionado.inventario
-                              if getattr(i, 'tipo', None) == TipoItem.TESOURO)
-                if trofeus >= 5:
-                    self.jogo_finalizado = True
-                    self.vencedor = self.personagem_selecionado.nome
-                    self.msg.add(f"🏆 Vitória de {self.vencedor}!", (0, 200, 0), duracao_ms=2800)
-
-                # morte por dano
-                if self.personagem_selecionado.vida_atual <= 0:
-                    cel.remover_ocupante(self.personagem_selecionado)
-                    self.jogador.remover_personagem(self.personagem_selecionado)
-                    self.msg.add(f"{self.personagem_selecionado.nome} foi derrotado",
-                                 (255, 120, 120), duracao_ms=2400)
-                    self.personagem_selecionado = None
-                return
+        p = self.personagem_selecionado
+        if p and p.posicao == pos_celula:
+            self._executar(("coletar",))
 
 
 
@@ -872,7 +753,7 @@ class GameController:
             overlay.fill((0, 0, 0, 200))
             pygame.draw.rect(overlay, (255, 255, 255, 230), overlay.get_rect(), 4, border_radius=16)
             self.tela.blit(overlay, (cx, cy))
-            val = random.randint(1, 6)
+            val = self.motor.aleatorio.fluxo("animacao").randint(1, 6)
             txt = fonte.render(str(val), True, (255, 255, 0))
             self.tela.blit(txt, (LARGURA_TELA // 2 - txt.get_width() // 2,
                                  ALTURA_TELA // 2 - txt.get_height() // 2))
@@ -883,57 +764,10 @@ class GameController:
         if not self.personagem_selecionado or self.caindo:
             return
         self._animar_dado()
-        resultado = self.sistema_movimento.rolar_movimento(self.personagem_selecionado)
-        self.ultimo_resultado_dado = resultado
-        self.personagem_selecionado.rolou_dados = True
-        self.sistema_movimento.calcular_alcance(self.tabuleiro, self.personagem_selecionado)
-        self.mostrar_alcance = True
-        self.msg.add(f"🎲 Dado: {resultado} ponto(s) de movimento", (255, 255, 0))
-
-    def _verificar_transicoes_automaticas(self):
-        if self.caindo or self.jogo_finalizado:
-            return
-        t = pygame.time.get_ticks()
-
-        if (self.fase_atual == 'selecao'
-            and self.personagem_selecionado
-            and getattr(self.personagem_selecionado, "rolou_dados", False)):
-            self.fase_atual = 'movimento'
-            self.tempo_ultima_acao = t
-            self.msg.add(" Fase de MOVIMENTO", (255, 255, 255))
-
-        elif (self.fase_atual == 'movimento'
-              and self.personagem_selecionado
-              and self.personagem_selecionado in self.sistema_movimento.movimentos_disponiveis):
-            pts = self.sistema_movimento.movimentos_disponiveis[self.personagem_selecionado]
-            if pts <= 0:
-                self.fase_atual = 'acao'
-                self.mostrar_alcance = False
-                self.tempo_ultima_acao = t
-                self.msg.add("⚔️ Fase de AÇÃO", (255, 255, 255))
+        self._executar(("rolar",))
 
     def _finalizar_turno(self):
-        if self.personagem_selecionado:
-            self.sistema_movimento.resetar_movimento(self.personagem_selecionado)
-            self.personagem_selecionado.resetar_turno()
-        self.mostrar_alcance = False
-        self.ultimo_resultado_dado = 0
-        self.turno_atual += 1
-        self.fase_atual = 'selecao'
-        self.tempo_ultima_acao = pygame.time.get_ticks()
-
-        total = len(self.ordem_turnos)
-        for _ in range(total):
-            self.indice_turno = (self.indice_turno + 1) % total
-            prox = self.ordem_turnos[self.indice_turno]
-            if prox.esta_vivo():
-                self.personagem_selecionado = prox
-                break
-        else:
-            self.personagem_selecionado = None
-            
-        if self.personagem_selecionado:
-            self._mostrar_transicao_turno(self.personagem_selecionado)
+        self._executar(("encerrar_turno",))
             
     def _eh_borda(self, pos):
         x, y = pos
@@ -1044,4 +878,4 @@ class GameController:
             return None
         cx = x // TAMANHO_CELULA
         cy = y // TAMANHO_CELULA
-        return (cx, cy) if (cx, cy) in self.tabuleiro.celulas else None
+        return (cx, cy) if self.tabuleiro.dentro((cx, cy)) else None
@@ -0,0 +1,117 @@
+"""Sorteios do jogo: um serviço com fluxos nomeados e sementes independentes.
+
+Cada subsistema sorteia do seu fluxo ("mapa", "itens", "dados", "cartas",
+"batalha", "turnos", ...), e a semente de cada fluxo sai só da semente do
+serviço e do nome. Com a mesma semente a partida se repete, e sortear mais
+num fluxo (ex.: uma carta a mais) não muda o que os outros sorteiam.
+
+    aleatorio = ServicoAleatorio(seed=42)
+    aleatorio.fluxo("turnos").shuffle(ordem)     # random.Random
+    aleatorio.bloco("dados", 1, 6).proximo()     # inteiro de um bloco pré-sorteado
+    aleatorio.numpy("batalha").integers(...)     # np.random.Generator, para lotes
+
+Os blocos (bloco / inteiros) sorteiam milhares de números de uma vez com
+NumPy e os entregam um a um: é o caminho para rolagens em laços quentes.
+O fluxo `random.Random`, o gerador NumPy e os blocos de um mesmo nome são
+sequências separadas, cada uma reproduzível por si.
+
+ALEATORIO é o serviço padrão do processo, para quem não recebe um próprio
+(Tabuleiro sem semente, Dado sem serviço); `semear` o reinicia.
+"""
+import random
+import zlib
+from typing import Dict, Tuple
+
+import numpy as np
+
+FLUXOS = ("mapa", "itens", "dados", "cartas", "batalha", "turnos", "animacao")
+TAMANHO_BLOCO = 4096
+
+
+def _chave(nome: str) -> int:
+    return zlib.crc32(nome.encode("utf-8"))
+
+
+class BlocoSorteios:
+    """Inteiros em [minimo, maximo] sorteados em blocos de `tamanho` e entregues um a um."""
+
+    __slots__ = ("_gerador", "minimo", "maximo", "tamanho", "_valores", "_i")
+
+    def __init__(self, gerador: np.random.Generator, minimo: int, maximo: int, tamanho: int = TAMANHO_BLOCO):
+        self._gerador = gerador
+        self.minimo, self.maximo, self.tamanho = minimo, maximo, tamanho
+        self._valores = []
+        self._i = 0
+
+    def proximo(self) -> int:
+        if self._i >= len(self._valores):
+            self._valores = self._gerador.integers(self.minimo, self.maximo + 1, size=self.tamanho).tolist()
+            self._i = 0
+        v = self._valores[self._i]
+        self._i += 1
+        return v
+
+    def varios(self, n: int) -> np.ndarray:
+        """Próximos `n` valores de uma vez (array NumPy), na mesma sequência de proximo()."""
+        resto = self._valores[self._i:]
+        self._valores, self._i = [], 0
+        if len(resto) >= n:
+            self._valores, resto = resto[n:], resto[:n]
+            return np.array(resto, dtype=np.int64)
+        novos = self._gerador.integers(self.minimo, self.maximo + 1, size=n - len(resto))
+        return np.concatenate([np.array(resto, dtype=np.int64), novos])
+
+
+class ServicoAleatorio:
+    """Fluxos de sorteio nomeados, todos derivados de `seed`.
+
+    Sem semente, uma é tirada da entropia do sistema e guardada em `seed`
+    (para reproduzir a execução depois).
+    """
+
+    def __init__(self, seed: int = None):
+        self.seed = int(np.random.SeedSequence().entropy % (2 ** 63)) if seed is None else int(seed)
+        self._base = self.seed % (2 ** 64)   # SeedSequence só aceita não negativos
+        self._fluxos: Dict[str, random.Random] = {}
+        self._numpy: Dict[str, np.random.Generator] = {}
+        self._blocos: Dict[Tuple[str, int, int], BlocoSorteios] = {}
+
+    def fluxo(self, nome: str) -> random.Random:
+        """random.Random do fluxo `nome` (criado na primeira vez)."""
+        r = self._fluxos.get(nome)
+        if r is None:
+            r = self._fluxos[nome] = random.Random(self.seed * 0x1_0000_0000 + _chave(nome))
+        return r
+
+    def numpy(self, nome: str) -> np.random.Generator:
+        """Gerador NumPy do fluxo `nome`, para sorteios em lote."""
+        g = self._numpy.get(nome)
+        if g is None:
+            g = self._numpy[nome] = np.random.default_rng([self._base, _chave(nome)])
+        return g
+
+    def bloco(self, nome: str, minimo: int, maximo: int) -> BlocoSorteios:
+        """Bloco de inteiros [minimo, maximo] do fluxo `nome` (um por intervalo)."""
+        chave = (nome, minimo, maximo)
+        b = self._blocos.get(chave)
+        if b is None:
+            gerador = np.random.default_rng([self._base, _chave(nome), minimo % (2 ** 64), maximo % (2 ** 64)])
+            b = self._blocos[chave] = BlocoSorteios(gerador, minimo, maximo)
+        return b
+
+    def inteiros(self, nome: str, minimo: int, maximo: int, n: int) -> np.ndarray:
+        """`n` inteiros em [minimo, maximo] do bloco do fluxo, de uma vez."""
+        return self.bloco(nome, minimo, maximo).varios(n)
+
+    def semente(self, nome: str) -> int:
+        """Semente inteira derivada do fluxo (para quem só aceita int, como Tabuleiro)."""
+        return self.fluxo(nome).randrange(2 ** 32)
+
+
+ALEATORIO = ServicoAleatorio()
+
+
+def semear(seed: int = None) -> ServicoAleatorio:
+    """Reinicia o serviço padrão com `seed` (no mesmo objeto, que os módulos já importaram)."""
+    ALEATORIO.__init__(seed)
+    return ALEATORIO
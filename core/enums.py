@@ -17,3 +17,7 @@ class ClassePersonagem(Enum):
     MAGO = "mago"
     LADINO = "ladino"
     CLERIGO = "clerigo"
+
+# Código inteiro de cada terreno (índice nas matrizes do Tabuleiro)
+TERRENOS = tuple(TipoTerreno)
+CODIGO_TERRENO = {tipo: codigo for codigo, tipo in enumerate(TERRENOS)}
@@ -0,0 +1,55 @@
+"""Regras de terreno: uma tabela só, compilada em arrays indexados pelo código.
+
+Todo o jogo consulta o terreno por código inteiro (core.enums.TERRENOS), então
+custo, passagem, combate, dano e cores saem de um acesso a array, sem montar
+dicionários nem comparar nomes. Para mudar uma regra, mude só TABELA_TERRENO.
+"""
+from typing import NamedTuple, Tuple
+
+import numpy as np
+
+from core.constants import CORES
+from core.enums import TipoTerreno, TERRENOS
+
+
+class RegraTerreno(NamedTuple):
+    custo: int                    # pontos de movimento para entrar na célula
+    passavel: bool
+    mod_combate: float
+    dano: int                     # dano ao terminar um movimento na célula
+    cor: Tuple[int, int, int]
+    cor_borda: Tuple[int, int, int]
+
+
+TABELA_TERRENO = {
+    TipoTerreno.PLANICIE: RegraTerreno(1, True, 1.0, 0, CORES['verde'], CORES['verde_escuro']),
+    TipoTerreno.FLORESTA: RegraTerreno(2, True, 0.8, 0, CORES['verde_escuro'], CORES['preto']),
+    TipoTerreno.MONTANHA: RegraTerreno(3, True, 1.2, 0, CORES['marrom'], CORES['cinza']),
+    TipoTerreno.AGUA: RegraTerreno(5, False, 1.0, 0, CORES['azul'], CORES['azul_claro']),
+    TipoTerreno.MASMORRA: RegraTerreno(1, True, 1.0, 0, CORES['preto'], CORES['cinza']),
+    TipoTerreno.LAVA: RegraTerreno(2, True, 1.0, 5, (255, 80, 0), (180, 30, 0)),
+    TipoTerreno.GELO: RegraTerreno(1, True, 1.0, 5, (180, 240, 255), (130, 200, 255)),
+}
+
+
+class RegrasTerreno:
+    """Colunas da TABELA_TERRENO como arrays na ordem de TERRENOS."""
+
+    def __init__(self, tabela):
+        regras = [tabela[t] for t in TERRENOS]
+        self.custo = np.array([r.custo for r in regras], dtype=np.int32)
+        self.passavel = np.array([r.passavel for r in regras], dtype=bool)
+        # custo para as camadas float do tabuleiro: inf onde não dá para entrar
+        self.mod_movimento = np.where(self.passavel, self.custo, np.inf).astype(np.float32)
+        self.mod_combate = np.array([r.mod_combate for r in regras], dtype=np.float32)
+        self.dano = np.array([r.dano for r in regras], dtype=np.int32)
+        self.cor = np.array([r.cor for r in regras], dtype=np.uint8)
+        self.cor_borda = np.array([r.cor_borda for r in regras], dtype=np.uint8)
+        # cópias em tuplas para consultas escalares (indexar tupla é bem mais barato que ndarray)
+        self.custos = tuple(self.custo.tolist())
+        self.passaveis = tuple(self.passavel.tolist())
+        self.danos = tuple(self.dano.tolist())
+        self.cores = tuple((r.cor, r.cor_borda) for r in regras)
+
+
+REGRAS = RegrasTerreno(TABELA_TERRENO)
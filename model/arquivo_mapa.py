@@ -0,0 +1,83 @@
+"""Formato binário de mapas (.gpmap).
+
+Layout (little-endian):
+    cabeçalho  _CABECALHO (magic, versão, flags, largura, altura, seed,
+               mapa_id, nº de posições iniciais)
+    terreno    largura * altura bytes, códigos de core.enums.TERRENOS em [y, x]
+    itens      (opcional, flag CAMADA_ITENS) largura * altura bytes:
+               0 = vazio, 1 + índice em TIPOS_ITEM
+    posições   (opcional) n pares int32 (x, y)
+
+As camadas de grade são lidas com np.memmap, sem interpretar célula por
+célula: abrir um mapa custa só o cabeçalho, independente do tamanho.
+"""
+import struct
+from typing import List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from core.enums import TipoItem
+
+MAGIC = b"GPMP"
+VERSAO = 1
+CAMADA_ITENS = 1 << 0
+
+TIPOS_ITEM = tuple(TipoItem)
+CODIGO_ITEM = {tipo: codigo + 1 for codigo, tipo in enumerate(TIPOS_ITEM)}
+
+_CABECALHO = struct.Struct("<4sHHIIqII")
+
+
+class ArquivoMapa(NamedTuple):
+    largura: int
+    altura: int
+    mapa_id: int
+    seed: int
+    terreno: np.ndarray
+    itens: Optional[np.ndarray]
+    posicoes_iniciais: List[Tuple[int, int]]
+
+
+def salvar_mapa(caminho: str, terreno: np.ndarray, mapa_id: int = 0, seed: int = 0,
+                itens: np.ndarray = None, posicoes_iniciais=()):
+    altura, largura = terreno.shape
+    flags = CAMADA_ITENS if itens is not None else 0
+    posicoes = np.asarray(list(posicoes_iniciais), dtype="<i4").reshape(-1, 2)
+    with open(caminho, "wb") as f:
+        f.write(_CABECALHO.pack(MAGIC, VERSAO, flags, largura, altura,
+                                seed, mapa_id, len(posicoes)))
+        f.write(np.ascontiguousarray(terreno, dtype=np.uint8).tobytes())
+        if itens is not None:
+            f.write(np.ascontiguousarray(itens, dtype=np.uint8).tobytes())
+        f.write(posicoes.tobytes())
+
+
+def carregar_mapa(caminho: str) -> ArquivoMapa:
+    """Abre um .gpmap; as grades voltam como memmap copy-on-write."""
+    with open(caminho, "rb") as f:
+        cabecalho = f.read(_CABECALHO.size)
+    if len(cabecalho) < _CABECALHO.size:
+        raise ValueError(f"Arquivo de mapa truncado: {caminho}")
+    magic, versao, flags, largura, altura, seed, mapa_id, n_pos = _CABECALHO.unpack(cabecalho)
+    if magic != MAGIC:
+        raise ValueError(f"Não é um arquivo de mapa: {caminho}")
+    if versao > VERSAO:
+        raise ValueError(f"Versão de mapa não suportada ({versao}): {caminho}")
+
+    offset = _CABECALHO.size
+    tamanho = largura * altura
+    # modo "c": alterações no tabuleiro não voltam para o arquivo
+    terreno = np.memmap(caminho, dtype=np.uint8, mode="c", offset=offset, shape=(altura, largura))
+    offset += tamanho
+
+    itens = None
+    if flags & CAMADA_ITENS:
+        itens = np.memmap(caminho, dtype=np.uint8, mode="c", offset=offset, shape=(altura, largura))
+        offset += tamanho
+
+    posicoes = []
+    if n_pos:
+        pares = np.fromfile(caminho, dtype="<i4", count=2 * n_pos, offset=offset).reshape(-1, 2)
+        posicoes = [tuple(p) for p in pares.tolist()]
+
+    return ArquivoMapa(largura, altura, mapa_id, seed, terreno, itens, posicoes)
@@ -0,0 +1,137 @@
+"""Batalhas em lote: resolve N duelos de uma vez a partir de dados sorteados com NumPy.
+
+Mesma regra de SistemaMovimento.iniciar_batalha: RODADAS rodadas de d20
+contra d20, quem tira mais vence a rodada e o outro perde o dano do
+vencedor; empate na rodada não fere ninguém. Ganha a batalha quem vencer
+mais rodadas. Para comparar variantes da regra, o valor de cada lado pode
+ser d20 * modificador + bônus, comparado em inteiros (ver escalas_rodada);
+o jogo usa modificador 1 e bônus 0. A vida só vai até 0 (como Entidade.receber_dano) e
+a batalha não para quando alguém morre.
+
+Para N batalhas sorteia-se um só bloco (2, RODADAS, N) de dados; tudo o
+mais sai de uma contagem conjunta (vitórias do atacante, vitórias do defensor)
+com np.bincount, então um milhão de batalhas leva dezenas de ms:
+
+    r = simular_batalhas(Lutador(vida=130), Lutador(), 1_000_000, seed=1)
+    r.vitorias / r.total, r.delta_defensor
+"""
+from fractions import Fraction
+from typing import Dict, NamedTuple, Tuple
+
+import numpy as np
+
+from core.aleatorio import ALEATORIO
+
+RODADAS = 3
+FACES = 20
+DANO_RODADA = 10
+# batalhas por bloco de dados: limita a memória (8 * RODADAS bytes por batalha)
+BLOCO = 1 << 20
+
+
+class Lutador(NamedTuple):
+    """Atributos que pesam numa batalha: vida, bônus somado a cada d20, dano por
+    rodada vencida e modificador de combate (multiplica o d20)."""
+    vida: int = 100
+    bonus: int = 0
+    dano: int = DANO_RODADA
+    modificador: float = 1.0
+
+
+class ResultadoLote(NamedTuple):
+    """Contagens do ponto de vista do atacante.
+
+    `delta_*` mapeia a variação de vida (0 ou negativa) ao número de batalhas
+    em que ela ocorreu; `conjunta[a, d]` conta as batalhas com `a` rodadas
+    vencidas pelo atacante e `d` pelo defensor.
+    """
+    total: int
+    vitorias: int
+    derrotas: int
+    empates: int
+    mortes_atacante: int
+    mortes_defensor: int
+    delta_atacante: Dict[int, int]
+    delta_defensor: Dict[int, int]
+    conjunta: np.ndarray
+
+
+def lutador_de(personagem, bonus: int = 0, modificador: float = 1.0) -> Lutador:
+    """Lutador com a vida atual do personagem."""
+    return Lutador(personagem.vida_atual, bonus, DANO_RODADA, float(modificador))
+
+
+def fracao(modificador: float) -> Fraction:
+    """Modificador como fração (0.8 -> 4/5): os float32 das regras não comparam exato."""
+    return Fraction(float(modificador)).limit_denominator(1000)
+
+
+def escalas_rodada(atacante: Lutador, defensor: Lutador) -> Tuple[int, int, int, int]:
+    """(ka, ba, kd, bd) inteiros tais que o atacante vence a rodada se
+    d_atacante * ka + ba > d_defensor * kd + bd (os dois valores multiplicados
+    pelo mesmo denominador comum)."""
+    fa, fd = fracao(atacante.modificador), fracao(defensor.modificador)
+    comum = fa.denominator * fd.denominator
+    return (fa.numerator * fd.denominator, atacante.bonus * comum,
+            fd.numerator * fa.denominator, defensor.bonus * comum)
+
+
+def contar_rodadas(atacante: Lutador, defensor: Lutador, n: int, rodadas: int = RODADAS,
+                   rng: np.random.Generator = None) -> np.ndarray:
+    """Tabela (rodadas+1, rodadas+1): batalhas por (vitórias do atacante, vitórias do defensor)."""
+    rng = rng if rng is not None else ALEATORIO.numpy("batalha")
+    lado = rodadas + 1
+    conjunta = np.zeros(lado * lado, dtype=np.int64)
+    ka, ba, kd, bd = escalas_rodada(atacante, defensor)
+    feito = 0
+    while feito < n:
+        m = min(BLOCO, n - feito)
+        dados = rng.integers(1, FACES + 1, size=(2, rodadas, m), dtype=np.int32)
+        a, d = dados[0], dados[1]
+        if ka != 1 or kd != 1:
+            a *= ka; d *= kd
+        if ba != bd:
+            a += ba - bd
+        va = (a > d).sum(axis=0, dtype=np.int64)
+        vd = (d > a).sum(axis=0, dtype=np.int64)
+        conjunta += np.bincount(va * lado + vd, minlength=lado * lado)
+        feito += m
+    return conjunta.reshape(lado, lado)
+
+
+def _deltas(perdidas: np.ndarray, vida: int, dano: int) -> Dict[int, int]:
+    """{variação de vida: batalhas} a partir das contagens por rodadas perdidas."""
+    deltas: Dict[int, int] = {}
+    for k, qtd in enumerate(perdidas.tolist()):
+        if qtd:
+            d = -min(vida, dano * k)
+            deltas[d] = deltas.get(d, 0) + qtd
+    return deltas
+
+
+def resumir(atacante: Lutador, defensor: Lutador, conjunta: np.ndarray) -> ResultadoLote:
+    """Vitórias, mortes e distribuições de vida a partir da tabela conjunta."""
+    lado = conjunta.shape[0]
+    va, vd = np.indices((lado, lado))
+    perdidas_atacante = conjunta.sum(axis=0)   # indexado pelas vitórias do defensor
+    perdidas_defensor = conjunta.sum(axis=1)
+    rodadas = np.arange(lado)
+    return ResultadoLote(
+        total=int(conjunta.sum()),
+        vitorias=int(conjunta[va > vd].sum()),
+        derrotas=int(conjunta[va < vd].sum()),
+        empates=int(conjunta[va == vd].sum()),
+        mortes_atacante=int(perdidas_atacante[defensor.dano * rodadas >= atacante.vida].sum()),
+        mortes_defensor=int(perdidas_defensor[atacante.dano * rodadas >= defensor.vida].sum()),
+        delta_atacante=_deltas(perdidas_atacante, atacante.vida, defensor.dano),
+        delta_defensor=_deltas(perdidas_defensor, defensor.vida, atacante.dano),
+        conjunta=conjunta,
+    )
+
+
+def simular_batalhas(atacante: Lutador, defensor: Lutador, n: int, rodadas: int = RODADAS,
+                     seed=None, rng: np.random.Generator = None) -> ResultadoLote:
+    """Simula `n` batalhas independentes entre os dois lutadores."""
+    if rng is None:
+        rng = np.random.default_rng(seed) if seed is not None else ALEATORIO.numpy("batalha")
+    return resumir(atacante, defensor, contar_rodadas(atacante, defensor, n, rodadas, rng))
@@ -1,333 +1,453 @@
+from collections.abc import Mapping
 from typing import Tuple, Dict
-import random
-from core.enums import TipoTerreno
-from core.constants import CORES, TAMANHO_CELULA
-from view.assets import mapa_unico
+
+import numpy as np
+
+from core.aleatorio import ALEATORIO
+from core.enums import TipoTerreno, TERRENOS, CODIGO_TERRENO
+from core.constants import TAMANHO_CELULA
+from core.regras_terreno import REGRAS
+from model.arquivo_mapa import salvar_mapa, carregar_mapa, CODIGO_ITEM
+from model.grafo import CUSTO_MINIMO, GrafoTabuleiro
+from model.mapas import MAPAS, MAPA_PADRAO, gerar_terreno
+
+
+_VAZIO = ()
+
+# lado (em células) das regiões com revisão própria
+TAMANHO_REGIAO = 8
 
 
 class Celula:
-    def __init__(self, posicao: Tuple[int, int], tipo_terreno: TipoTerreno = TipoTerreno.PLANICIE):
+    """Visão leve de uma posição do Tabuleiro.
+
+    O terreno e os modificadores vivem nas matrizes do tabuleiro; ocupantes e
+    itens ficam nos dicionários esparsos dele. Criar uma Celula não copia nada,
+    então ela pode ser descartada e recriada a qualquer momento.
+    """
+
+    __slots__ = ("tabuleiro", "posicao")
+
+    def __init__(self, tabuleiro: "Tabuleiro", posicao: Tuple[int, int]):
+        self.tabuleiro = tabuleiro
         self.posicao = posicao
-        self.tipo_terreno = tipo_terreno
-        self.ocupantes = []
-        self.itens = []
-        self.visitado = False
-        self.sprite_celula = None
 
-        self.modificador_movimento = self._get_modificador_movimento()
-        self.modificador_combate = self._get_modificador_combate()
-        self._carregar_sprite_celula()
+    @property
+    def tipo_terreno(self) -> TipoTerreno:
+        return self.tabuleiro.get_tipo_terreno(self.posicao)
 
-    def _carregar_sprite_celula(self):
-        x, y = self.posicao
-        if mapa_unico.ativo:
-            self.sprite_celula = mapa_unico.obter_celula_mapa(x, y, TAMANHO_CELULA)
-        else:
-            self.sprite_celula = mapa_unico.obter_sprite_terreno(self.tipo_terreno, TAMANHO_CELULA)
-
-    def _get_modificador_movimento(self) -> float:
-        if self.tipo_terreno == TipoTerreno.PLANICIE:
-            return 1.0
-        if self.tipo_terreno == TipoTerreno.FLORESTA:
-            return 1.5
-        if self.tipo_terreno == TipoTerreno.MONTANHA:
-            return 2.0
-        if self.tipo_terreno == TipoTerreno.AGUA:
-            return float('inf')
-        if self.tipo_terreno == TipoTerreno.MASMORRA:
-            return 1.0
-        return 1.0
-
-    def _get_modificador_combate(self) -> float:
-        if self.tipo_terreno == TipoTerreno.FLORESTA:
-            return 0.8
-        if self.tipo_terreno == TipoTerreno.MONTANHA:
-            return 1.2
-        return 1.0
+    @tipo_terreno.setter
+    def tipo_terreno(self, tipo: TipoTerreno):
+        self.tabuleiro.set_terreno(self.posicao, tipo)
+
+    @property
+    def codigo_terreno(self) -> int:
+        return self.tabuleiro.get_codigo_terreno(self.posicao)
+
+    @property
+    def modificador_movimento(self) -> float:
+        chunk, lx, ly = self.tabuleiro._chunk_de(self.posicao)
+        return float(chunk.modificador_movimento[ly, lx])
+
+    @property
+    def modificador_combate(self) -> float:
+        chunk, lx, ly = self.tabuleiro._chunk_de(self.posicao)
+        return float(chunk.modificador_combate[ly, lx])
+
+    @property
+    def ocupantes(self):
+        return self.tabuleiro._ocupantes.get(self.posicao, _VAZIO)
+
+    @property
+    def itens(self):
+        return self.tabuleiro._itens.get(self.posicao, _VAZIO)
 
     def adicionar_ocupante(self, entidade):
-        self.ocupantes.append(entidade)
+        self.tabuleiro.adicionar_ocupante(self.posicao, entidade)
 
     def remover_ocupante(self, entidade):
-        if entidade in self.ocupantes:
-            self.ocupantes.remove(entidade)
+        self.tabuleiro.remover_ocupante(self.posicao, entidade)
 
     def adicionar_item(self, item):
-        self.itens.append(item)
+        self.tabuleiro.adicionar_item(self.posicao, item)
 
     def remover_item(self, item):
-        if item in self.itens:
-            self.itens.remove(item)
+        self.tabuleiro.remover_item(self.posicao, item)
 
     def esta_ocupado(self) -> bool:
-        return len(self.ocupantes) > 0
+        chunk, lx, ly = self.tabuleiro._chunk_de(self.posicao)
+        return bool(chunk.ocupacao[ly, lx])
 
     def get_cores_terreno(self):
-        cores = {
-            TipoTerreno.PLANICIE: (CORES['verde'], CORES['verde_escuro']),
-            TipoTerreno.FLORESTA: (CORES['verde_escuro'], CORES['preto']),
-            TipoTerreno.MONTANHA: (CORES['marrom'], CORES['cinza']),
-            TipoTerreno.AGUA: (CORES['azul'], CORES['azul_claro']),
-            TipoTerreno.MASMORRA: (CORES['preto'], CORES['cinza']),
-            TipoTerreno.LAVA: ((255, 80, 0), (180, 30, 0)),
-            TipoTerreno.GELO: ((180, 240, 255), (130, 200, 255))     
-            
-        }
-        return cores.get(self.tipo_terreno, (CORES['cinza'], CORES['preto']))
+        return REGRAS.cores[self.codigo_terreno]
 
     def obter_sprite_celula(self):
-        return self.sprite_celula
+        from view.assets import mapa_unico  # só quem desenha carrega pygame
+        x, y = self.posicao
+        if mapa_unico.ativo:
+            return mapa_unico.obter_celula_mapa(x, y, TAMANHO_CELULA)
+        return mapa_unico.obter_sprite_terreno(self.tipo_terreno, TAMANHO_CELULA)
+
+
+class _VisaoCelulas(Mapping):
+    """Compatibilidade com o antigo dict posição -> Celula (criado sob demanda)."""
+
+    def __init__(self, tabuleiro: "Tabuleiro"):
+        self._tabuleiro = tabuleiro
+
+    def __getitem__(self, posicao):
+        if not self._tabuleiro.dentro(posicao):
+            raise KeyError(posicao)
+        return Celula(self._tabuleiro, posicao)
+
+    def __contains__(self, posicao):
+        return self._tabuleiro.dentro(posicao)
+
+    def __iter__(self):
+        for x in range(self._tabuleiro.largura):
+            for y in range(self._tabuleiro.altura):
+                yield (x, y)
+
+    def __len__(self):
+        return self._tabuleiro.largura * self._tabuleiro.altura
+
+
+class _Chunk:
+    """Bloco retangular de camadas [y, x] do tabuleiro."""
+
+    __slots__ = ("terreno", "modificador_movimento", "modificador_combate",
+                 "passavel", "ocupacao", "qtd_itens")
+
+    def __init__(self, terreno: np.ndarray):
+        self.terreno = terreno
+        self.modificador_movimento = REGRAS.mod_movimento[terreno]
+        self.modificador_combate = REGRAS.mod_combate[terreno]
+        self.passavel = REGRAS.passavel[terreno]
+        self.ocupacao = np.zeros(terreno.shape, dtype=np.uint8)
+        self.qtd_itens = np.zeros(terreno.shape, dtype=np.uint8)
+
+    def nbytes(self) -> int:
+        return sum(getattr(self, nome).nbytes for nome in self.__slots__)
 
 
 class Tabuleiro:
-    def __init__(self, largura: int, altura: int, mapa_id: int = None):
+    """Tabuleiro de terreno em matrizes NumPy.
+
+    Com `chunk=None` (padrão) o tabuleiro inteiro é um único bloco gerado na
+    construção. Com `chunk=N` ele é dividido em blocos N x N que só são
+    gerados e alocados no primeiro acesso, então mundos enormes custam
+    memória proporcional à área realmente visitada.
+
+    `terreno` permite partir de uma grade pronta (ex.: o memmap de um arquivo
+    .gpmap, ver Tabuleiro.carregar) em vez de rodar o gerador do mapa.
+
+    `modo_caminho` escolhe a busca de caminhos ("a_estrela" ou "saltos");
+    sem ele vale o padrão registrado para o mapa. Em chunks o SistemaMovimento
+    usa sempre o A*: a grade de saltos exigiria gerar o tabuleiro inteiro.
+    """
+
+    def __init__(self, largura: int, altura: int, mapa_id: int = None, seed: int = None,
+                 chunk: int = None, terreno: np.ndarray = None, modo_caminho: str = None):
         self.largura = largura
         self.altura = altura
-        self.celulas: Dict[Tuple[int, int], Celula] = {}
-
-        self.mapa_id = mapa_id or random.randint(1, 13)
-        self._criar_tabuleiro()
-
-    def _criar_tabuleiro(self):
-        mapa_predefinido = self._obter_mapa_por_id(self.mapa_id)
-        for x in range(self.largura):
-            for y in range(self.altura):
-                tipo = mapa_predefinido.get((x, y), TipoTerreno.PLANICIE)
-                self.celulas[(x, y)] = Celula((x, y), tipo)
-
-    # === SELETOR DE MAPAS ===
-    def _obter_mapa_por_id(self, mapa_id: int) -> Dict[Tuple[int, int], TipoTerreno]:
-        mapas = {
-            1: self._mapa_ilhas(),
-            2: self._mapa_montanhoso(),
-            3: self._mapa_forestado(),
-            4: self._mapa_misto(),
-            5: self._mapa_caos_total(),
-            6: self._mapa_deserto(),
-            7: self._mapa_caverna(),
-            8: self._mapa_ruinas(),
-            9: self._mapa_vulcao(),
-            10: self._mapa_pantano(),
-            11: self._mapa_gelado(),
-            12: self._mapa_planicie_real(),
-            13: self._mapa_cidade_antiga(),
-            14: self._mapa_lava(),
-            15: self._mapa_nevado()
-        }
-        return mapas.get(mapa_id, self._mapa_misto())
-
-    # === MAPAS PADRÕES ===
-    def _mapa_ilhas(self):
-        mapa = {}
-        for x in range(self.largura):
-            for y in range(self.altura):
-                if x in [0, self.largura - 1] or y in [0, self.altura - 1]:
-                    mapa[(x, y)] = TipoTerreno.AGUA
-                elif (x + y) % 5 == 0:
-                    mapa[(x, y)] = TipoTerreno.MONTANHA
-                elif (x * y) % 7 == 0:
-                    mapa[(x, y)] = TipoTerreno.FLORESTA
-                else:
-                    mapa[(x, y)] = TipoTerreno.PLANICIE
-        return mapa
-
-    def _mapa_montanhoso(self):
-        mapa = {}
-        for x in range(self.largura):
-            for y in range(self.altura):
-                if y % 4 == 0:
-                    mapa[(x, y)] = TipoTerreno.MONTANHA
-                elif x % 6 == 0:
-                    mapa[(x, y)] = TipoTerreno.FLORESTA
-                elif x < 2 or y < 2 or x > self.largura - 3 or y > self.altura - 3:
-                    mapa[(x, y)] = TipoTerreno.AGUA
-                else:
-                    mapa[(x, y)] = TipoTerreno.PLANICIE
-        return mapa
-
-    def _mapa_forestado(self):
-        mapa = {}
-        for x in range(self.largura):
-            for y in range(self.altura):
-                if (x % 3 == 0 and y % 2 == 0) or (x + y) % 4 == 0:
-                    mapa[(x, y)] = TipoTerreno.FLORESTA
-                elif (x + y) % 10 == 0:
-                    mapa[(x, y)] = TipoTerreno.MONTANHA
-                else:
-                    mapa[(x, y)] = TipoTerreno.PLANICIE
-        return mapa
-
-    def _mapa_misto(self):
-        mapa = {}
-        for x in range(self.largura):
-            for y in range(self.altura):
-                r = random.random()
-                if x == 0 or y == 0 or x == self.largura - 1 or y == self.altura - 1:
-                    mapa[(x, y)] = TipoTerreno.AGUA
-                elif r < 0.10:
-                    mapa[(x, y)] = TipoTerreno.AGUA
-                elif r < 0.25:
-                    mapa[(x, y)] = TipoTerreno.MONTANHA
-                elif r < 0.45:
-                    mapa[(x, y)] = TipoTerreno.FLORESTA
-                else:
-                    mapa[(x, y)] = TipoTerreno.PLANICIE
-        return mapa
-
-    # === MAPAS EXTRAS (5–13) ===
-    def _mapa_caos_total(self):
-        mapa = {}
-        for x in range(self.largura):
-            for y in range(self.altura):
-                tipo = random.choice(list(TipoTerreno))
-                mapa[(x, y)] = tipo
-        return mapa
-
-    def _mapa_deserto(self):
-        mapa = {}
-        for x in range(self.largura):
-            for y in range(self.altura):
-                r = random.random()
-                if x == 0 or y == 0 or x == self.largura - 1 or y == self.altura - 1:
-                    mapa[(x, y)] = TipoTerreno.MONTANHA
-                elif r < 0.05:
-                    mapa[(x, y)] = TipoTerreno.AGUA
-                elif r < 0.15:
-                    mapa[(x, y)] = TipoTerreno.FLORESTA
-                else:
-                    mapa[(x, y)] = TipoTerreno.PLANICIE
-        return mapa
-
-    def _mapa_caverna(self):
-        mapa = {}
-        for x in range(self.largura):
-            for y in range(self.altura):
-                if x % 7 == 0 or y % 5 == 0:
-                    mapa[(x, y)] = TipoTerreno.MONTANHA
-                elif random.random() < 0.1:
-                    mapa[(x, y)] = TipoTerreno.AGUA
-                else:
-                    mapa[(x, y)] = TipoTerreno.MASMORRA
-        return mapa
-
-    def _mapa_ruinas(self):
-        mapa = {}
-        for x in range(self.largura):
-            for y in range(self.altura):
-                if (x + y) % 6 == 0:
-                    mapa[(x, y)] = TipoTerreno.MONTANHA
-                elif random.random() < 0.1:
-                    mapa[(x, y)] = TipoTerreno.FLORESTA
-                else:
-                    mapa[(x, y)] = TipoTerreno.PLANICIE
-        return mapa
-
-    def _mapa_vulcao(self):
-        mapa = {}
-        centro_x = self.largura // 2
-        centro_y = self.altura // 2
-        for x in range(self.largura):
-            for y in range(self.altura):
-                dist = abs(x - centro_x) + abs(y - centro_y)
-                if dist < 3:
-                    mapa[(x, y)] = TipoTerreno.MONTANHA
-                elif 3 <= dist < 6:
-                    mapa[(x, y)] = TipoTerreno.AGUA
-                elif random.random() < 0.1:
-                    mapa[(x, y)] = TipoTerreno.FLORESTA
-                else:
-                    mapa[(x, y)] = TipoTerreno.PLANICIE
-        return mapa
-
-    def _mapa_pantano(self):
-        mapa = {}
-        for x in range(self.largura):
-            for y in range(self.altura):
-                r = random.random()
-                if r < 0.15:
-                    mapa[(x, y)] = TipoTerreno.AGUA
-                elif r < 0.35:
-                    mapa[(x, y)] = TipoTerreno.FLORESTA
-                else:
-                    mapa[(x, y)] = TipoTerreno.PLANICIE
-        return mapa
-
-    def _mapa_gelado(self):
-        mapa = {}
-        for x in range(self.largura):
-            for y in range(self.altura):
-                if x % 5 == 0 or y % 7 == 0:
-                    mapa[(x, y)] = TipoTerreno.MONTANHA
-                elif random.random() < 0.1:
-                    mapa[(x, y)] = TipoTerreno.AGUA
-                else:
-                    mapa[(x, y)] = TipoTerreno.PLANICIE
-        return mapa
-
-    def _mapa_planicie_real(self):
-        mapa = {}
-        for x in range(self.largura):
-            for y in range(self.altura):
-                if random.random() < 0.05:
-                    mapa[(x, y)] = TipoTerreno.MONTANHA
-                elif random.random() < 0.15:
-                    mapa[(x, y)] = TipoTerreno.FLORESTA
-                else:
-                    mapa[(x, y)] = TipoTerreno.PLANICIE
-        return mapa
-
-    def _mapa_cidade_antiga(self):
-        mapa = {}
-        for x in range(self.largura):
-            for y in range(self.altura):
-                if (x % 6 == 0 or y % 6 == 0):
-                    mapa[(x, y)] = TipoTerreno.AGUA
-                elif (x + y) % 9 == 0:
-                    mapa[(x, y)] = TipoTerreno.MONTANHA
-                elif random.random() < 0.1:
-                    mapa[(x, y)] = TipoTerreno.FLORESTA
-                else:
-                    mapa[(x, y)] = TipoTerreno.PLANICIE
-        return mapa
-    
-    def _mapa_lava(self):
-        mapa = {}
-        for x in range(self.largura):
-            for y in range(self.altura):
-                if x == 0 or y == 0 or x == self.largura - 1 or y == self.altura - 1:
-                    mapa[(x, y)] = TipoTerreno.MONTANHA
-                elif random.random() < 0.15:
-                    mapa[(x, y)] = TipoTerreno.LAVA
-                elif random.random() < 0.25:
-                    mapa[(x, y)] = TipoTerreno.MASMORRA
-                elif random.random() < 0.3:
-                    mapa[(x, y)] = TipoTerreno.FLORESTA
-                else:
-                    mapa[(x, y)] = TipoTerreno.PLANICIE
-        return mapa
-
-
-    def _mapa_nevado(self):
-        mapa = {}
-        for x in range(self.largura):
-            for y in range(self.altura):
-                if x == 0 or y == 0 or x == self.largura - 1 or y == self.altura - 1:
-                    mapa[(x, y)] = TipoTerreno.MONTANHA
-                elif random.random() < 0.20:
-                    mapa[(x, y)] = TipoTerreno.GELO
-                elif random.random() < 0.30:
-                    mapa[(x, y)] = TipoTerreno.AGUA
-                elif random.random() < 0.35:
-                    mapa[(x, y)] = TipoTerreno.FLORESTA
-                else:
-                    mapa[(x, y)] = TipoTerreno.PLANICIE
-        return mapa
+        self.chunk_largura = chunk or largura
+        self.chunk_altura = chunk or altura
+        self._chunks: Dict[Tuple[int, int], _Chunk] = {}
+        self.total_itens = 0
+        # Estado esparso: só posições com algo guardado aparecem aqui
+        self._ocupantes: Dict[Tuple[int, int], list] = {}
+        self._itens: Dict[Tuple[int, int], list] = {}
+        self.celulas = _VisaoCelulas(self)
+        self._terreno_base = terreno
+        self.camada_itens = None
+        self.posicoes_iniciais = []
+        self._grafo = None
+        # sobe a cada mudança de terreno ou ocupação; cada região guarda a última que a tocou
+        self.revisao = 0
+        self._revisoes_regiao: Dict[Tuple[int, int], int] = {}
+
+        # sem mapa ou semente, sorteia do fluxo "mapa" do serviço padrão
+        self.mapa_id = mapa_id or ALEATORIO.fluxo("mapa").randint(1, 13)
+        self.seed = ALEATORIO.semente("mapa") if seed is None else seed
+        self.modo_caminho = modo_caminho or (MAPAS.get(self.mapa_id) or MAPAS[MAPA_PADRAO]).modo_caminho
+        if not self.em_chunks:
+            self._obter_chunk(0, 0)
+
+    @property
+    def em_chunks(self) -> bool:
+        return self.chunk_largura < self.largura or self.chunk_altura < self.altura
+
+    # === CHUNKS ===
+    def _gerar_chunk(self, x0: int, y0: int, w: int, h: int) -> np.ndarray:
+        if self._terreno_base is not None:
+            if not self.em_chunks:
+                return self._terreno_base
+            return np.array(self._terreno_base[y0:y0 + h, x0:x0 + w])
+        if not self.em_chunks:
+            return gerar_terreno(self.mapa_id, self.largura, self.altura, self.seed)
+        # cada chunk tem sua própria semente, derivada da do mapa
+        seed = (self.seed, x0 // self.chunk_largura, y0 // self.chunk_altura)
+        return gerar_terreno(self.mapa_id, self.largura, self.altura, seed, x0, y0, w, h)
+
+    def _obter_chunk(self, cx: int, cy: int) -> _Chunk:
+        chunk = self._chunks.get((cx, cy))
+        if chunk is None:
+            x0, y0 = cx * self.chunk_largura, cy * self.chunk_altura
+            w = min(self.chunk_largura, self.largura - x0)
+            h = min(self.chunk_altura, self.altura - y0)
+            chunk = self._chunks[(cx, cy)] = _Chunk(self._gerar_chunk(x0, y0, w, h))
+            if self._grafo is not None:
+                self._grafo.preencher(x0, y0, chunk.terreno)
+        return chunk
+
+    def _chunk_de(self, posicao):
+        """(chunk, x_local, y_local) da posição, gerando o chunk se preciso.
+
+        Fora do tabuleiro levanta IndexError: não há chunk a gerar ali.
+        """
+        x, y = posicao
+        if not (0 <= x < self.largura and 0 <= y < self.altura):
+            raise IndexError(f"posição {posicao} fora do tabuleiro {self.largura}x{self.altura}")
+        cx, lx = divmod(x, self.chunk_largura)
+        cy, ly = divmod(y, self.chunk_altura)
+        return self._obter_chunk(cx, cy), lx, ly
+
+    def _camada(self, nome: str) -> np.ndarray:
+        # tabuleiro de um bloco só: a própria matriz (escrita reflete no tabuleiro)
+        if not self.em_chunks:
+            return getattr(self._obter_chunk(0, 0), nome)
+        # em chunks: cópia montada do mundo inteiro (gera todos os chunks!)
+        cw, ch = self.chunk_largura, self.chunk_altura
+        base = getattr(self._obter_chunk(0, 0), nome)
+        saida = np.empty((self.altura, self.largura), dtype=base.dtype)
+        for cy in range(-(-self.altura // ch)):
+            for cx in range(-(-self.largura // cw)):
+                bloco = getattr(self._obter_chunk(cx, cy), nome)
+                saida[cy * ch:cy * ch + bloco.shape[0], cx * cw:cx * cw + bloco.shape[1]] = bloco
+        return saida
+
+    @property
+    def chunks_alocados(self) -> int:
+        return len(self._chunks)
+
+    def memoria_bytes(self) -> int:
+        """Bytes ocupados pelas camadas dos chunks já alocados."""
+        return sum(chunk.nbytes() for chunk in self._chunks.values())
+
+    # === ARQUIVO ===
+    def salvar(self, caminho: str, posicoes_iniciais=None, incluir_itens: bool = True):
+        """Grava o tabuleiro no formato binário .gpmap (model/arquivo_mapa.py)."""
+        itens = None
+        if incluir_itens and self._itens:
+            itens = np.zeros((self.altura, self.largura), dtype=np.uint8)
+            for (x, y), lista in self._itens.items():
+                itens[y, x] = CODIGO_ITEM.get(lista[0].tipo, 0)
+        if posicoes_iniciais is None:
+            posicoes_iniciais = self.posicoes_iniciais
+        salvar_mapa(caminho, self.terreno, self.mapa_id, self.seed, itens, posicoes_iniciais)
+
+    @classmethod
+    def carregar(cls, caminho: str, chunk: int = None, modo_caminho: str = None) -> "Tabuleiro":
+        """Abre um .gpmap mapeando o arquivo em memória.
+
+        Os itens e as posições iniciais gravados ficam em `camada_itens`
+        (códigos de arquivo_mapa.TIPOS_ITEM) e `posicoes_iniciais`; quem monta
+        a partida decide como instanciá-los. Em mapas grandes prefira
+        `chunk=N`: só os chunks acessados são lidos e alocados.
+        """
+        arquivo = carregar_mapa(caminho)
+        tabuleiro = cls(arquivo.largura, arquivo.altura, mapa_id=arquivo.mapa_id,
+                        seed=arquivo.seed, chunk=chunk, terreno=arquivo.terreno,
+                        modo_caminho=modo_caminho)
+        tabuleiro.camada_itens = arquivo.itens
+        tabuleiro.posicoes_iniciais = arquivo.posicoes_iniciais
+        return tabuleiro
+
+    # Matrizes [y, x] do tabuleiro inteiro (ver _camada)
+    terreno = property(lambda self: self._camada("terreno"))
+    modificador_movimento = property(lambda self: self._camada("modificador_movimento"))
+    modificador_combate = property(lambda self: self._camada("modificador_combate"))
+    passavel = property(lambda self: self._camada("passavel"))
+    ocupacao = property(lambda self: self._camada("ocupacao"))
+    qtd_itens = property(lambda self: self._camada("qtd_itens"))
 
     # === FUNÇÕES PADRÃO ===
+    def dentro(self, posicao) -> bool:
+        x, y = posicao
+        return 0 <= x < self.largura and 0 <= y < self.altura
+
     def get_celula(self, posicao):
-        return self.celulas.get(posicao)
+        if posicao is None or not self.dentro(posicao):
+            return None
+        return Celula(self, posicao)
+
+    def get_tipo_terreno(self, posicao) -> TipoTerreno:
+        chunk, lx, ly = self._chunk_de(posicao)
+        return TERRENOS[chunk.terreno[ly, lx]]
+
+    def get_codigo_terreno(self, posicao) -> int:
+        """Código do terreno (índice em core.regras_terreno.REGRAS)."""
+        chunk, lx, ly = self._chunk_de(posicao)
+        return int(chunk.terreno[ly, lx])
+
+    def set_terreno(self, posicao, tipo: TipoTerreno):
+        chunk, lx, ly = self._chunk_de(posicao)
+        codigo = CODIGO_TERRENO[tipo]
+        chunk.terreno[ly, lx] = codigo
+        chunk.modificador_movimento[ly, lx] = REGRAS.mod_movimento[codigo]
+        chunk.modificador_combate[ly, lx] = REGRAS.mod_combate[codigo]
+        chunk.passavel[ly, lx] = REGRAS.passavel[codigo]
+        if self._grafo is not None:
+            self._grafo.atualizar(posicao, codigo)
+        self._alterou(posicao)
+
+    # === REVISÕES ===
+    def _alterou(self, posicao):
+        self.revisao += 1
+        x, y = posicao
+        self._revisoes_regiao[(x // TAMANHO_REGIAO, y // TAMANHO_REGIAO)] = self.revisao
+
+    def revisao_area(self, x0: int, y0: int, x1: int, y1: int) -> int:
+        """Última revisão que tocou o retângulo [x0, x1] x [y0, y1] (0 se nenhuma)."""
+        rx0, ry0 = max(x0, 0) // TAMANHO_REGIAO, max(y0, 0) // TAMANHO_REGIAO
+        rx1, ry1 = x1 // TAMANHO_REGIAO, y1 // TAMANHO_REGIAO
+        regioes = self._revisoes_regiao
+        if (rx1 - rx0 + 1) * (ry1 - ry0 + 1) > len(regioes):
+            return max((r for (rx, ry), r in regioes.items()
+                        if rx0 <= rx <= rx1 and ry0 <= ry <= ry1), default=0)
+        return max((regioes.get((rx, ry), 0) for rx in range(rx0, rx1 + 1)
+                    for ry in range(ry0, ry1 + 1)), default=0)
+
+    def mascara_terreno(self, *tipos: TipoTerreno) -> np.ndarray:
+        """Matriz booleana [y, x] das posições cujo terreno está em `tipos`."""
+        return np.isin(self.terreno, [CODIGO_TERRENO[t] for t in tipos])
+
+    def mascara_livre(self, sem_itens: bool = False, sem_borda: bool = False) -> np.ndarray:
+        """Posições [y, x] fora d'água e sem ocupantes (opcionalmente sem itens/borda)."""
+        livre = self.passavel & (self.ocupacao == 0)
+        if sem_itens:
+            livre &= self.qtd_itens == 0
+        if sem_borda:
+            livre[0, :] = livre[-1, :] = False
+            livre[:, 0] = livre[:, -1] = False
+        return livre
+
+    def esta_livre(self, posicao, sem_itens: bool = False, sem_borda: bool = False) -> bool:
+        x, y = posicao
+        if not (0 <= x < self.largura and 0 <= y < self.altura):
+            return False
+        if sem_borda and (x == 0 or y == 0 or x == self.largura - 1 or y == self.altura - 1):
+            return False
+        chunk, lx, ly = self._chunk_de(posicao)
+        if sem_itens and chunk.qtd_itens[ly, lx]:
+            return False
+        return bool(chunk.passavel[ly, lx]) and not chunk.ocupacao[ly, lx]
+
+    def sortear_posicao_livre(self, rng=None, sem_itens: bool = False,
+                              sem_borda: bool = False, tentativas: int = 32):
+        """Sorteia uma posição livre sem varrer o tabuleiro.
+
+        Tenta posições aleatórias contra o índice (O(1) cada); só se todas
+        falharem (tabuleiro quase cheio) cai para a máscara completa.
+        Devolve None se não houver nenhuma posição livre. Sem `rng`, usa o
+        fluxo "itens" do serviço padrão.
+        """
+        rng = rng or ALEATORIO.fluxo("itens")
+        for _ in range(tentativas):
+            pos = (rng.randrange(self.largura), rng.randrange(self.altura))
+            if self.esta_livre(pos, sem_itens, sem_borda):
+                return pos
+        candidatas = self.posicoes(self.mascara_livre(sem_itens, sem_borda))
+        return rng.choice(candidatas) if candidatas else None
+
+    @staticmethod
+    def posicoes(mascara: np.ndarray):
+        """Converte uma máscara [y, x] em lista de posições (x, y)."""
+        ys, xs = np.nonzero(mascara)
+        return list(zip(xs.tolist(), ys.tolist()))
+
+    def adicionar_ocupante(self, posicao, entidade):
+        chunk, lx, ly = self._chunk_de(posicao)
+        self._ocupantes.setdefault(posicao, []).append(entidade)
+        chunk.ocupacao[ly, lx] += 1
+        self._alterou(posicao)
+
+    def remover_ocupante(self, posicao, entidade):
+        lista = self._ocupantes.get(posicao)
+        if lista and entidade in lista:
+            chunk, lx, ly = self._chunk_de(posicao)
+            lista.remove(entidade)
+            chunk.ocupacao[ly, lx] -= 1
+            self._alterou(posicao)
+            if not lista:
+                del self._ocupantes[posicao]
+
+    def adicionar_item(self, posicao, item):
+        chunk, lx, ly = self._chunk_de(posicao)
+        self._itens.setdefault(posicao, []).append(item)
+        chunk.qtd_itens[ly, lx] += 1
+        self.total_itens += 1
+
+    def remover_item(self, posicao, item):
+        lista = self._itens.get(posicao)
+        if lista and item in lista:
+            chunk, lx, ly = self._chunk_de(posicao)
+            lista.remove(item)
+            chunk.qtd_itens[ly, lx] -= 1
+            self.total_itens -= 1
+            if not lista:
+                del self._itens[posicao]
+
+    def posicoes_ocupadas(self):
+        return self._ocupantes.keys()
+
+    def posicoes_com_itens(self):
+        return self._itens.keys()
+
+    def ocupantes_por_posicao(self):
+        """Pares (posição, ocupantes) só das posições ocupadas."""
+        return self._ocupantes.items()
+
+    def itens_por_posicao(self):
+        """Pares (posição, itens) só das posições com itens."""
+        return self._itens.items()
+
+    @property
+    def grafo(self) -> GrafoTabuleiro:
+        """Tabela de adjacência com custos dos chunks já gerados, criada no primeiro uso.
+
+        É o mesmo objeto pela vida do tabuleiro: chunks gerados depois entram
+        nela e set_terreno a corrige no lugar. Não gera chunk nenhum; buscas
+        que podem sair do que já foi gerado pedem grafo_area ou grafo_raio.
+        """
+        if self._grafo is None:
+            self._grafo = GrafoTabuleiro(self.largura, self.altura)
+            for (cx, cy), chunk in self._chunks.items():
+                self._grafo.preencher(cx * self.chunk_largura, cy * self.chunk_altura, chunk.terreno)
+        return self._grafo
+
+    def grafo_area(self, x0: int, y0: int, x1: int, y1: int) -> GrafoTabuleiro:
+        """O grafo, com os chunks que cobrem [x0, x1] x [y0, y1] (recortado ao tabuleiro) gerados."""
+        grafo = self.grafo
+        if self.em_chunks:
+            cw, ch = self.chunk_largura, self.chunk_altura
+            for cy in range(max(y0, 0) // ch, min(y1, self.altura - 1) // ch + 1):
+                for cx in range(max(x0, 0) // cw, min(x1, self.largura - 1) // cw + 1):
+                    self._obter_chunk(cx, cy)
+        return grafo
+
+    def grafo_raio(self, posicao, limite=float("inf")) -> GrafoTabuleiro:
+        """O grafo pronto para buscas que saem de `posicao` gastando até `limite` pontos."""
+        raio = int(min(limite / CUSTO_MINIMO, self.largura + self.altura))
+        x, y = posicao
+        return self.grafo_area(x - raio, y - raio, x + raio, y + raio)
+
+    @property
+    def grafo_completo(self) -> GrafoTabuleiro:
+        """O grafo do tabuleiro inteiro (em chunks, gera todos)."""
+        return self.grafo_area(0, 0, self.largura - 1, self.altura - 1)
 
     def get_vizinhos(self, posicao):
         x, y = posicao
         vizinhos = [(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)]
-        return [pos for pos in vizinhos if pos in self.celulas]
+        return [pos for pos in vizinhos if self.dentro(pos)]
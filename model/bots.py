@@ -0,0 +1,96 @@
+"""Jogadores automáticos para o MotorJogo.
+
+Um bot é uma função `bot(motor, rng) -> acao` chamada quando o personagem
+dele está na vez; `rng` é um random.Random (o torneio passa o fluxo "bots"
+do serviço do motor, então a partida continua reproduzível).
+
+    aleatorio  coleta o que houver na célula; fora isso, ação válida qualquer
+    passivo    rola, fica parado e passa (linha de base)
+    guloso     anda para o item mais próximo que não seja armadilha e só
+               ataca quando as chances exatas (model.chances) são boas; se só
+               restam armadilhas, desarma uma (a coleta repõe os itens) quando
+               tem vida de sobra
+"""
+from core.enums import TipoItem
+from model.chances import chances_entre
+
+# o guloso ataca se vencer com ao menos esta chance e morrer com no máximo a outra
+CHANCE_ATAQUE = 0.5
+RISCO_MORTE = 0.2
+# vida mínima para cair de propósito numa armadilha quando só elas restam
+VIDA_ARMADILHA = 50
+
+
+def bot_aleatorio(motor, rng):
+    acoes = motor.acoes_validas()
+    if not acoes:
+        return ("encerrar_turno",)
+    if ("coletar",) in acoes:
+        return ("coletar",)
+    return rng.choice(acoes)
+
+
+def bot_passivo(motor, rng):
+    if motor.fase_atual == "selecao":
+        return ("rolar",)
+    if motor.fase_atual == "movimento":
+        return ("encerrar_movimento",)
+    return ("passar",)
+
+
+def _item_bom(itens) -> bool:
+    return any(i.tipo != TipoItem.ARMADILHA for i in itens)
+
+
+def _alvos(tab, p) -> list:
+    """Posições dos itens que valem a coleta: os bons ou, sem nenhum, as armadilhas."""
+    alvos = [pos for pos, itens in tab.itens_por_posicao() if _item_bom(itens)]
+    if not alvos and p.vida_atual >= VIDA_ARMADILHA:
+        alvos = [pos for pos, _ in tab.itens_por_posicao()]
+    return alvos
+
+
+def bot_guloso(motor, rng):
+    p = motor.personagem_selecionado
+    tab = motor.tabuleiro
+    if motor.fase_atual == "selecao":
+        return ("rolar",)
+    if motor.fase_atual == "acao":
+        cel = tab.get_celula(p.posicao)
+        return ("coletar",) if cel and cel.itens and p.posicao in _alvos(tab, p) else ("passar",)
+
+    alcance = motor.sistema_movimento.posicoes_alcancaveis.get(p, {})
+    if not alcance:
+        return ("encerrar_movimento",)
+    # batalha: só entra na célula de um inimigo quando vale a pena
+    inimigos = {}
+    for pos, ocupantes in tab.ocupantes_por_posicao():
+        for oc in ocupantes:
+            if oc is not p and pos in alcance:
+                inimigos[pos] = oc
+    for pos, oc in inimigos.items():
+        c = chances_entre(p, oc)
+        if c.vitoria >= CHANCE_ATAQUE and c.morte_atacante <= RISCO_MORTE:
+            return ("mover", pos)
+
+    alvos = _alvos(tab, p)
+    if not alvos:
+        return ("encerrar_movimento",)
+    x, y = p.posicao
+    alvo = min(alvos, key=lambda a: (abs(a[0] - x) + abs(a[1] - y), a))
+    if alvo in alcance and alvo not in inimigos:
+        return ("mover", alvo)
+
+    def distancia(pos):
+        return abs(pos[0] - alvo[0]) + abs(pos[1] - alvo[1])
+    melhor = min((pos for pos in alcance if pos not in inimigos), key=lambda pos: (distancia(pos), pos), default=None)
+    if melhor is None or distancia(melhor) >= distancia(p.posicao):
+        return ("encerrar_movimento",)
+    return ("mover", melhor)
+
+
+BOTS = {
+    "aleatorio": bot_aleatorio,
+    "passivo": bot_passivo,
+    "guloso": bot_guloso,
+}
@@ -0,0 +1,110 @@
+"""Campos de distância em lote: custo mínimo de K origens até todas as células.
+
+Mesmas regras do SistemaMovimento (custo de entrar na célula, água
+intransponível, células com mais de um ocupante bloqueadas), mas calculado
+como uma frente de onda sobre matrizes: os custos são inteiros pequenos,
+então as células são processadas por nível de custo (buckets, como no
+algoritmo de Dial) e cada nível expande de uma vez a frente de todas as
+origens com operações vetorizadas.
+"""
+import numpy as np
+
+from core.regras_terreno import REGRAS
+
+# custo devolvido por frente_de_onda para células inalcançáveis
+INALCANCAVEL = np.iinfo(np.int32).max
+# mesma ordem de Tabuleiro.get_vizinhos
+_DIRECOES = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+def custos_entrada(tabuleiro, bloquear_ocupadas: bool = True) -> np.ndarray:
+    """Matriz [y, x] int32 com o custo de entrar em cada célula (0 = não dá para entrar)."""
+    terreno = tabuleiro.terreno
+    livre = REGRAS.passavel[terreno]
+    if bloquear_ocupadas:
+        livre = livre & (tabuleiro.ocupacao <= 1)
+    return np.where(livre, REGRAS.custo[terreno], 0).astype(np.int32)
+
+
+def frente_de_onda(custo: np.ndarray, fontes: np.ndarray, limite: int = None) -> np.ndarray:
+    """Custos mínimos (int32, INALCANCAVEL = inalcançável) a partir de cada fonte, numa matriz (K, H, W) achatada.
+
+    `custo` [y, x] (0 = não dá para entrar) vale para todas as origens, ou
+    tem forma (K, H, W) com uma grade por origem. `fontes` são os índices
+    achatados k * H * W + y * W + x de onde cada origem parte (custo 0).
+    """
+    altura, largura = custo.shape[-2:]
+    n = altura * largura
+    k = len(fontes)
+    por_origem = custo.ndim == 3
+    custo = custo.ravel()
+    dist = np.full(k * n, INALCANCAVEL, dtype=np.int32)
+    dist[fontes] = 0
+    # nível de custo -> ids (k * n + célula) que entraram na frente com esse custo
+    niveis = {0: [np.asarray(fontes, dtype=np.int64)]}
+    nivel = 0
+    while niveis:
+        if limite is not None and nivel > limite:
+            break
+        lista = niveis.pop(nivel, None)
+        if lista is None:
+            nivel += 1
+            continue
+        ids = np.unique(np.concatenate(lista))
+        ids = ids[dist[ids] == nivel]  # descarta quem já saiu mais barato
+        celula = ids % n
+        cy, cx = np.divmod(celula, largura)
+        base = ids if por_origem else celula
+        for dx, dy in _DIRECOES:
+            if dx:
+                dentro = (cx + dx >= 0) & (cx + dx < largura)
+            else:
+                dentro = (cy + dy >= 0) & (cy + dy < altura)
+            deslocamento = dy * largura + dx
+            viz = ids[dentro] + deslocamento
+            c = custo[base[dentro] + deslocamento]
+            # o custo depende só do vizinho, então repetições de `viz` trazem o mesmo candidato
+            melhora = (c > 0) & (nivel + c < dist[viz])
+            viz, c = viz[melhora], c[melhora]
+            dist[viz] = nivel + c
+            for valor in np.unique(c).tolist():
+                niveis.setdefault(nivel + valor, []).append(viz[c == valor])
+        nivel += 1
+    return dist
+
+
+def campos_distancia(tabuleiro, origens, limite: int = None,
+                     bloquear_ocupadas: bool = True) -> np.ndarray:
+    """Matriz (K, H, W) float32: custo mínimo da origem k até cada célula.
+
+    Células inalcançáveis (ou acima de `limite`) ficam inf. A própria origem
+    vale 0 mesmo se estiver bloqueada, como no calcular_alcance.
+    """
+    origens = list(origens)
+    altura, largura = tabuleiro.altura, tabuleiro.largura
+    if not origens:
+        return np.empty((0, altura, largura), dtype=np.float32)
+    custo = custos_entrada(tabuleiro, bloquear_ocupadas)
+    xs, ys = np.array(origens, dtype=np.int64).T
+    fontes = np.arange(len(origens), dtype=np.int64) * (altura * largura) + ys * largura + xs
+    dist = frente_de_onda(custo, fontes, limite)
+
+    saida = dist.astype(np.float32).reshape(len(origens), altura, largura)
+    saida[saida >= INALCANCAVEL] = np.inf
+    if limite is not None:
+        saida[saida > limite] = np.inf
+    return saida
+
+
+def origem_mais_proxima(campos: np.ndarray):
+    """(índice, custo) [y, x] da origem mais barata para cada célula; índice -1 se nenhuma alcança."""
+    indice = np.argmin(campos, axis=0)
+    custo = np.take_along_axis(campos, indice[None], axis=0)[0]
+    indice[np.isinf(custo)] = -1
+    return indice, custo
+
+
+def custos_entre(campos: np.ndarray, posicoes) -> np.ndarray:
+    """Matriz (K, M): custo da origem k até cada uma das M posições (x, y)."""
+    xs, ys = zip(*posicoes) if posicoes else ((), ())
+    return campos[:, list(ys), list(xs)]
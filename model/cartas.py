@@ -1,4 +1,4 @@
-import random
+import re
 
 class Carta:
     def __init__(self, nome, tipo, descricao, efeito=None):
@@ -34,3 +34,67 @@ CARTAS_DISPONIVEIS = [
     Carta("Maldição Ancestral", "AZAR", "Os espíritos te amaldiçoam: reduza seu HP pela metade."),
     Carta("Invasão de Monstros", "AZAR", "Monstros atacam! Perde 10 HP e 1 item do inventário.")
 ]
+
+
+# === CARTAS SORTEADAS EM JOGO ===
+# (tipo, descrição); o efeito sai do texto da descrição (SistemaCartas.aplicar_efeito)
+BARALHO = [
+    ("Sorte", "Ganhe 30 de vida!"),
+    ("Sorte", "Ganhe 1 troféu extra!"),
+    ("Sorte", "Teleporte para uma posição aleatória!"),
+    ("Azar", "Perde 25 de vida!"),
+    ("Azar", "Perde um turno!"),
+    ("Sorte", "Ganhe 50 de vida!"),
+    ("Azar", "Perde 15 de vida!"),
+    ("Sorte", "Teleporte mágico para lugar seguro!"),
+]
+
+
+class SistemaCartas:
+    """Efeitos das cartas do BARALHO sobre o estado do motor."""
+
+    def __init__(self, motor):
+        self.motor = motor
+
+    def aplicar_efeito(self, personagem, descricao):
+        """Aplica o efeito da carta no personagem."""
+        motor = self.motor
+        descricao = descricao.lower()
+
+        # ❤️ Ganhar vida
+        if "ganhe" in descricao and "vida" in descricao:
+            valor = self._extrair_numero(descricao, 20)
+            personagem.vida_atual = min(personagem.vida_atual + valor, personagem.vida_maxima)
+            motor.msg.add(f"❤️ {personagem.nome} ganhou {valor} de vida!", (0, 255, 0))
+
+        # 💀 Perder vida
+        elif "perde" in descricao and "vida" in descricao:
+            valor = self._extrair_numero(descricao, 20)
+            personagem.vida_atual = max(personagem.vida_atual - valor, 0)
+            motor.msg.add(f"💀 {personagem.nome} perdeu {valor} de vida!", (255, 50, 50))
+
+        # 🏆 Ganhar troféu
+        elif "troféu" in descricao or "trofeu" in descricao:
+            from model.items import Tesouro
+            item = Tesouro("🏆 Tesouro Extra", personagem.posicao, 50)
+            personagem.inventario.append(item)
+            motor.msg.add(f"🏆 {personagem.nome} recebeu um troféu extra!", (255, 215, 0))
+
+        # ⏳ Perder turno
+        elif "perde" in descricao and "turno" in descricao:
+            motor.msg.add(f"⏳ {personagem.nome} perdeu um turno!", (255, 255, 0))
+            motor.finalizar_turno()
+
+        # 💫 Teleporte
+        elif "teleporte" in descricao or "mova" in descricao:
+            nova_pos = motor.tabuleiro.sortear_posicao_livre(motor.aleatorio.fluxo("cartas"))
+            if nova_pos is not None:
+                motor.tabuleiro.get_celula(personagem.posicao).remover_ocupante(personagem)
+                motor.tabuleiro.get_celula(nova_pos).adicionar_ocupante(personagem)
+                personagem.posicao = nova_pos
+                motor.msg.add(f"💫 {personagem.nome} foi teleportado!", (173, 216, 230))
+
+    def _extrair_numero(self, texto, padrao=10):
+        """Extrai o primeiro número encontrado na descrição."""
+        numeros = re.findall(r'\d+', texto)
+        return int(numeros[0]) if numeros else padrao
@@ -0,0 +1,92 @@
+"""Chances exatas de uma batalha (sem sorteio), memorizadas por parâmetros.
+
+Uma rodada depende só de d20 contra d20: das 400 combinações saem as
+chances de vitória, derrota e empate da rodada, já com bônus e modificador
+de combate de cada lado (mesma conta de model.batalha). As rodadas são
+independentes, então a tabela (vitórias do atacante, vitórias do defensor)
+é uma multinomial; daí saem vitória/derrota/empate da batalha, mortes e a
+distribuição de perda de vida de cada lado.
+
+Tudo fica em cache: depois da primeira consulta com os mesmos lutadores, a
+chance custa um acesso a dicionário. Para bots e interface:
+
+    c = chances_entre(atacante, defensor)
+    c.vitoria, c.morte_defensor
+"""
+from fractions import Fraction
+from functools import lru_cache
+from math import factorial
+from typing import Dict, NamedTuple, Tuple
+
+from model.batalha import RODADAS, FACES, Lutador, escalas_rodada, lutador_de
+
+
+class Chances(NamedTuple):
+    """Probabilidades do ponto de vista do atacante.
+
+    `delta_*` mapeia a variação de vida (0 ou negativa) à sua probabilidade;
+    `conjunta[a][d]` é a chance de o atacante vencer `a` rodadas e o defensor `d`.
+    """
+    vitoria: float
+    derrota: float
+    empate: float
+    morte_atacante: float
+    morte_defensor: float
+    delta_atacante: Dict[int, float]
+    delta_defensor: Dict[int, float]
+    conjunta: Tuple[Tuple[float, ...], ...]
+
+
+@lru_cache(maxsize=None)
+def chances_rodada(ka: int, ba: int, kd: int, bd: int) -> Tuple[Fraction, Fraction, Fraction]:
+    """(vitória, derrota, empate) exatos de uma rodada, com as escalas de escalas_rodada."""
+    vence = perde = 0
+    for da in range(1, FACES + 1):
+        va = da * ka + ba
+        for dd in range(1, FACES + 1):
+            vd = dd * kd + bd
+            vence += va > vd; perde += vd > va
+    total = FACES * FACES
+    return Fraction(vence, total), Fraction(perde, total), Fraction(total - vence - perde, total)
+
+
+def _distribuicao(perdidas: Dict[int, Fraction], vida: int, dano: int) -> Dict[int, float]:
+    deltas: Dict[int, Fraction] = {}
+    for k, p in perdidas.items():
+        d = -min(vida, dano * k)
+        deltas[d] = deltas.get(d, 0) + p
+    return {d: float(p) for d, p in sorted(deltas.items(), reverse=True) if p}
+
+
+@lru_cache(maxsize=4096)
+def chances(atacante: Lutador, defensor: Lutador, rodadas: int = RODADAS) -> Chances:
+    """Distribuição exata dos resultados de uma batalha de `rodadas` rodadas."""
+    pv, pd, pe = chances_rodada(*escalas_rodada(atacante, defensor))
+    conjunta = [[Fraction(0)] * (rodadas + 1) for _ in range(rodadas + 1)]
+    vitoria = derrota = empate = Fraction(0)
+    perdidas_atacante: Dict[int, Fraction] = {}
+    perdidas_defensor: Dict[int, Fraction] = {}
+    for a in range(rodadas + 1):
+        for d in range(rodadas + 1 - a):
+            e = rodadas - a - d
+            p = factorial(rodadas) // (factorial(a) * factorial(d) * factorial(e)) * pv ** a * pd ** d * pe ** e
+            conjunta[a][d] = p
+            if a > d: vitoria += p
+            elif d > a: derrota += p
+            else: empate += p
+            perdidas_atacante[d] = perdidas_atacante.get(d, 0) + p
+            perdidas_defensor[a] = perdidas_defensor.get(a, 0) + p
+    return Chances(
+        vitoria=float(vitoria), derrota=float(derrota), empate=float(empate),
+        morte_atacante=float(sum(p for k, p in perdidas_atacante.items() if defensor.dano * k >= atacante.vida)),
+        morte_defensor=float(sum(p for k, p in perdidas_defensor.items() if atacante.dano * k >= defensor.vida)),
+        delta_atacante=_distribuicao(perdidas_atacante, atacante.vida, defensor.dano),
+        delta_defensor=_distribuicao(perdidas_defensor, defensor.vida, atacante.dano),
+        conjunta=tuple(tuple(float(p) for p in linha) for linha in conjunta),
+    )
+
+
+def chances_entre(atacante, defensor) -> Chances:
+    """Chances se `atacante` entrar na célula de `defensor`, pela regra do jogo
+    (d20 contra d20, sem bônus nem modificador de combate)."""
+    return chances(lutador_de(atacante), lutador_de(defensor))
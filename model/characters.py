@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 from typing import Tuple, List
 from core.enums import ClassePersonagem
 class Entidade(ABC):
+    __slots__ = ("nome", "posicao", "vida_maxima", "vida_atual", "status", "sprite", "sprite_hd",
+                 "animations", "dano_flutuante", "controller")
     def __init__(self, nome: str, posicao: Tuple[int,int], vida: int = 100):
         self.nome = nome
         self.posicao = posicao
@@ -9,7 +11,10 @@ class Entidade(ABC):
         self.vida_atual = vida
         self.status = []
         self.sprite = None
+        self.sprite_hd = None
         self.animations = {}
+        self.dano_flutuante = None
+        self.controller = None
         
     def receber_dano(self, dano: int) -> bool:
         self.vida_atual = max(0, self.vida_atual - dano)
@@ -20,7 +25,7 @@ class Entidade(ABC):
             "alpha": 255
         }
 
-        if hasattr(self, "controller") and hasattr(self.controller, "msg"):
+        if self.controller is not None and hasattr(self.controller, "msg"):
             cor = (255, 80, 80) if dano > 0 else (150, 255, 150)
             self.controller.msg.add(f"-{dano} HP ({self.nome})", cor)
 
@@ -33,6 +38,7 @@ class Entidade(ABC):
     def interagir(self, alvo) -> bool: ...
     def esta_vivo(self) -> bool: return self.vida_atual > 0
 class Combatente(ABC):
+    __slots__ = ()
     @abstractmethod
     def atacar(self, alvo) -> int: ...
     @abstractmethod
@@ -40,6 +46,8 @@ class Combatente(ABC):
     @abstractmethod
     def usar_habilidade(self, alvo) -> bool: ...
 class Personagem(Entidade, Combatente):
+    __slots__ = ("classe", "ataque", "defesa", "velocidade", "mana", "mana_maxima", "habilidades",
+                 "inventario", "equipamento", "ja_moveu_turno", "pontos_movimento_atual", "rolou_dados")
     def __init__(self, nome: str, posicao: Tuple[int,int], classe: ClassePersonagem):
         super().__init__(nome, posicao)
         self.classe = classe
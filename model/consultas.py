@@ -0,0 +1,168 @@
+"""Consultas de caminho e alcance em lote, para ferramentas offline.
+
+Recebe arrays de consultas, divide em pedaços e distribui num pool de
+processos. O terreno vai uma vez para memória compartilhada; cada processo
+monta seu GrafoTabuleiro a partir dele e só recebe, por pedaço, os índices
+das consultas. Os resultados voltam como arrays, pedaço a pedaço, na ordem
+em que ficam prontos:
+
+    for r in caminhos_em_lote(tab, origens, destinos, limites):
+        custos[r.indices] = r.custos
+
+A ocupação é a do momento da chamada (células com mais de um ocupante
+bloqueadas), como no SistemaMovimento.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from typing import Iterator, NamedTuple
+
+import numpy as np
+
+from model.grafo import GrafoTabuleiro
+from model.movement import celulas_bloqueadas, dijkstra_ids, a_estrela_ids
+
+TAMANHO_PEDACO = 1024
+
+
+class ResultadoCaminhos(NamedTuple):
+    indices: np.ndarray  # posição de cada consulta no lote original
+    custos: np.ndarray   # int32; -1 sem caminho dentro do limite
+    passos: np.ndarray   # int32; células no caminho, origem inclusa (0 sem caminho)
+    # com_caminhos=True: células (ids y * largura + x) de todos os caminhos,
+    # o da i-ésima consulta do pedaço em celulas[inicio[i]:inicio[i + 1]]
+    inicio: np.ndarray = None
+    celulas: np.ndarray = None
+
+
+class ResultadoAlcances(NamedTuple):
+    indices: np.ndarray
+    contagens: np.ndarray  # int32; células alcançáveis, origem exclusa
+    inicio: np.ndarray = None
+    celulas: np.ndarray = None
+
+
+# === PROCESSO TRABALHADOR ===
+_GRAFO = None
+_BLOQUEADAS = frozenset()
+
+
+def _iniciar_trabalhador(nome_memoria, forma, bloqueadas):
+    global _GRAFO, _BLOQUEADAS
+    memoria = shared_memory.SharedMemory(name=nome_memoria)
+    try:
+        _GRAFO = GrafoTabuleiro.do_terreno(np.ndarray(forma, dtype=np.uint8, buffer=memoria.buf))
+    finally:
+        memoria.close()
+    _BLOQUEADAS = bloqueadas
+
+
+def _resolver_caminhos(indices, origens, destinos, limites, com_caminhos):
+    custos = np.full(len(indices), -1, dtype=np.int32)
+    passos = np.zeros(len(indices), dtype=np.int32)
+    partes = []
+    for i, (s, alvo, limite) in enumerate(zip(origens.tolist(), destinos.tolist(), limites.tolist())):
+        achou, pred, g = a_estrela_ids(_GRAFO, _BLOQUEADAS, s, alvo, limite)
+        if not achou:
+            continue
+        custos[i] = g[alvo]
+        caminho = []
+        u = alvo
+        while u != -1:
+            caminho.append(u); u = pred[u]
+        passos[i] = len(caminho)
+        if com_caminhos:
+            partes.append(caminho[::-1])
+    if not com_caminhos:
+        return ResultadoCaminhos(indices, custos, passos)
+    inicio = np.zeros(len(indices) + 1, dtype=np.int64)
+    np.cumsum(passos, out=inicio[1:])
+    celulas = np.fromiter((c for p in partes for c in p), dtype=np.int32, count=int(inicio[-1]))
+    return ResultadoCaminhos(indices, custos, passos, inicio, celulas)
+
+
+def _resolver_alcances(indices, origens, limites, com_celulas):
+    contagens = np.zeros(len(indices), dtype=np.int32)
+    partes = []
+    for i, (s, limite) in enumerate(zip(origens.tolist(), limites.tolist())):
+        dist, _ = dijkstra_ids(_GRAFO, _BLOQUEADAS, s, limite)
+        contagens[i] = len(dist) - 1
+        if com_celulas:
+            partes.append(np.fromiter((c for c in dist if c != s), dtype=np.int32, count=len(dist) - 1))
+    if not com_celulas:
+        return ResultadoAlcances(indices, contagens)
+    inicio = np.zeros(len(indices) + 1, dtype=np.int64)
+    np.cumsum(contagens, out=inicio[1:])
+    celulas = np.concatenate(partes) if partes else np.empty(0, dtype=np.int32)
+    return ResultadoAlcances(indices, contagens, inicio, celulas)
+
+
+# === API ===
+def _ids(tabuleiro, posicoes) -> np.ndarray:
+    posicoes = np.asarray(posicoes, dtype=np.int64).reshape(-1, 2)
+    return posicoes[:, 1] * tabuleiro.largura + posicoes[:, 0]
+
+
+def _limites(limites, n) -> np.ndarray:
+    if limites is None:
+        return np.full(n, np.inf)
+    return np.broadcast_to(np.asarray(limites, dtype=np.float64), (n,))
+
+
+def _executar(tabuleiro, tarefa, colunas, extra, processos, tamanho_pedaco) -> Iterator:
+    n = len(colunas[0])
+    pedacos = [np.arange(i, min(i + tamanho_pedaco, n)) for i in range(0, n, tamanho_pedaco)]
+    bloqueadas = frozenset(celulas_bloqueadas(tabuleiro))
+    processos = processos or os.cpu_count() or 1
+
+    if processos == 1 or len(pedacos) < 2:
+        global _GRAFO, _BLOQUEADAS
+        anteriores = _GRAFO, _BLOQUEADAS
+        _GRAFO, _BLOQUEADAS = tabuleiro.grafo_completo, bloqueadas
+        try:
+            for idx in pedacos:
+                yield tarefa(idx, *(c[idx] for c in colunas), extra)
+        finally:
+            _GRAFO, _BLOQUEADAS = anteriores
+        return
+
+    terreno = np.ascontiguousarray(tabuleiro.terreno, dtype=np.uint8)
+    memoria = shared_memory.SharedMemory(create=True, size=max(1, terreno.nbytes))
+    try:
+        np.ndarray(terreno.shape, dtype=np.uint8, buffer=memoria.buf)[:] = terreno
+        with ProcessPoolExecutor(max_workers=processos, initializer=_iniciar_trabalhador,
+                                 initargs=(memoria.name, terreno.shape, bloqueadas)) as pool:
+            futuros = [pool.submit(tarefa, idx, *(c[idx] for c in colunas), extra) for idx in pedacos]
+            for futuro in as_completed(futuros):
+                yield futuro.result()
+    finally:
+        memoria.close()
+        memoria.unlink()
+
+
+def caminhos_em_lote(tabuleiro, origens, destinos, limites=None, com_caminhos: bool = False,
+                     processos: int = None, tamanho_pedaco: int = TAMANHO_PEDACO) -> Iterator[ResultadoCaminhos]:
+    """Resolve N consultas (origem, destino, limite) com A*; gera um ResultadoCaminhos por pedaço.
+
+    `origens`/`destinos` são arrays (N, 2) de (x, y); `limites` um escalar,
+    um array (N,) ou None (sem limite). `processos=1` roda no próprio processo.
+    """
+    s, t = _ids(tabuleiro, origens), _ids(tabuleiro, destinos)
+    yield from _executar(tabuleiro, _resolver_caminhos, (s, t, _limites(limites, len(s))),
+                         com_caminhos, processos, tamanho_pedaco)
+
+
+def alcances_em_lote(tabuleiro, origens, limites, com_celulas: bool = False,
+                     processos: int = None, tamanho_pedaco: int = TAMANHO_PEDACO) -> Iterator[ResultadoAlcances]:
+    """Conta (e opcionalmente lista) as células alcançáveis de cada origem dentro do seu limite."""
+    s = _ids(tabuleiro, origens)
+    yield from _executar(tabuleiro, _resolver_alcances, (s, _limites(limites, len(s))),
+                         com_celulas, processos, tamanho_pedaco)
+
+
+def coletar_custos(resultados, n: int) -> np.ndarray:
+    """Junta os custos (ou contagens) de todos os pedaços num array (n,) na ordem original."""
+    saida = np.empty(n, dtype=np.int32)
+    for r in resultados:
+        saida[r.indices] = r.custos if isinstance(r, ResultadoCaminhos) else r.contagens
+    return saida
@@ -1,10 +1,13 @@
-import random
+from core.aleatorio import ALEATORIO
+
 
 class Dado:
+    """Rolagens do fluxo "dados" do serviço passado (ou do ALEATORIO padrão)."""
+
     @staticmethod
-    def rolar_d6() -> int:
-        return random.randint(1, 6)
+    def rolar_d6(aleatorio=None) -> int:
+        return (aleatorio or ALEATORIO).bloco("dados", 1, 6).proximo()
 
     @staticmethod
-    def rolar_d20() -> int:
-        return random.randint(1, 20)
+    def rolar_d20(aleatorio=None) -> int:
+        return (aleatorio or ALEATORIO).bloco("dados", 1, 20).proximo()
@@ -0,0 +1,117 @@
+"""Tabela de adjacência do tabuleiro, compartilhada pelas buscas.
+
+Cada posição (x, y) vira um id linear `y * largura + x`, com quatro vagas
+fixas de aresta: as do id `i` são `inicio[i]:inicio[i + 1]` (4 * i a
+4 * i + 4) em `destinos`/`custos`, na ordem de Tabuleiro.get_vizinhos, com
+o custo de entrar no vizinho. Vaga sem aresta (vizinho fora do tabuleiro,
+intransponível ou ainda não gerado) guarda destino 0 e custo SEM_ARESTA:
+como inf < inf + 1 é falso, nenhuma busca relaxa por ela, e os laços
+percorrem as vagas por índice, sem teste extra nem alocação por expansão.
+
+Com as vagas fixas nada precisa ser remontado: trocar o terreno de uma
+célula reescreve só as vagas dela e dos vizinhos (atualizar), e um
+tabuleiro em chunks entra no grafo bloco a bloco, conforme os chunks são
+gerados (preencher).
+"""
+import numpy as np
+
+from core.regras_terreno import REGRAS
+
+# mesma ordem de Tabuleiro.get_vizinhos
+_DIRECOES = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+SEM_ARESTA = float("inf")
+# menor custo de entrada entre os terrenos transponíveis, valha o mapa que valer
+CUSTO_MINIMO = int(REGRAS.custo[REGRAS.passavel].min())
+
+
+class GrafoTabuleiro:
+    __slots__ = ("largura", "altura", "inicio", "destinos", "custos",
+                 "custo_celula", "custo_minimo", "versao", "_custo")
+
+    def __init__(self, largura: int, altura: int):
+        """Grafo sem arestas: as células entram com preencher."""
+        self.largura = largura
+        self.altura = altura
+        n = largura * altura
+
+        # listas: indexar lista em Python é bem mais rápido que ndarray
+        self.inicio = list(range(0, 4 * n + 1, 4))
+        self.destinos = [0] * (4 * n)
+        self.custos = [SEM_ARESTA] * (4 * n)
+        # custo de entrar em cada célula, 0 se intransponível ou não gerada
+        self.custo_celula = [0] * n
+        self._custo = np.zeros((altura, largura), dtype=np.int32)  # o mesmo, para as contas em bloco
+        # menor custo já visto: só desce, então a heurística do A* nunca superestima
+        self.custo_minimo = int(REGRAS.custo[REGRAS.passavel].max())
+        # sobe a cada mudança; quem deriva estruturas do grafo (GradeSaltos) compara
+        self.versao = 0
+
+    @classmethod
+    def do_terreno(cls, terreno: np.ndarray) -> "GrafoTabuleiro":
+        """Grafo completo de uma grade [y, x] de códigos de terreno."""
+        altura, largura = terreno.shape
+        grafo = cls(largura, altura)
+        grafo.preencher(0, 0, terreno)
+        return grafo
+
+    def preencher(self, x0: int, y0: int, terreno: np.ndarray):
+        """Liga ao grafo o bloco [y, x] `terreno` com canto em (x0, y0)."""
+        h, w = terreno.shape
+        custo = np.where(REGRAS.passavel[terreno], REGRAS.custo[terreno], 0).astype(np.int32)
+        self._custo[y0:y0 + h, x0:x0 + w] = custo
+        for y in range(h):
+            a = (y0 + y) * self.largura + x0
+            self.custo_celula[a:a + w] = custo[y].tolist()
+        if custo.any():
+            self.custo_minimo = min(self.custo_minimo, int(custo[custo > 0].min()))
+        # a moldura em volta do bloco ganha as vagas que agora apontam para dentro dele
+        self._religar(x0 - 1, y0 - 1, x0 + w + 1, y0 + h + 1)
+        self.versao += 1
+
+    def atualizar(self, posicao, codigo: int):
+        """Troca o terreno de uma célula: reescreve as vagas dela e dos vizinhos."""
+        x, y = posicao
+        custo = int(REGRAS.custo[codigo]) if REGRAS.passavel[codigo] else 0
+        self._custo[y, x] = custo
+        self.custo_celula[y * self.largura + x] = custo
+        if custo:
+            self.custo_minimo = min(self.custo_minimo, custo)
+        self._religar(x - 1, y - 1, x + 2, y + 2)
+        self.versao += 1
+
+    def _religar(self, x0: int, y0: int, x1: int, y1: int):
+        """Refaz as vagas das células em [x0, x1) x [y0, y1) a partir de _custo."""
+        x0, y0 = max(x0, 0), max(y0, 0)
+        x1, y1 = min(x1, self.largura), min(y1, self.altura)
+        if x0 >= x1 or y0 >= y1:
+            return
+        largura, altura = self.largura, self.altura
+        ys, xs = np.mgrid[y0:y1, x0:x1]
+        # (h, w, 4): destino e custo de cada direção, custo 0 quando não há aresta
+        alvos = np.zeros(ys.shape + (4,), dtype=np.int64)
+        custos = np.zeros(ys.shape + (4,), dtype=np.int32)
+        for d, (dx, dy) in enumerate(_DIRECOES):
+            nx, ny = xs + dx, ys + dy
+            dentro = (nx >= 0) & (nx < largura) & (ny >= 0) & (ny < altura)
+            c = np.where(dentro, self._custo[np.where(dentro, ny, 0), np.where(dentro, nx, 0)], 0)
+            alvos[..., d] = np.where(c > 0, ny * largura + nx, 0)
+            custos[..., d] = c
+        for y in range(y1 - y0):
+            a = 4 * ((y0 + y) * largura + x0)
+            b = a + 4 * (x1 - x0)
+            self.destinos[a:b] = alvos[y].ravel().tolist()
+            self.custos[a:b] = [c or SEM_ARESTA for c in custos[y].ravel().tolist()]
+
+    def id_de(self, posicao) -> int:
+        x, y = posicao
+        return y * self.largura + x
+
+    def posicao_de(self, id_celula: int):
+        y, x = divmod(id_celula, self.largura)
+        return (x, y)
+
+    def vizinhos(self, id_celula: int):
+        """Pares (id_vizinho, custo) — conveniência; buscas quentes usam as listas direto."""
+        a, b = self.inicio[id_celula], self.inicio[id_celula + 1]
+        return [(v, c) for v, c in zip(self.destinos[a:b], self.custos[a:b]) if c != SEM_ARESTA]
@@ -0,0 +1,70 @@
+from core.enums import ClassePersonagem
+
+# segundos de recarga da habilidade de cada classe
+TEMPOS_RECARGA = {
+    ClassePersonagem.GUERREIRO: 60,
+    ClassePersonagem.MAGO: 90,
+    ClassePersonagem.LADINO: 110,
+    ClassePersonagem.CLERIGO: 98
+}
+
+
+class SistemaHabilidades:
+    """Bônus de classe e habilidades especiais, com recarga pelo relógio do motor."""
+
+    def __init__(self, motor):
+        self.motor = motor
+        self.cooldowns = {}
+
+    def aplicar_bonus_iniciais(self, personagem):
+        if personagem.classe.name == "GUERREIRO":
+            personagem.vida_maxima += 30
+            personagem.vida_atual += 30
+            personagem.velocidade += 1
+        elif personagem.classe.name == "MAGO":
+            personagem.velocidade += 1
+        elif personagem.classe.name == "LADINO":
+            personagem.velocidade += 2
+        elif personagem.classe.name == "CLERIGO":
+            personagem.vida_maxima += 10
+            personagem.vida_atual += 10
+
+    def recarga_restante(self, personagem) -> float:
+        """Segundos até a habilidade voltar (0 se já pode usar)."""
+        if personagem not in self.cooldowns:
+            return 0
+        decorrido = self.motor.relogio() / 1000 - self.cooldowns[personagem]
+        return max(0, TEMPOS_RECARGA.get(personagem.classe, 10) - decorrido)
+
+    def usar_habilidade(self, personagem) -> bool:
+        restante = self.recarga_restante(personagem)
+        if restante > 0:
+            self.motor.msg.add(f"Habilidade em recarga ({int(restante)}s restantes)", (200, 200, 200))
+            return False
+        self.cooldowns[personagem] = self.motor.relogio() / 1000
+        self._executar_habilidade(personagem)
+        return True
+
+    def _executar_habilidade(self, personagem):
+        if personagem.classe.name == "GUERREIRO":
+            self._forca_extra(personagem)
+        elif personagem.classe.name == "MAGO":
+            self._ataque_magico(personagem)
+        elif personagem.classe.name == "LADINO":
+            self._esquiva(personagem)
+        elif personagem.classe.name == "CLERIGO":
+            self._cura_pessoal(personagem)
+
+    def _forca_extra(self, personagem):
+        self.motor.msg.add(f"{personagem.nome} usou Força Extra! (+20 dano no próximo ataque)", (255, 215, 0))
+
+    def _ataque_magico(self, personagem):
+        self.motor.msg.add(f"{personagem.nome} lançou um Ataque Mágico! (atinge 3 células à frente)", (180, 100, 255))
+
+    def _esquiva(self, personagem):
+        self.motor.msg.add(f"{personagem.nome} ativou Esquiva! (imune por 1 turno)", (150, 255, 150))
+
+    def _cura_pessoal(self, personagem):
+        cura = 25
+        personagem.vida_atual = min(personagem.vida_maxima, personagem.vida_atual + cura)
+        self.motor.msg.add(f"{personagem.nome} usou Cura Pessoal! (+{cura} de vida)", (100, 255, 100))
@@ -0,0 +1,273 @@
+"""Busca hierárquica de caminhos (HPA*) para tabuleiros grandes.
+
+O tabuleiro é dividido em clusters quadrados. Em cada fronteira entre dois
+clusters vizinhos, cada trecho contínuo de células atravessáveis dos dois
+lados vira algumas entradas (pares de células, uma de cada lado). As
+células de entrada são os nós do grafo abstrato, ligados:
+    - entre clusters, pelo passo que atravessa a fronteira;
+    - dentro do cluster, pelo custo mínimo sem sair dele.
+Uma consulta longa liga origem e destino aos nós dos seus clusters, busca no
+grafo abstrato e depois refina cada trecho com uma busca local pequena.
+
+O resultado é quase ótimo (pode sair um pouco mais caro que o A* puro, por
+atravessar fronteiras só nas entradas). Quando terreno ou ocupação mudam,
+só os clusters tocados (pelas revisões de região do tabuleiro) e seus
+vizinhos são refeitos. As arestas internas de todos os clusters refeitos
+saem de uma única frente de onda vetorizada (model.campos), com uma origem
+por nó, cada uma confinada ao seu cluster.
+"""
+from heapq import heappush, heappop
+from typing import Dict, List, Set, Tuple
+
+import numpy as np
+
+from model.campos import INALCANCAVEL, custos_entrada, frente_de_onda
+from model.grafo import SEM_ARESTA
+from model.movement import celulas_bloqueadas, reconstruir_caminho, a_estrela
+
+# lado dos clusters, em células (múltiplo de board.TAMANHO_REGIAO)
+TAMANHO_CLUSTER = 16
+# trechos de fronteira ganham uma entrada a cada ESPACAMENTO_ENTRADAS células
+# (e sempre as duas pontas); mais entradas = caminhos mais próximos do ótimo
+ESPACAMENTO_ENTRADAS = 4
+# nós processados por frente de onda ao calcular arestas internas
+LOTE_NOS = 4096
+
+_META = -1
+
+
+def _dijkstra_area(grafo, s: int, area, bloqueadas: Set[int], alvo: int = None, reverso: bool = False):
+    """Dijkstra a partir de `s` sem sair de `area` = (x0, y0, x1, y1), extremos exclusivos.
+
+    Com `reverso=True` calcula o custo de cada célula *até* `s` (o passo
+    u -> v custa entrar em v, então no sentido inverso soma-se o custo da
+    célula atual); `pred` vira então o próximo passo rumo a `s`.
+    """
+    inicio, destinos, custos, custo_celula, largura = (
+        grafo.inicio, grafo.destinos, grafo.custos, grafo.custo_celula, grafo.largura)
+    x0, y0, x1, y1 = area
+    dist = {s: 0}; pred = {s: -1}; heap = [(0, s)]
+    while heap:
+        d, u = heappop(heap)
+        if u == alvo: break
+        if d > dist[u]: continue
+        passo = custo_celula[u] if reverso else 0
+        for k in range(inicio[u], inicio[u + 1]):
+            v = destinos[k]
+            if v in bloqueadas or custos[k] == SEM_ARESTA: continue
+            vy, vx = divmod(v, largura)
+            if not (x0 <= vx < x1 and y0 <= vy < y1): continue
+            novo = d + (passo if reverso else custos[k])
+            if novo < dist.get(v, novo + 1):
+                dist[v] = novo; pred[v] = u; heappush(heap, (novo, v))
+    return dist, pred
+
+
+class CaminhoHierarquico:
+    def __init__(self, tabuleiro, tamanho: int = TAMANHO_CLUSTER):
+        self.tabuleiro = tabuleiro
+        self.tamanho = tamanho
+        self.colunas = -(-tabuleiro.largura // tamanho)
+        self.linhas = -(-tabuleiro.altura // tamanho)
+        # fronteira ("h", cx, cy): entre (cx, cy) e (cx + 1, cy); ("v", cx, cy): entre (cx, cy) e (cx, cy + 1)
+        self.entradas: Dict[Tuple[str, int, int], List[Tuple[int, int]]] = {}
+        self.nos_cluster: Dict[Tuple[int, int], Set[int]] = {}
+        # nó -> {nó: custo}
+        self.arestas: Dict[int, Dict[int, int]] = {}
+        self.revisao = -1
+        self.clusters_refeitos = 0
+        self.atualizar()
+
+    # === ESTRUTURA ===
+    def cluster_de(self, id_celula: int) -> Tuple[int, int]:
+        y, x = divmod(id_celula, self.tabuleiro.largura)
+        return x // self.tamanho, y // self.tamanho
+
+    def area_cluster(self, cluster) -> Tuple[int, int, int, int]:
+        cx, cy = cluster
+        t = self.tamanho
+        return (cx * t, cy * t, min((cx + 1) * t, self.tabuleiro.largura),
+                min((cy + 1) * t, self.tabuleiro.altura))
+
+    def _revisao_cluster(self, cluster) -> int:
+        x0, y0, x1, y1 = self.area_cluster(cluster)
+        return self.tabuleiro.revisao_area(x0, y0, x1 - 1, y1 - 1)
+
+    def _fronteiras(self, cluster):
+        cx, cy = cluster
+        if cx + 1 < self.colunas: yield ("h", cx, cy)
+        if cx > 0: yield ("h", cx - 1, cy)
+        if cy + 1 < self.linhas: yield ("v", cx, cy)
+        if cy > 0: yield ("v", cx, cy - 1)
+
+    def _vizinhos_cluster(self, cluster):
+        cx, cy = cluster
+        for nx, ny in ((cx + 1, cy), (cx - 1, cy), (cx, cy + 1), (cx, cy - 1)):
+            if 0 <= nx < self.colunas and 0 <= ny < self.linhas:
+                yield (nx, ny)
+
+    def _calcular_entradas(self, fronteira, livre, largura) -> List[Tuple[int, int]]:
+        direcao, cx, cy = fronteira
+        x0, y0, x1, y1 = self.area_cluster((cx, cy))
+        if direcao == "h":
+            pares = [(y * largura + x1 - 1, y * largura + x1) for y in range(y0, y1)]
+        else:
+            pares = [((y1 - 1) * largura + x, y1 * largura + x) for x in range(x0, x1)]
+        entradas = []
+        trecho = []
+        for a, b in pares + [(None, None)]:
+            if a is not None and livre(a) and livre(b):
+                trecho.append((a, b)); continue
+            if len(trecho) > ESPACAMENTO_ENTRADAS:
+                entradas += trecho[:-1:ESPACAMENTO_ENTRADAS] + [trecho[-1]]
+            elif trecho:
+                entradas.append(trecho[len(trecho) // 2])
+            trecho = []
+        return entradas
+
+    def atualizar(self):
+        """Refaz só os clusters cujas regiões mudaram desde a última atualização."""
+        tab = self.tabuleiro
+        if tab.revisao == self.revisao:
+            return
+        todos = [(cx, cy) for cy in range(self.linhas) for cx in range(self.colunas)]
+        if self.revisao < 0:
+            sujos = set(todos)
+        else:
+            sujos = {c for c in todos if self._revisao_cluster(c) > self.revisao}
+        self.revisao = tab.revisao
+        if not sujos:
+            return
+
+        grafo = tab.grafo_completo
+        bloqueadas = celulas_bloqueadas(tab)
+        custo_celula = grafo.custo_celula
+
+        def livre(i):
+            return custo_celula[i] > 0 and i not in bloqueadas
+
+        afetados = set(sujos)
+        for c in sujos:
+            afetados.update(self._vizinhos_cluster(c))
+        for c in sujos:
+            for fronteira in self._fronteiras(c):
+                self.entradas[fronteira] = self._calcular_entradas(fronteira, livre, grafo.largura)
+
+        for c in afetados:
+            for u in self.nos_cluster.get(c, ()):
+                self.arestas.pop(u, None)
+        for c in afetados:
+            nos = set()
+            for fronteira in self._fronteiras(c):
+                for par in self.entradas.get(fronteira, ()):
+                    nos.update(i for i in par if self.cluster_de(i) == c)
+            self.nos_cluster[c] = nos
+        self._calcular_internas(afetados)
+        for c in afetados:
+            for fronteira in self._fronteiras(c):
+                for a, b in self.entradas.get(fronteira, ()):
+                    self.arestas.setdefault(a, {})[b] = custo_celula[b]
+                    self.arestas.setdefault(b, {})[a] = custo_celula[a]
+
+        self.clusters_refeitos += len(afetados)
+
+    def _calcular_internas(self, clusters):
+        """Custo mínimo entre cada par de nós de cada cluster, sem sair do cluster."""
+        tab, t = self.tabuleiro, self.tamanho
+        largura = tab.largura
+        # grade de custos recortada em blocos [cy, cx, y local, x local]; fora do tabuleiro = 0
+        blocos = np.zeros((self.linhas * t, self.colunas * t), dtype=np.int32)
+        blocos[:tab.altura, :largura] = custos_entrada(tab)
+        blocos = blocos.reshape(self.linhas, t, self.colunas, t).transpose(0, 2, 1, 3)
+
+        grupos = [(c, sorted(self.nos_cluster[c])) for c in clusters if self.nos_cluster[c]]
+        while grupos:
+            lote, total = [], 0
+            while grupos and (not lote or total + len(grupos[-1][1]) <= LOTE_NOS):
+                lote.append(grupos.pop()); total += len(lote[-1][1])
+            cys, cxs, locais = [], [], []
+            for (cx, cy), nos in lote:
+                for u in nos:
+                    y, x = divmod(u, largura)
+                    cys.append(cy); cxs.append(cx); locais.append((y - cy * t) * t + x - cx * t)
+            fontes = np.arange(total, dtype=np.int64) * (t * t) + np.array(locais)
+            dist = frente_de_onda(blocos[cys, cxs], fontes).reshape(total, t * t)
+            k = 0
+            for _, nos in lote:
+                m = len(nos)
+                sub = dist[k:k + m][:, locais[k:k + m]].tolist()
+                for i, u in enumerate(nos):
+                    self.arestas.setdefault(u, {}).update(
+                        (v, sub[i][j]) for j, v in enumerate(nos) if j != i and sub[i][j] < INALCANCAVEL)
+                k += m
+
+    # === CONSULTA ===
+    def caminho(self, origem, destino) -> List[Tuple[int, int]]:
+        """Caminho de `origem` a `destino` ([] se não houver), nas regras do SistemaMovimento."""
+        tab = self.tabuleiro
+        if not (tab.dentro(origem) and tab.dentro(destino)):
+            return []
+        if origem == destino:
+            return [destino]
+        grafo = tab.grafo
+        s, t = grafo.id_de(origem), grafo.id_de(destino)
+        cs, ct = self.cluster_de(s), self.cluster_de(t)
+        if cs == ct:
+            return a_estrela(tab, origem, destino)
+        bloqueadas = celulas_bloqueadas(tab)
+        if grafo.custo_celula[t] == 0 or t in bloqueadas:
+            return []
+        self.atualizar()
+
+        dist_s, pred_s = _dijkstra_area(grafo, s, self.area_cluster(cs), bloqueadas)
+        dist_t, prox_t = _dijkstra_area(grafo, t, self.area_cluster(ct), bloqueadas, reverso=True)
+        ate_meta = {u: dist_t[u] for u in self.nos_cluster.get(ct, ()) if u in dist_t}
+
+        # A* no grafo abstrato; nó especial _META fecha a busca
+        largura, cmin = grafo.largura, grafo.custo_minimo
+        ty, tx = divmod(t, largura)
+
+        def h(u):
+            uy, ux = divmod(u, largura)
+            return (abs(ux - tx) + abs(uy - ty)) * cmin
+
+        g = {}; pai = {}; heap = []
+        for u in self.nos_cluster.get(cs, ()):
+            if u in dist_s:
+                g[u] = dist_s[u]; pai[u] = None; heappush(heap, (g[u] + h(u), g[u], u))
+        fechados = set()
+        while heap:
+            _, d, u = heappop(heap)
+            if u == _META: break
+            if u in fechados: continue
+            fechados.add(u)
+            if u in ate_meta:
+                novo = d + ate_meta[u]
+                if novo < g.get(_META, novo + 1):
+                    g[_META] = novo; pai[_META] = u; heappush(heap, (novo, novo, _META))
+            for v, c in self.arestas.get(u, {}).items():
+                novo = d + c
+                if novo < g.get(v, novo + 1):
+                    g[v] = novo; pai[v] = u; heappush(heap, (novo + h(v), novo, v))
+        if _META not in pai:
+            return []
+
+        abstrato = []
+        u = pai[_META]
+        while u is not None:
+            abstrato.append(u); u = pai[u]
+        abstrato.reverse()
+
+        # refinamento: início -> 1º nó, nó -> nó, último nó -> destino
+        caminho = reconstruir_caminho(grafo, pred_s, abstrato[0])
+        for a, b in zip(abstrato, abstrato[1:]):
+            ca = self.cluster_de(a)
+            if ca == self.cluster_de(b):
+                _, pred = _dijkstra_area(grafo, a, self.area_cluster(ca), bloqueadas, alvo=b)
+                caminho += reconstruir_caminho(grafo, pred, b)[1:]
+            else:
+                caminho.append(grafo.posicao_de(b))
+        u = prox_t[abstrato[-1]]
+        while u != -1:
+            caminho.append(grafo.posicao_de(u)); u = prox_t[u]
+        return caminho
@@ -0,0 +1,230 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, NamedTuple
+
+import numpy as np
+
+from core.enums import TipoTerreno, CODIGO_TERRENO
+from model.ruido import ruido_fractal
+
+PLANICIE = CODIGO_TERRENO[TipoTerreno.PLANICIE]
+FLORESTA = CODIGO_TERRENO[TipoTerreno.FLORESTA]
+MONTANHA = CODIGO_TERRENO[TipoTerreno.MONTANHA]
+AGUA = CODIGO_TERRENO[TipoTerreno.AGUA]
+MASMORRA = CODIGO_TERRENO[TipoTerreno.MASMORRA]
+LAVA = CODIGO_TERRENO[TipoTerreno.LAVA]
+GELO = CODIGO_TERRENO[TipoTerreno.GELO]
+
+MAPA_PADRAO = 4
+
+
+class GeradorMapa(NamedTuple):
+    mapa_id: int
+    nome: str
+    funcao: Callable
+    versao: int
+    # busca padrão de SistemaMovimento.calcular_caminho neste mapa: "a_estrela" ou "saltos"
+    modo_caminho: str = "a_estrela"
+
+
+# mapa_id -> GeradorMapa; preenchido pelo decorador registrar_mapa
+MAPAS: Dict[int, GeradorMapa] = {}
+
+
+def registrar_mapa(mapa_id: int, nome: str, versao: int = 1, modo_caminho: str = "a_estrela"):
+    """Registra um gerador `f(x, y, largura, altura, rng, seed) -> códigos uint8`.
+
+    `x` e `y` são matrizes [y, x] com as coordenadas absolutas de cada posição,
+    então o mesmo gerador serve para o tabuleiro inteiro ou só um recorte dele.
+    `rng` é próprio do recorte; `seed` é a semente do mapa inteiro (use-a para
+    ruído que precisa casar entre recortes vizinhos).
+    Aumente `versao` sempre que a saída do gerador mudar. Mapas dominados por
+    um só terreno ganham com `modo_caminho="saltos"` (ver model.saltos).
+    """
+    def decorador(funcao):
+        MAPAS[mapa_id] = GeradorMapa(mapa_id, nome, funcao, versao, modo_caminho)
+        return funcao
+    return decorador
+
+
+def gerar_terreno(mapa_id: int, largura: int, altura: int, seed: int,
+                  x0: int = 0, y0: int = 0, w: int = None, h: int = None) -> np.ndarray:
+    """Roda só o gerador escolhido e devolve os códigos [y, x] do recorte pedido.
+
+    `seed` pode ser um int ou uma tupla de ints (o Tabuleiro em chunks usa
+    (seed, cx, cy) para que cada chunk seja reproduzível isoladamente).
+    """
+    gerador = MAPAS.get(mapa_id) or MAPAS[MAPA_PADRAO]
+    w = largura if w is None else w
+    h = altura if h is None else h
+    y, x = np.mgrid[y0:y0 + h, x0:x0 + w]
+    rng = np.random.default_rng(seed)
+    semente_mapa = seed[0] if isinstance(seed, tuple) else seed
+    return gerador.funcao(x, y, largura, altura, rng, semente_mapa).astype(np.uint8, copy=False)
+
+
+def _gerar_para_lote(args):
+    return gerar_terreno(*args)
+
+
+def gerar_lote(mapa_id: int, seeds, largura: int, altura: int, processos: int = None) -> np.ndarray:
+    """Gera um mapa por semente, distribuindo o trabalho num pool de processos.
+
+    Devolve uma matriz (len(seeds), altura, largura) de códigos de terreno.
+    `processos=None` usa todos os núcleos; `processos=1` roda no próprio processo.
+    """
+    seeds = list(seeds)
+    saida = np.empty((len(seeds), altura, largura), dtype=np.uint8)
+    tarefas = [(mapa_id, largura, altura, seed) for seed in seeds]
+    processos = processos or os.cpu_count() or 1
+    if processos == 1 or len(seeds) < 2:
+        for i, tarefa in enumerate(tarefas):
+            saida[i] = _gerar_para_lote(tarefa)
+        return saida
+    lote = max(1, len(tarefas) // (processos * 4))
+    with ProcessPoolExecutor(max_workers=processos) as pool:
+        for i, terreno in enumerate(pool.map(_gerar_para_lote, tarefas, chunksize=lote)):
+            saida[i] = terreno
+    return saida
+
+
+def _borda(x, y, largura, altura):
+    return (x == 0) | (y == 0) | (x == largura - 1) | (y == altura - 1)
+
+
+def _selecionar(condicoes, escolhas, padrao):
+    return np.select(condicoes, escolhas, default=padrao).astype(np.uint8)
+
+
+# === MAPAS PADRÕES ===
+@registrar_mapa(1, "Arquipélago")
+def _mapa_ilhas(x, y, largura, altura, rng, seed):
+    return _selecionar(
+        [_borda(x, y, largura, altura), (x + y) % 5 == 0, (x * y) % 7 == 0],
+        [AGUA, MONTANHA, FLORESTA], PLANICIE
+    )
+
+
+@registrar_mapa(2, "Cordilheiras")
+def _mapa_montanhoso(x, y, largura, altura, rng, seed):
+    return _selecionar(
+        [y % 4 == 0, x % 6 == 0,
+         (x < 2) | (y < 2) | (x > largura - 3) | (y > altura - 3)],
+        [MONTANHA, FLORESTA, AGUA], PLANICIE
+    )
+
+
+@registrar_mapa(3, "Floresta Densa")
+def _mapa_forestado(x, y, largura, altura, rng, seed):
+    return _selecionar(
+        [((x % 3 == 0) & (y % 2 == 0)) | ((x + y) % 4 == 0), (x + y) % 10 == 0],
+        [FLORESTA, MONTANHA], PLANICIE
+    )
+
+
+@registrar_mapa(4, "Reino Central")
+def _mapa_misto(x, y, largura, altura, rng, seed):
+    r = rng.random(x.shape)
+    return _selecionar(
+        [_borda(x, y, largura, altura), r < 0.10, r < 0.25, r < 0.45],
+        [AGUA, AGUA, MONTANHA, FLORESTA], PLANICIE
+    )
+
+
+# === MAPAS EXTRAS (5–15) ===
+@registrar_mapa(5, "Caos Total")
+def _mapa_caos_total(x, y, largura, altura, rng, seed):
+    return rng.integers(0, len(CODIGO_TERRENO), size=x.shape, dtype=np.uint8)
+
+
+@registrar_mapa(6, "Deserto", modo_caminho="saltos")
+def _mapa_deserto(x, y, largura, altura, rng, seed):
+    r = rng.random(x.shape)
+    return _selecionar(
+        [_borda(x, y, largura, altura), r < 0.05, r < 0.15],
+        [MONTANHA, AGUA, FLORESTA], PLANICIE
+    )
+
+
+@registrar_mapa(7, "Caverna")
+def _mapa_caverna(x, y, largura, altura, rng, seed):
+    r = rng.random(x.shape)
+    return _selecionar([(x % 7 == 0) | (y % 5 == 0), r < 0.1], [MONTANHA, AGUA], MASMORRA)
+
+
+@registrar_mapa(8, "Ruínas Antigas")
+def _mapa_ruinas(x, y, largura, altura, rng, seed):
+    r = rng.random(x.shape)
+    return _selecionar([(x + y) % 6 == 0, r < 0.1], [MONTANHA, FLORESTA], PLANICIE)
+
+
+@registrar_mapa(9, "Vulcão")
+def _mapa_vulcao(x, y, largura, altura, rng, seed):
+    dist = np.abs(x - largura // 2) + np.abs(y - altura // 2)
+    r = rng.random(x.shape)
+    return _selecionar([dist < 3, dist < 6, r < 0.1], [MONTANHA, AGUA, FLORESTA], PLANICIE)
+
+
+@registrar_mapa(10, "Pântano")
+def _mapa_pantano(x, y, largura, altura, rng, seed):
+    r = rng.random(x.shape)
+    return _selecionar([r < 0.15, r < 0.35], [AGUA, FLORESTA], PLANICIE)
+
+
+@registrar_mapa(11, "Terras Geladas")
+def _mapa_gelado(x, y, largura, altura, rng, seed):
+    r = rng.random(x.shape)
+    return _selecionar([(x % 5 == 0) | (y % 7 == 0), r < 0.1], [MONTANHA, AGUA], PLANICIE)
+
+
+@registrar_mapa(12, "Planície Real", modo_caminho="saltos")
+def _mapa_planicie_real(x, y, largura, altura, rng, seed):
+    r1, r2 = rng.random((2,) + x.shape)
+    return _selecionar([r1 < 0.05, r2 < 0.15], [MONTANHA, FLORESTA], PLANICIE)
+
+
+@registrar_mapa(13, "Cidade Antiga")
+def _mapa_cidade_antiga(x, y, largura, altura, rng, seed):
+    r = rng.random(x.shape)
+    return _selecionar(
+        [(x % 6 == 0) | (y % 6 == 0), (x + y) % 9 == 0, r < 0.1],
+        [AGUA, MONTANHA, FLORESTA], PLANICIE
+    )
+
+
+@registrar_mapa(14, "Campos de Lava")
+def _mapa_lava(x, y, largura, altura, rng, seed):
+    r1, r2, r3 = rng.random((3,) + x.shape)
+    return _selecionar(
+        [_borda(x, y, largura, altura), r1 < 0.15, r2 < 0.25, r3 < 0.3],
+        [MONTANHA, LAVA, MASMORRA, FLORESTA], PLANICIE
+    )
+
+
+@registrar_mapa(15, "Fortaleza de Gelo")
+def _mapa_nevado(x, y, largura, altura, rng, seed):
+    r1, r2, r3 = rng.random((3,) + x.shape)
+    return _selecionar(
+        [_borda(x, y, largura, altura), r1 < 0.20, r2 < 0.30, r3 < 0.35],
+        [MONTANHA, GELO, AGUA, FLORESTA], PLANICIE
+    )
+
+
+# === MAPAS PROCEDURAIS ===
+@registrar_mapa(16, "Terras Procedurais")
+def _mapa_procedural(x, y, largura, altura, rng, seed):
+    """Biomas por limiares de três campos de ruído: altitude, umidade e temperatura."""
+    escala = max(8.0, min(largura, altura) / 2.5)
+    altitude = ruido_fractal(x, y, seed, escala=escala, oitavas=4)
+    umidade = ruido_fractal(x, y, seed + 1, escala=escala * 0.8, oitavas=3)
+    temperatura = ruido_fractal(x, y, seed + 2, escala=escala * 1.5, oitavas=2)
+    ruinas = ruido_fractal(x, y, seed + 3, escala=4.0, oitavas=1)
+    return _selecionar(
+        [altitude < 0.36,
+         altitude > 0.66,
+         (temperatura > 0.62) & (altitude > 0.52),
+         temperatura < 0.36,
+         ruinas > 0.86,
+         umidade > 0.55],
+        [AGUA, MONTANHA, LAVA, GELO, MASMORRA, FLORESTA], PLANICIE
+    )
@@ -0,0 +1,438 @@
+"""Motor de regras do jogo, sem pygame.
+
+Guarda o tabuleiro, os personagens, a ordem dos turnos, a fase, os itens, as
+cartas e as batalhas. Cada jogada é uma ação passada para `step`, que aplica
+as regras e devolve os eventos gerados. O GameController só traduz a entrada
+em ações e anima os eventos; simulações chamam `step` direto, na velocidade
+da máquina:
+
+    motor = MotorJogo(Tabuleiro(43, 25, mapa_id=12, seed=1), seed=1)
+    while not motor.jogo_finalizado:
+        motor.step(motor.acoes_validas()[0])
+
+Ações (tuplas; o primeiro elemento é o tipo):
+    ("selecionar", personagem)  troca o personagem ativo
+    ("rolar",)                  rola o dado de movimento (fase "selecao")
+    ("mover", (x, y))           anda até uma célula alcançável (fase "movimento")
+    ("encerrar_movimento",)     passa para a fase "acao"
+    ("coletar",)                usa o item da célula do personagem (fase "acao")
+    ("habilidade",)             habilidade da classe (fase "acao")
+    ("passar",)                 encerra o turno (fase "acao")
+    ("encerrar_turno",)         encerra o turno em qualquer fase (ex.: tempo esgotado)
+Ações fora da fase certa são ignoradas.
+"""
+from typing import Callable, List, NamedTuple
+
+import numpy as np
+
+from core.aleatorio import ServicoAleatorio
+from core.constants import TURNO_DUR_MS
+from core.enums import TipoItem, ClassePersonagem
+from model.arquivo_mapa import TIPOS_ITEM
+from model.cartas import BARALHO, SistemaCartas
+from model.characters import Jogador, Personagem
+from model.habilidades import SistemaHabilidades
+from model.items import Tesouro, Armadilha, Vida, Carta
+from model.movement import SistemaMovimento
+
+PROB_VIDA = 0.10
+PROB_TESOURO = 0.30
+PROB_ARMADILHA = 0.30
+PROB_CARTA = 0.50
+# itens do início da partida: cartas com esta chance, o resto armadilhas
+PROB_CARTA_INICIAL = 0.50
+TOTAL_ITENS = 10
+TROFEUS_VITORIA = 5
+
+
+class ProbabilidadesItens(NamedTuple):
+    """Chance de cada item em repor_itens; o que sobra de 1 vira armadilha.
+
+    Os itens iniciais (_gerar_itens) não usam estas chances: seguem a
+    distribuição original do jogo, metade cartas e metade armadilhas.
+    """
+    vida: float = PROB_VIDA
+    tesouro: float = PROB_TESOURO
+    carta: float = PROB_CARTA
+
+
+PROBABILIDADES = ProbabilidadesItens()
+
+
+class Evento(NamedTuple):
+    """Algo que a interface pode querer mostrar: tipo + dados do acontecimento.
+
+    Tipos: "dado", "fase", "selecao", "movimento", "batalha", "item", "carta",
+    "morte", "vitoria", "turno" e "fim".
+    """
+    tipo: str
+    dados: dict
+
+
+class RegistroMensagens:
+    """Mensagens ao jogador sem tela: guarda (texto, cor, duração) em `mensagens`."""
+
+    def __init__(self):
+        self.mensagens = []
+
+    def add(self, texto, cor=(255, 255, 255), duracao_ms=1800):
+        self.mensagens.append((str(texto), cor, duracao_ms))
+
+
+def contar_trofeus(personagem) -> int:
+    return sum(1 for i in personagem.inventario if getattr(i, 'tipo', None) == TipoItem.TESOURO)
+
+
+class MotorJogo:
+    """Estado e regras de uma partida.
+
+    `msg` recebe as mensagens ao jogador (qualquer objeto com `add`, como o
+    Mensageiro da interface). `relogio` dá o tempo em ms para as recargas de
+    habilidade; a interface passa pygame.time.get_ticks, e sem ele vale o
+    relógio lógico por turnos (_relogio_turnos). `probabilidades`
+    troca as chances dos itens repostos (PROBABILIDADES por padrão).
+    """
+
+    def __init__(self, tabuleiro, seed: int = None, msg=None, relogio: Callable[[], float] = None,
+                 probabilidades: ProbabilidadesItens = None):
+        self.tabuleiro = tabuleiro
+        self.probabilidades = probabilidades or PROBABILIDADES
+        # fluxos "turnos", "itens", "cartas", "dados" e "batalha" (ver core.aleatorio)
+        self.aleatorio = ServicoAleatorio(seed)
+        self.msg = msg if msg is not None else RegistroMensagens()
+        self.relogio = relogio or self._relogio_turnos
+
+        self.jogador = Jogador("Jogador")
+        self.sistema_movimento = SistemaMovimento(self.aleatorio)
+        self.habilidades = SistemaHabilidades(self)
+        self.cartas = SistemaCartas(self)
+        self.turno_atual = 1
+        self.fase_atual = "selecao"
+        self.personagem_selecionado = None
+        self.ultimo_resultado_dado = 0
+        self.jogo_finalizado = False
+        self.vencedor = None
+        self.eventos: List[Evento] = []
+
+        self._inicializar_jogo()
+
+    # === API ===
+    def step(self, acao) -> List[Evento]:
+        """Aplica `acao` e devolve os eventos pendentes (os dela e os anteriores não lidos)."""
+        if not self.jogo_finalizado:
+            tipo, *args = acao
+            metodo = self._ACOES.get(tipo)
+            if metodo is None:
+                raise ValueError(f"Ação desconhecida: {tipo!r}")
+            metodo(self, *args)
+            self._verificar_mortes()
+            self._verificar_vitoria()
+            self._verificar_transicoes()
+        return self.coletar_eventos()
+
+    def coletar_eventos(self) -> List[Evento]:
+        eventos, self.eventos = self.eventos, []
+        return eventos
+
+    def acoes_validas(self) -> list:
+        """Ações que têm efeito agora (sem "selecionar" e "encerrar_turno", sempre aceitas)."""
+        p = self.personagem_selecionado
+        if self.jogo_finalizado or p is None:
+            return []
+        if self.fase_atual == "selecao":
+            return [] if p.rolou_dados else [("rolar",)]
+        if self.fase_atual == "movimento":
+            alcance = self.sistema_movimento.posicoes_alcancaveis.get(p, ())
+            return [("mover", pos) for pos in alcance] + [("encerrar_movimento",)]
+        acoes = [("habilidade",), ("passar",)]
+        if self.tabuleiro.get_celula(p.posicao).itens:
+            acoes.insert(0, ("coletar",))
+        return acoes
+
+    def _relogio_turnos(self) -> float:
+        """Relógio lógico (padrão sem interface): cada turno vale TURNO_DUR_MS,
+        a duração máxima de um turno na tela. Não depende da hora da máquina,
+        então a mesma seed repete a partida."""
+        return (self.turno_atual - 1) * TURNO_DUR_MS
+
+    def _emitir(self, tipo_evento, **dados):
+        self.eventos.append(Evento(tipo_evento, dados))
+
+    # === SETUP ===
+    def _posicoes_iniciais_borda(self):
+        midx = self.tabuleiro.largura // 2
+        midy = self.tabuleiro.altura // 2
+        return [
+            (0, midy),
+            (self.tabuleiro.largura - 1, midy),
+            (midx, 0),
+            (midx, self.tabuleiro.altura - 1)
+        ]
+
+    def _posicoes_iniciais_seguras(self):
+        gravadas = [p for p in self.tabuleiro.posicoes_iniciais if self.tabuleiro.esta_livre(p)]
+        if len(gravadas) >= 4:
+            return gravadas[:4]
+        alvos = self._posicoes_iniciais_borda()
+        seguras = []
+        for (x, y) in alvos:
+            dx, dy = 0, 0
+            if x == 0: dx = 1
+            elif x == self.tabuleiro.largura - 1: dx = -1
+            elif y == 0: dy = 1
+            elif y == self.tabuleiro.altura - 1: dy = -1
+            cx, cy = x, y
+            for _ in range(max(self.tabuleiro.largura, self.tabuleiro.altura)):
+                if self.tabuleiro.esta_livre((cx, cy)):
+                    seguras.append((cx, cy))
+                    break
+                cx += dx
+                cy += dy
+                if cx < 0 or cy < 0 or cx >= self.tabuleiro.largura or cy >= self.tabuleiro.altura:
+                    break
+        while len(seguras) < 4:
+            seguras.append((self.tabuleiro.largura // 2, self.tabuleiro.altura // 2))
+        return seguras
+
+    def _inicializar_jogo(self):
+        posicoes_iniciais = self._posicoes_iniciais_seguras()
+        classes = [
+            ClassePersonagem.GUERREIRO,
+            ClassePersonagem.MAGO,
+            ClassePersonagem.LADINO,
+            ClassePersonagem.CLERIGO
+        ]
+
+        for i, (pos, classe) in enumerate(zip(posicoes_iniciais, classes)):
+            p = Personagem(f"Herói {i + 1}", pos, classe)
+            p.vida_maxima = 100
+            p.vida_atual = 100
+            p.velocidade = 3
+            p.controller = self
+            # cada herói recebe o bônus da sua classe; no jogo antigo só o último
+            # criado (o Clérigo) recebia, então Guerreiro, Mago e Ladino ficaram mais fortes
+            self.habilidades.aplicar_bonus_iniciais(p)
+            self.jogador.adicionar_personagem(p)
+            cel = self.tabuleiro.get_celula(pos)
+            if cel:
+                cel.adicionar_ocupante(p)
+
+        self.ordem_turnos = self.jogador.personagens[:]
+        self.aleatorio.fluxo("turnos").shuffle(self.ordem_turnos)
+        self.indice_turno = 0
+        self.personagem_selecionado = self.ordem_turnos[self.indice_turno]
+
+        self._gerar_itens()
+        self._emitir("turno", personagem=self.personagem_selecionado)
+
+    # === ITENS ===
+    def _gerar_itens(self):
+        if self.tabuleiro.camada_itens is not None:
+            self._carregar_itens_do_mapa()
+            return
+        # distribuição inicial própria, a original do jogo (ver PROB_CARTA_INICIAL);
+        # as `probabilidades` só valem para repor_itens
+        rng = self.aleatorio.fluxo("itens")
+        for _ in range(TOTAL_ITENS):
+            pos = self.tabuleiro.sortear_posicao_livre(rng, sem_itens=True, sem_borda=True)
+            if pos is None:
+                break
+            if rng.random() < PROB_CARTA_INICIAL:
+                item = Carta("📜 Carta Misteriosa", pos, self)
+            else:
+                item = Armadilha("💀 Armadilha", pos, 20)
+            self.tabuleiro.adicionar_item(pos, item)
+
+    def _carregar_itens_do_mapa(self):
+        """Instancia os itens gravados na camada de itens de um .gpmap."""
+        camada = self.tabuleiro.camada_itens
+        ys, xs = np.nonzero(camada)
+        for x, y, codigo in zip(xs.tolist(), ys.tolist(), camada[ys, xs].tolist()):
+            tipo = TIPOS_ITEM[codigo - 1]
+            pos = (x, y)
+            if tipo == TipoItem.CARTA:
+                item = Carta("📜 Carta Misteriosa", pos, self)
+            elif tipo == TipoItem.VIDA:
+                item = Vida("❤️ Poção de Vida", pos, vida=20)
+            elif tipo == TipoItem.TESOURO:
+                item = Tesouro("🏆 Tesouro", pos, 50)
+            else:
+                item = Armadilha("💀 Armadilha", pos, 20)
+            self.tabuleiro.adicionar_item(pos, item)
+
+    def repor_itens(self):
+        """Sorteia itens novos (pelas `probabilidades`) até haver TOTAL_ITENS no tabuleiro."""
+        itens = self.tabuleiro.total_itens
+        rng = self.aleatorio.fluxo("itens")
+        pr = self.probabilidades
+        while itens < TOTAL_ITENS:
+            pos = self.tabuleiro.sortear_posicao_livre(rng, sem_itens=True, sem_borda=True)
+            if pos is None:
+                break
+            rnd = rng.random()
+            if rnd < pr.vida:
+                item = Vida("❤️ Poção de Vida", pos, vida=20)
+            elif rnd < pr.vida + pr.tesouro:
+                item = Tesouro("🏆 Troféu", pos, 50)
+            elif rnd < pr.vida + pr.tesouro + pr.carta:
+                item = Carta("Carta Misteriosa", pos, self)
+            else:
+                item = Armadilha("💀 Armadilha", pos, 20)
+            self.tabuleiro.adicionar_item(pos, item)
+            itens += 1
+
+    def sortear_carta(self, personagem):
+        """Sorteia uma carta do BARALHO e aplica o efeito no personagem."""
+        tipo, descricao = self.aleatorio.fluxo("cartas").choice(BARALHO)
+        self._emitir("carta", personagem=personagem, tipo=tipo, descricao=descricao)
+        self.cartas.aplicar_efeito(personagem, descricao)
+
+    # === AÇÕES ===
+    def _selecionar(self, personagem):
+        if personagem in self.jogador.personagens and personagem.esta_vivo():
+            self.personagem_selecionado = personagem
+            self.msg.add(f"{personagem.nome} selecionado", (255, 255, 255))
+            self._emitir("selecao", personagem=personagem)
+
+    def _rolar(self):
+        p = self.personagem_selecionado
+        if self.fase_atual != "selecao" or not p or p.rolou_dados:
+            return
+        resultado = self.sistema_movimento.rolar_movimento(p)
+        self.ultimo_resultado_dado = resultado
+        p.rolou_dados = True
+        self.sistema_movimento.calcular_alcance(self.tabuleiro, p)
+        self.msg.add(f"🎲 Dado: {resultado} ponto(s) de movimento", (255, 255, 0))
+        self._emitir("dado", personagem=p, valor=resultado)
+
+    def _mover(self, destino):
+        p = self.personagem_selecionado
+        sm = self.sistema_movimento
+        if self.fase_atual != "movimento" or not p or destino not in sm.posicoes_alcancaveis.get(p, ()):
+            return
+        if not sm.mover_personagem(self.tabuleiro, p, destino):
+            return
+        if sm.batalha_em_andamento:
+            self._emitir("batalha", **sm.batalha_em_andamento)
+            sm.batalha_em_andamento = None
+        self._emitir("movimento", personagem=p, destino=destino,
+                     restante=sm.movimentos_disponiveis.get(p, 0))
+
+    def _encerrar_movimento(self):
+        if self.fase_atual == "movimento" and self.personagem_selecionado:
+            self._mudar_fase("acao", "➡ Fase de AÇÃO")
+
+    def _coletar(self):
+        p = self.personagem_selecionado
+        if self.fase_atual != "acao" or not p or not p.esta_vivo():
+            return
+        cel = self.tabuleiro.get_celula(p.posicao)
+        for item in list(cel.itens):
+            # Carta misteriosa: sorteia e aplica, não vai para o inventário
+            if item.tipo == TipoItem.CARTA:
+                cel.remover_item(item)
+                item.usar(p)
+                return
+
+            # Itens padrão
+            if item.usar(p):
+                cel.remover_item(item)
+                p.inventario.append(item)
+                if item.tipo == TipoItem.TESOURO:
+                    self.msg.add("🏆 Tesouro coletado!", (255, 215, 0))
+                elif item.tipo == TipoItem.VIDA:
+                    self.msg.add(f"❤️ +{getattr(item,'vida',0)} de Vida!", (0, 200, 0))
+                else:
+                    self.msg.add(f"💥 Armadilha! -{getattr(item,'dano',0)} HP", (255, 100, 100))
+                self._emitir("item", personagem=p, item=item)
+                self.repor_itens()
+                return
+
+    def _habilidade(self):
+        p = self.personagem_selecionado
+        if self.fase_atual == "acao" and p:
+            self.habilidades.usar_habilidade(p)
+
+    def _passar(self):
+        p = self.personagem_selecionado
+        if self.fase_atual == "acao" and p:
+            self.msg.add(f" {p.nome} passou o turno.", (200, 200, 200))
+            self.finalizar_turno()
+
+    def _encerrar_turno(self):
+        self.finalizar_turno()
+
+    _ACOES = {
+        "selecionar": _selecionar,
+        "rolar": _rolar,
+        "mover": _mover,
+        "encerrar_movimento": _encerrar_movimento,
+        "coletar": _coletar,
+        "habilidade": _habilidade,
+        "passar": _passar,
+        "encerrar_turno": _encerrar_turno,
+    }
+
+    # === TURNOS / FASES ===
+    def _mudar_fase(self, fase, texto):
+        self.fase_atual = fase
+        self.msg.add(texto, (255, 255, 255))
+        self._emitir("fase", fase=fase)
+
+    def _verificar_transicoes(self):
+        if self.jogo_finalizado:
+            return
+        p = self.personagem_selecionado
+        if self.fase_atual == 'selecao' and p and getattr(p, "rolou_dados", False):
+            self._mudar_fase('movimento', " Fase de MOVIMENTO")
+        elif (self.fase_atual == 'movimento' and p
+              and self.sistema_movimento.movimentos_disponiveis.get(p, 1) <= 0):
+            self._mudar_fase('acao', "⚔️ Fase de AÇÃO")
+
+    def _verificar_mortes(self):
+        for p in list(self.jogador.personagens):
+            if p.esta_vivo():
+                continue
+            cel = self.tabuleiro.get_celula(p.posicao)
+            if cel and p in cel.ocupantes:
+                cel.remover_ocupante(p)
+            self.jogador.remover_personagem(p)
+            self.msg.add(f"{p.nome} foi derrotado", (255, 120, 120), duracao_ms=2400)
+            self._emitir("morte", personagem=p)
+            if p is self.personagem_selecionado:
+                self.finalizar_turno()
+
+    def _verificar_vitoria(self):
+        if self.jogo_finalizado:
+            return
+        for p in self.jogador.personagens:
+            if contar_trofeus(p) >= TROFEUS_VITORIA:
+                self.jogo_finalizado = True
+                self.vencedor = p.nome
+                self.msg.add(f"🏆 Vitória de {self.vencedor}!", (0, 200, 0), duracao_ms=2800)
+                self._emitir("vitoria", personagem=p)
+                return
+
+    def finalizar_turno(self):
+        if self.personagem_selecionado:
+            self.sistema_movimento.resetar_movimento(self.personagem_selecionado)
+            self.personagem_selecionado.resetar_turno()
+        self.ultimo_resultado_dado = 0
+        self.turno_atual += 1
+        self.fase_atual = 'selecao'
+
+        total = len(self.ordem_turnos)
+        for _ in range(total):
+            self.indice_turno = (self.indice_turno + 1) % total
+            prox = self.ordem_turnos[self.indice_turno]
+            if prox.esta_vivo():
+                self.personagem_selecionado = prox
+                break
+        else:
+            self.personagem_selecionado = None
+
+        if self.personagem_selecionado:
+            self._emitir("turno", personagem=self.personagem_selecionado)
+        else:
+            self.jogo_finalizado = True
+            self._emitir("fim")
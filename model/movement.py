@@ -1,60 +1,314 @@
-import random
-from typing import List, Tuple
+from collections import OrderedDict
+from heapq import heappush, heappop
+from typing import Dict, List, NamedTuple, Tuple
+
+import numpy as np
+
+from model.batalha import RODADAS, FACES, DANO_RODADA
 from model.dice import Dado
-from core.enums import TipoTerreno, ClassePersonagem
+from core.aleatorio import ALEATORIO
+from core.enums import ClassePersonagem, TERRENOS
+from core.regras_terreno import REGRAS
+from model.grafo import CUSTO_MINIMO
+
+LIMITE_CACHE_BUSCAS = 256
+# calcular_caminho(..., hierarquico=True) sem limite passa para a busca
+# hierárquica (model.hpa, quase ótima) em tabuleiros a partir desta área, para
+# pares a partir desta distância Manhattan; sem pedir, o caminho é sempre ótimo
+AREA_HIERARQUICA = 128 * 128
+DISTANCIA_HIERARQUICA = 48
+
+
+class Alcance(NamedTuple):
+    """Árvore de alcance: custo mínimo e predecessor por id de célula.
+
+    Vale para (origem, pontos) enquanto nenhuma região dentro de `area`
+    mudar depois de `revisao` (ver Tabuleiro.revisao_area).
+    """
+    origem: Tuple[int, int]
+    pontos: int
+    revisao: int
+    dist: Dict[int, int]
+    pred: Dict[int, int]
+    area: Tuple[int, int, int, int]
+
+
+def area_explorada(grafo, ids) -> Tuple[int, int, int, int]:
+    """Retângulo (x0, y0, x1, y1) das células tocadas por uma busca, mais uma de margem.
+
+    Mudanças fora dele não alteram o resultado: qualquer rota nova teria de
+    sair do conjunto explorado por uma célula vizinha, e essas estão dentro.
+    """
+    arr = np.fromiter(ids, dtype=np.int64, count=len(ids))
+    ys, xs = np.divmod(arr, grafo.largura)
+    return int(xs.min()) - 1, int(ys.min()) - 1, int(xs.max()) + 1, int(ys.max()) + 1
+
+
+def celulas_bloqueadas(tabuleiro) -> set:
+    """Ids das células com mais de um ocupante (ver SistemaMovimento.pode_passar)."""
+    largura = tabuleiro.largura
+    return {y * largura + x for (x, y), ocs in tabuleiro.ocupantes_por_posicao() if len(ocs) > 1}
+
+
+def dijkstra(tabuleiro, origem, limite=float("inf"), dominio=None) -> Alcance:
+    """Custos mínimos a partir de `origem`, parando em `limite` pontos de movimento.
+
+    `dominio` (ids) restringe a busca a um conjunto conhecido de células,
+    usado ao re-enraizar uma árvore depois de um passo.
+    """
+    grafo = tabuleiro.grafo_raio(origem, limite)
+    dist, pred = dijkstra_ids(grafo, celulas_bloqueadas(tabuleiro), grafo.id_de(origem), limite, dominio)
+    return Alcance(origem, limite, tabuleiro.revisao, dist, pred, area_explorada(grafo, dist))
+
+
+def dijkstra_ids(grafo, bloqueadas, s: int, limite=float("inf"), dominio=None):
+    """Núcleo do dijkstra sobre ids de célula: devolve (dist, pred)."""
+    inicio, destinos, custos = grafo.inicio, grafo.destinos, grafo.custos
+    dist = {s: 0}; pred = {s: -1}; heap = [(0, s)]
+    while heap:
+        d, u = heappop(heap)
+        if d > dist[u]: continue  # entrada velha: u já saiu com custo menor
+        for k in range(inicio[u], inicio[u + 1]):
+            v = destinos[k]; novo = d + custos[k]
+            if novo <= limite and novo < dist.get(v, novo + 1) and v not in bloqueadas \
+                    and (dominio is None or v in dominio):
+                dist[v] = novo; pred[v] = u; heappush(heap, (novo, v))
+    return dist, pred
+
+
+def reconstruir_caminho(grafo, pred: Dict[int, int], alvo: int) -> List[Tuple[int, int]]:
+    caminho = []
+    while alvo != -1:
+        caminho.append(grafo.posicao_de(alvo)); alvo = pred[alvo]
+    caminho.reverse(); return caminho
+
+
+def a_estrela(tabuleiro, origem, destino, limite=float("inf")) -> List[Tuple[int, int]]:
+    """Caminho de custo mínimo de `origem` a `destino` ([] se não houver até `limite`).
+
+    Heurística: Manhattan vezes o menor custo de terreno do tabuleiro, que
+    nunca superestima e é consistente, então cada célula sai do heap uma vez.
+    """
+    return _a_estrela(tabuleiro, origem, destino, limite)[0]
+
+
+def _a_estrela(tabuleiro, origem, destino, limite):
+    """Devolve (caminho, custos das células tocadas).
+
+    Em chunks a busca só enxerga os chunks gerados: gera os da caixa entre
+    `origem` e `destino`, com a folga que `limite` permite (um chunk, sem
+    limite), e se um caminho mais barato que o achado pudesse passar por
+    fora dela, amplia a caixa e repete. Sem caminho nem limite, gera tudo.
+    """
+    if not (tabuleiro.dentro(origem) and tabuleiro.dentro(destino)):
+        return [], {}  # id_de não confere limites: (-1, y) viraria outra célula
+    (ox, oy), (dx, dy) = origem, destino
+    if limite == float("inf"):
+        folga = max(tabuleiro.chunk_largura, tabuleiro.chunk_altura)
+    else:
+        folga = _folga(tabuleiro, origem, destino, limite)
+    bloqueadas = celulas_bloqueadas(tabuleiro)
+    while True:
+        grafo = tabuleiro.grafo_area(min(ox, dx) - folga, min(oy, dy) - folga,
+                                     max(ox, dx) + folga, max(oy, dy) + folga)
+        alvo = grafo.id_de(destino)
+        achou, pred, g = a_estrela_ids(grafo, bloqueadas, grafo.id_de(origem), alvo, limite)
+        necessaria = _folga(tabuleiro, origem, destino, g[alvo] if achou else limite)
+        if not tabuleiro.em_chunks or necessaria <= folga:
+            break
+        folga = necessaria
+    return (reconstruir_caminho(grafo, pred, alvo) if achou else []), g
+
+
+def _folga(tabuleiro, origem, destino, custo) -> int:
+    """Quanto um caminho de até `custo` pontos pode se afastar da caixa entre `origem` e `destino`.
+
+    Cada célula p dele tem Manhattan(origem, p) + Manhattan(p, destino) vezes
+    CUSTO_MINIMO <= custo, e cada passo para fora da caixa soma 2 a essa conta.
+    """
+    excesso = custo / CUSTO_MINIMO - (abs(origem[0] - destino[0]) + abs(origem[1] - destino[1]))
+    return int(min(excesso / 2, tabuleiro.largura + tabuleiro.altura)) + 1
+
+
+def a_estrela_ids(grafo, bloqueadas, s: int, alvo: int, limite=float("inf"), fechados=None):
+    """Núcleo do a_estrela sobre ids de célula: devolve (achou, pred, g).
+
+    `fechados` (opcional) recebe os ids expandidos, para medir a busca.
+    """
+    inicio, destinos, custos, largura = grafo.inicio, grafo.destinos, grafo.custos, grafo.largura
+    dy, dx = divmod(alvo, largura); sy, sx = divmod(s, largura); cmin = grafo.custo_minimo
+    g = {s: 0}; pred = {s: -1}
+    if fechados is None: fechados = set()
+    heap = [((abs(sx - dx) + abs(sy - dy)) * cmin, 0, s)]
+    while heap:
+        _, d, u = heappop(heap)
+        if u == alvo: return True, pred, g
+        if u in fechados: continue
+        fechados.add(u)
+        for k in range(inicio[u], inicio[u + 1]):
+            v = destinos[k]; novo = d + custos[k]
+            if novo < g.get(v, novo + 1) and novo <= limite and v not in bloqueadas:
+                g[v] = novo; pred[v] = u
+                vy, vx = divmod(v, largura)
+                h = (abs(vx - dx) + abs(vy - dy)) * cmin
+                if novo + h <= limite:
+                    heappush(heap, (novo + h, novo, v))
+    return False, pred, g
+
+
+class CacheBuscas:
+    """Alcances e caminhos já calculados, válidos até sua área mudar no tabuleiro.
+
+    Cada entrada guarda a revisão em que foi calculada e o retângulo explorado;
+    consultas repetidas dentro de um turno não custam busca enquanto nenhuma
+    região desse retângulo tiver revisão mais nova. LRU limitado por entradas.
+    """
+
+    def __init__(self, limite: int = LIMITE_CACHE_BUSCAS):
+        self.limite = limite
+        self._tabuleiro = None
+        self._custo_minimo = None
+        self._entradas = OrderedDict()
+        self.acertos = 0
+        self.buscas = 0
+
+    def limpar(self):
+        self._entradas.clear()
+
+    def _sincronizar(self, tabuleiro):
+        # tabuleiro novo, ou terreno mais barato que o custo_minimo da heurística do A*:
+        # nada do que está guardado serve (as outras trocas de terreno chegam pelas revisões)
+        custo_minimo = tabuleiro.grafo.custo_minimo
+        if tabuleiro is not self._tabuleiro or custo_minimo != self._custo_minimo:
+            self._tabuleiro = tabuleiro; self._custo_minimo = custo_minimo
+            self._entradas.clear()
+
+    def _obter(self, tabuleiro, chave):
+        self._sincronizar(tabuleiro)
+        entrada = self._entradas.get(chave)
+        if entrada is None: return None
+        revisao, area, valor = entrada
+        if tabuleiro.revisao_area(*area) > revisao:
+            del self._entradas[chave]; return None
+        self._entradas.move_to_end(chave); self.acertos += 1
+        return valor
+
+    def _guardar(self, chave, revisao, area, valor):
+        self._entradas[chave] = (revisao, area, valor)
+        self._entradas.move_to_end(chave)
+        if len(self._entradas) > self.limite:
+            self._entradas.popitem(last=False)
+
+    def guardar_alcance(self, tabuleiro, alcance: Alcance):
+        self._sincronizar(tabuleiro)
+        self._guardar(("alcance", alcance.origem, alcance.pontos), alcance.revisao, alcance.area, alcance)
+
+    def alcance(self, tabuleiro, origem, limite) -> Alcance:
+        alcance = self._obter(tabuleiro, ("alcance", origem, limite))
+        if alcance is None:
+            self.buscas += 1
+            alcance = dijkstra(tabuleiro, origem, limite)
+            self._guardar(("alcance", origem, limite), alcance.revisao, alcance.area, alcance)
+        return alcance
+
+    def caminho(self, tabuleiro, origem, destino, limite=float("inf"), saltos=None) -> List[Tuple[int, int]]:
+        """Caminho ótimo pelo A*, ou pela GradeSaltos `saltos` (model.saltos) se dada."""
+        if not (tabuleiro.dentro(origem) and tabuleiro.dentro(destino)):
+            return []
+        chave = ("caminho", origem, destino, limite)
+        caminho = self._obter(tabuleiro, chave)
+        if caminho is None:
+            self.buscas += 1
+            revisao = tabuleiro.revisao
+            if saltos is not None:
+                caminho, tocadas = saltos.caminho(tabuleiro, origem, destino, limite)
+            else:
+                caminho, tocadas = _a_estrela(tabuleiro, origem, destino, limite)
+            self._guardar(chave, revisao, area_explorada(tabuleiro.grafo, tocadas), caminho)
+        return list(caminho)
+
+
 class SistemaMovimento:
-    def __init__(self):
+    def __init__(self, aleatorio=None):
+        # dados de movimento do fluxo "dados", os de batalha do fluxo "batalha"
+        self.aleatorio = aleatorio or ALEATORIO
         self.movimentos_disponiveis = {}
+        # personagem -> {posição: custo}; iterar dá as posições destacadas
         self.posicoes_alcancaveis = {}
+        self.alcances: Dict[object, Alcance] = {}
+        self.cache = CacheBuscas()
+        self.hierarquico = None
+        self.saltos = None
+        self.batalha_em_andamento = None
         self.caminho_atual = []
         self.personagem_movendo = None
     def rolar_movimento(self, personagem) -> int:
-        pontos_base = Dado.rolar_d6()
+        pontos_base = Dado.rolar_d6(self.aleatorio)
         modificador_velocidade = personagem.velocidade - 3
         if personagem.classe == ClassePersonagem.LADINO: modificador_velocidade += 1
         elif personagem.classe == ClassePersonagem.GUERREIRO:
             if personagem.equipamento.get('armadura'): modificador_velocidade -= 1
         pontos_total = max(1, pontos_base + modificador_velocidade)
         self.movimentos_disponiveis[personagem] = pontos_total; return pontos_total
-    def calcular_alcance(self, tabuleiro, personagem) -> List[Tuple[int,int]]:
-        if personagem not in self.movimentos_disponiveis: return []
-        pontos_mov = self.movimentos_disponiveis[personagem]; posicoes = []
-        origem = personagem.posicao; visitados = set([origem]); fila = [(origem,0)]
-        while fila:
-            pos_atual, custo = fila.pop(0)
-            if custo <= pontos_mov and pos_atual != origem: posicoes.append(pos_atual)
-            if custo < pontos_mov:
-                for viz in tabuleiro.get_vizinhos(pos_atual):
-                    if viz not in visitados:
-                        cel = tabuleiro.get_celula(viz)
-                        if cel and self.pode_passar(cel):
-                            novo = custo + self.calcular_custo_movimento(cel)
-                            if novo <= pontos_mov:
-                                visitados.add(viz); fila.append((viz, novo))
-        self.posicoes_alcancaveis[personagem] = posicoes; return posicoes
+    def calcular_alcance(self, tabuleiro, personagem) -> Dict[Tuple[int,int], int]:
+        if personagem not in self.movimentos_disponiveis: return {}
+        self.obter_alcance(tabuleiro, personagem)
+        return self.posicoes_alcancaveis[personagem]
+    def obter_alcance(self, tabuleiro, personagem):
+        """Árvore de alcance do personagem; só refaz a busca se a área dela mudou."""
+        pontos = self.movimentos_disponiveis.get(personagem)
+        if pontos is None: return None
+        alcance = self.alcances.get(personagem)
+        if (alcance is None or (alcance.origem, alcance.pontos) != (personagem.posicao, pontos)
+                or tabuleiro.revisao_area(*alcance.area) > alcance.revisao):
+            self._guardar_alcance(tabuleiro, personagem, self.cache.alcance(tabuleiro, personagem.posicao, pontos))
+        return self.alcances[personagem]
+    def _guardar_alcance(self, tabuleiro, personagem, alcance):
+        pos_de = tabuleiro.grafo.posicao_de; origem = tabuleiro.grafo.id_de(alcance.origem)
+        self.alcances[personagem] = alcance
+        self.posicoes_alcancaveis[personagem] = {pos_de(i): c for i, c in alcance.dist.items() if i != origem}
+    def _reenraizar(self, tabuleiro, personagem, alcance):
+        """Árvore a partir da nova posição, buscando só dentro da árvore anterior.
+
+        Tudo o que se alcança do destino com os pontos restantes já se alcançava
+        da origem com os pontos cheios (passando pelo destino), então o domínio
+        da busca encolhe a cada passo em vez de cobrir o raio inteiro de novo.
+        """
+        alcance = dijkstra(tabuleiro, personagem.posicao, self.movimentos_disponiveis[personagem], alcance.dist)
+        self.cache.guardar_alcance(tabuleiro, alcance)
+        self._guardar_alcance(tabuleiro, personagem, alcance)
+    def caminho_alcance(self, tabuleiro, personagem, destino) -> List[Tuple[int,int]]:
+        """Caminho de custo mínimo até `destino` lido dos predecessores do último alcance."""
+        if not tabuleiro.dentro(destino): return []  # id_de não confere limites
+        alcance = self.obter_alcance(tabuleiro, personagem); grafo = tabuleiro.grafo
+        if alcance is None: return []
+        i = grafo.id_de(destino)
+        if i not in alcance.pred: return []
+        return reconstruir_caminho(grafo, alcance.pred, i)
         
     
    
     def iniciar_batalha(self, atacante, defensor):
-        print(f"⚔️ BATALHA iniciada entre {atacante.nome} e {defensor.nome}!")
+        d20 = self.aleatorio.bloco("batalha", 1, FACES)
 
-        rodadas = 3
+        rodadas = RODADAS
         resultados = []
+        dados = []
         vitorias_atacante = 0
         vitorias_defensor = 0
 
         for i in range(rodadas):
-            dado1 = random.randint(1, 20)
-            dado2 = random.randint(1, 20)
-            print(f"Rodada {i+1}: {atacante.nome} ({dado1}) vs {defensor.nome} ({dado2})")
+            dado1 = d20.proximo()
+            dado2 = d20.proximo()
+            dados.append((dado1, dado2))
 
             if dado1 > dado2:
                 vitorias_atacante += 1
-                defensor.receber_dano(10)
+                defensor.receber_dano(DANO_RODADA)
                 resultado = f"✅ {atacante.nome} venceu a rodada {i+1}!"
             elif dado2 > dado1:
                 vitorias_defensor += 1
-                atacante.receber_dano(10)
+                atacante.receber_dano(DANO_RODADA)
                 resultado = f"❌ {defensor.nome} venceu a rodada {i+1}!"
             else:
                 resultado = f"🤝 Empate na rodada {i+1}!"
@@ -74,86 +328,93 @@ class SistemaMovimento:
             perdedor = None
             msg_final = "⚔️ A batalha terminou empatada!"
 
-        print(msg_final)
-
     # Armazena detalhes para exibição visual
         self.batalha_em_andamento = {
             "atacante": atacante,
             "defensor": defensor,
             "rodadas": resultados,
+            "dados": dados,
             "vitorias_atacante": vitorias_atacante,
             "vitorias_defensor": vitorias_defensor,
             "vencedor": vencedor,
-            "perdedor": perdedor
+            "perdedor": perdedor,
+            "mensagem": msg_final
         }
 
         
     def pode_passar(self, celula) -> bool:
-        if celula.tipo_terreno == TipoTerreno.AGUA:
+        if not REGRAS.passaveis[celula.codigo_terreno]:
             return False
         # Permitir passar mesmo com 1 ocupante, se for um personagem (para batalha)
         if len(celula.ocupantes) > 1:
             return False
         return True
     def calcular_custo_movimento(self, celula) -> int:
-        custos = {TipoTerreno.PLANICIE:1, TipoTerreno.FLORESTA:2, TipoTerreno.MONTANHA:3, TipoTerreno.MASMORRA:1, TipoTerreno.AGUA:5, TipoTerreno.LAVA: 2, TipoTerreno.GELO: 1 }
-        return custos.get(celula.tipo_terreno,1)
-    def calcular_caminho(self, tabuleiro, origem, destino):
+        return REGRAS.custos[celula.codigo_terreno]
+    def calcular_caminho(self, tabuleiro, origem, destino, limite=float("inf"), hierarquico: bool = False):
+        """Caminho de custo mínimo. Com `hierarquico`, consultas longas em
+        tabuleiros grandes usam o HPA*, mais rápido mas só quase ótimo."""
+        if not (tabuleiro.dentro(origem) and tabuleiro.dentro(destino)): return []
         if origem == destino: return [destino]
-        visitados = set(); fila=[(origem,[origem],0)]
-        while fila:
-            fila.sort(key=lambda x: x[2]+self.distancia_manhattan(x[0], destino))
-            pos, cam, custo = fila.pop(0)
-            if pos == destino: return cam
-            if pos in visitados: continue
-            visitados.add(pos)
-            for viz in tabuleiro.get_vizinhos(pos):
-                if viz not in visitados:
-                    cel = tabuleiro.get_celula(viz)
-                    if cel and self.pode_passar(cel):
-                        novo = custo + self.calcular_custo_movimento(cel)
-                        fila.append((viz, cam+[viz], novo))
-        return []
+        if (hierarquico and limite == float("inf") and tabuleiro.largura * tabuleiro.altura >= AREA_HIERARQUICA
+                and self.distancia_manhattan(origem, destino) >= DISTANCIA_HIERARQUICA):
+            return self._hierarquico(tabuleiro).caminho(origem, destino)
+        # em chunks só o A*: a grade de saltos cobre o tabuleiro inteiro
+        saltos = None
+        if tabuleiro.modo_caminho == "saltos" and not tabuleiro.em_chunks: saltos = self._saltos(tabuleiro)
+        return self.cache.caminho(tabuleiro, origem, destino, limite, saltos)
+    def _saltos(self, tabuleiro):
+        grafo = tabuleiro.grafo_completo
+        if self.saltos is None or self.saltos.grafo is not grafo or self.saltos.versao != grafo.versao:
+            from model.saltos import GradeSaltos
+            self.saltos = GradeSaltos(grafo)
+        return self.saltos
+    def _hierarquico(self, tabuleiro):
+        if self.hierarquico is None or self.hierarquico.tabuleiro is not tabuleiro:
+            from model.hpa import CaminhoHierarquico
+            self.hierarquico = CaminhoHierarquico(tabuleiro)
+        return self.hierarquico
     def distancia_manhattan(self, a, b) -> int: return abs(a[0]-b[0])+abs(a[1]-b[1])
     
     def mover_personagem(self, tabuleiro, personagem, destino) -> bool:
         if personagem not in self.movimentos_disponiveis: return False
-        if destino not in self.posicoes_alcancaveis.get(personagem,[]): return False
-        caminho = self.calcular_caminho(tabuleiro, personagem.posicao, destino)
-        if not caminho: return False
-        custo = 0
-        for i in range(1,len(caminho)):
-            cel = tabuleiro.get_celula(caminho[i]); custo += self.calcular_custo_movimento(cel)
-        if custo > self.movimentos_disponiveis[personagem]: return False
+        alcance = self.obter_alcance(tabuleiro, personagem)
+        # valida antes de mexer em qualquer estado: fora do tabuleiro ou do alcance não anda
+        if not tabuleiro.dentro(destino) or destino not in self.posicoes_alcancaveis.get(personagem, ()):
+            return False
+        caminho = self.caminho_alcance(tabuleiro, personagem, destino)
+        if len(caminho) < 2: return False
+        custo = alcance.dist[tabuleiro.grafo.id_de(destino)]
+        self.caminho_atual = caminho; self.personagem_movendo = personagem
+        # as duas alterações de ocupação deste passo (sair + entrar) somam 2 revisões
+        revisao_esperada = tabuleiro.revisao + 2
         atual = tabuleiro.get_celula(personagem.posicao)
         if atual: atual.remover_ocupante(personagem)
         personagem.posicao = destino
         dest = tabuleiro.get_celula(destino)
         if dest:
+            # o resultado fica em batalha_em_andamento até o MotorJogo repassá-lo como evento
             for oc in dest.ocupantes:
                 if hasattr(oc, 'classe') and oc != personagem:
                     self.iniciar_batalha(personagem, oc)
-                if hasattr(self, "batalha_em_andamento"):
-                    from pygame import event, USEREVENT
-                    event.post(event.Event(USEREVENT, {"tipo": "batalha"}))
-            if dest.tipo_terreno.name in ("LAVA", "GELO"):
-                dano = 5
+            codigo = dest.codigo_terreno; dano = REGRAS.danos[codigo]
+            if dano:
                 personagem.receber_dano(dano)
-                from core.messenger import Mensageiro
-                print(f"{personagem.nome} sofreu {dano} de dano por terreno {dest.tipo_terreno.name}")
-            try:
-                if hasattr(personagem, "controller") and hasattr(personagem.controller, "msg"):
-                    personagem.controller.msg.add(
-                        f"{personagem.nome} sofreu {dano} de dano por {dest.tipo_terreno.name.lower()}!",
-                        (255, 100, 100)
-                    )
-            except Exception:
-                pass
+                nome_terreno = TERRENOS[codigo].name
+                controller = getattr(personagem, "controller", None)
+                if hasattr(controller, "msg"):
+                    controller.msg.add(f"{personagem.nome} sofreu {dano} de dano por {nome_terreno.lower()}!",
+                                       (255, 100, 100))
 
         dest.adicionar_ocupante(personagem)
         self.movimentos_disponiveis[personagem] -= custo
-        self.calcular_alcance(tabuleiro, personagem); return True
+        if tabuleiro.revisao == revisao_esperada:
+            self._reenraizar(tabuleiro, personagem, alcance)
+        else:
+            self.calcular_alcance(tabuleiro, personagem)  # algo mais mudou no tabuleiro
+        return True
     def resetar_movimento(self, personagem):
         self.movimentos_disponiveis.pop(personagem, None); self.posicoes_alcancaveis.pop(personagem, None)
+        self.alcances.pop(personagem, None)
     def resetar_todos_movimentos(self):
-        self.movimentos_disponiveis.clear(); self.posicoes_alcancaveis.clear(); self.caminho_atual.clear(); self.personagem_movendo=None
+        self.movimentos_disponiveis.clear(); self.posicoes_alcancaveis.clear(); self.alcances.clear(); self.cache.limpar(); self.caminho_atual.clear(); self.personagem_movendo=None
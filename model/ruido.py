@@ -0,0 +1,59 @@
+"""Ruído procedural vetorizado (value noise fractal) para geração de mapas.
+
+O valor em cada coordenada depende só de (x, y, seed): não há tabela de
+permutação nem estado, então qualquer recorte do mundo (um chunk, uma
+miniatura) sai idêntico ao mesmo trecho do mapa inteiro.
+"""
+import numpy as np
+
+_M1 = np.uint64(0x9E3779B97F4A7C15)
+_M2 = np.uint64(0xBF58476D1CE4E5B9)
+_M3 = np.uint64(0x94D049BB133111EB)
+
+
+def _hash_unitario(ix: np.ndarray, iy: np.ndarray, seed: int) -> np.ndarray:
+    """Hash inteiro (splitmix64) de cada par de coordenadas, mapeado para [0, 1)."""
+    with np.errstate(over="ignore"):
+        h = ix.astype(np.uint64) * _M1
+        h ^= iy.astype(np.uint64) * _M2 + np.uint64(seed & 0xFFFFFFFFFFFFFFFF)
+        h ^= h >> np.uint64(30)
+        h *= _M2
+        h ^= h >> np.uint64(27)
+        h *= _M3
+        h ^= h >> np.uint64(31)
+    return (h >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+
+def ruido_valor(x: np.ndarray, y: np.ndarray, escala: float, seed: int) -> np.ndarray:
+    """Value noise suave em [0, 1): interpola valores aleatórios de uma grade de passo `escala`."""
+    fx = x / escala
+    fy = y / escala
+    x0 = np.floor(fx).astype(np.int64)
+    y0 = np.floor(fy).astype(np.int64)
+    tx = fx - x0
+    ty = fy - y0
+    # smoothstep: derivada contínua entre os pontos da grade
+    tx = tx * tx * (3.0 - 2.0 * tx)
+    ty = ty * ty * (3.0 - 2.0 * ty)
+
+    v00 = _hash_unitario(x0, y0, seed)
+    v10 = _hash_unitario(x0 + 1, y0, seed)
+    v01 = _hash_unitario(x0, y0 + 1, seed)
+    v11 = _hash_unitario(x0 + 1, y0 + 1, seed)
+    topo = v00 + (v10 - v00) * tx
+    base = v01 + (v11 - v01) * tx
+    return topo + (base - topo) * ty
+
+
+def ruido_fractal(x: np.ndarray, y: np.ndarray, seed: int, escala: float = 16.0,
+                  oitavas: int = 4, persistencia: float = 0.5) -> np.ndarray:
+    """Soma de oitavas de value noise, normalizada para [0, 1)."""
+    total = np.zeros(np.broadcast(x, y).shape, dtype=np.float64)
+    amplitude = 1.0
+    soma_amplitudes = 0.0
+    for oitava in range(oitavas):
+        total += amplitude * ruido_valor(x, y, escala, seed + oitava * 1013)
+        soma_amplitudes += amplitude
+        amplitude *= persistencia
+        escala /= 2.0
+    return total / soma_amplitudes
@@ -0,0 +1,169 @@
+"""Busca com saltos sobre retângulos de custo uniforme (modo de caminho "saltos").
+
+Mapas como Planície Real e Deserto são quase só planície: o A* comum expande
+célula por célula áreas inteiras onde todos os caminhos curtos custam o mesmo.
+Aqui o terreno é dividido (uma vez por grafo) em retângulos de um mesmo
+custo, e dentro deles só a borda é expandida:
+    - de uma célula da borda, o passo para o interior vira um salto em linha
+      reta até a borda oposta, com custo `custo * distância`;
+    - os passos ao longo da borda e para fora do retângulo são os normais.
+Qualquer caminho que cruze o retângulo pode ser trocado por um de mesmo custo
+que anda pela borda e atravessa reto (a distância Manhattan não muda e toda
+célula dentro custa igual), então o resultado continua ótimo. É a poda dos
+jump points adaptada a custos de terreno: as mudanças de custo só acontecem
+entre retângulos, e ali a busca volta a dar passos normais.
+
+Origem ou destino no interior ganham saltos retos até as quatro bordas (e
+entre si, se estiverem no mesmo retângulo). Retângulos com alguma célula
+bloqueada por ocupação são tratados como células comuns naquela busca.
+
+Além disso, empates de f no heap saem pelo maior g: em terreno uniforme há
+muitas rotas de mesmo custo, e seguir a mais adiantada evita abrir todas.
+"""
+from heapq import heappush, heappop
+from typing import List, Tuple
+
+from model.movement import celulas_bloqueadas
+
+# lado mínimo de um retângulo útil: abaixo disso não há interior para pular
+LADO_MINIMO = 3
+
+
+class GradeSaltos:
+    """Retângulos de custo uniforme do grafo, com interior (ao menos 3 x 3)."""
+
+    def __init__(self, grafo):
+        self.grafo = grafo
+        self.versao = grafo.versao  # a grade vale enquanto o grafo não mudar
+        largura, altura, custo = grafo.largura, grafo.altura, grafo.custo_celula
+        # id de célula -> índice do retângulo, -1 fora de qualquer um
+        self.retangulo = [-1] * (largura * altura)
+        self.x0: List[int] = []; self.y0: List[int] = []
+        self.x1: List[int] = []; self.y1: List[int] = []
+        self.custo: List[int] = []
+        livre = [c > 0 for c in custo]
+
+        for i in range(largura * altura):
+            if not livre[i]: continue
+            c = custo[i]; y, x = divmod(i, largura)
+            # maior área começando em (x, y): desce linha a linha encolhendo a largura
+            w = 0
+            while x + w < largura and livre[i + w] and custo[i + w] == c:
+                w += 1
+            melhor = (0, 0, 0); h = 0
+            while w >= LADO_MINIMO and y + h < altura:
+                base = i + h * largura; k = 0
+                while k < w and livre[base + k] and custo[base + k] == c:
+                    k += 1
+                if k < LADO_MINIMO: break
+                w = k; h += 1
+                if h >= LADO_MINIMO and w * h > melhor[0]:
+                    melhor = (w * h, w, h)
+            _, w, h = melhor
+            if not w:
+                livre[i] = False
+                continue
+            r = len(self.custo)
+            for yy in range(y, y + h):
+                base = yy * largura + x
+                self.retangulo[base:base + w] = [r] * w
+                livre[base:base + w] = [False] * w
+            self.x0.append(x); self.y0.append(y)
+            self.x1.append(x + w - 1); self.y1.append(y + h - 1)
+            self.custo.append(c)
+
+    def caminho(self, tabuleiro, origem, destino, limite=float("inf")):
+        """Devolve (caminho, células tocadas), como movement._a_estrela."""
+        if not (tabuleiro.dentro(origem) and tabuleiro.dentro(destino)):
+            return [], []
+        grafo = self.grafo
+        alvo = grafo.id_de(destino)
+        achou, pred, g = saltos_ids(self, celulas_bloqueadas(tabuleiro), grafo.id_de(origem), alvo, limite)
+        tocadas = list(g)
+        # os saltos passam por interiores não tocados: a área inclui os retângulos usados
+        for r in {self.retangulo[u] for u in g} - {-1}:
+            tocadas.append(self.y0[r] * grafo.largura + self.x0[r])
+            tocadas.append(self.y1[r] * grafo.largura + self.x1[r])
+        return (reconstruir_saltos(grafo, pred, alvo) if achou else []), tocadas
+
+
+def saltos_ids(grade: GradeSaltos, bloqueadas, s: int, alvo: int, limite=float("inf"), fechados=None):
+    """A* com saltos sobre ids de célula: devolve (achou, pred, g).
+
+    `pred` liga só os nós expandidos; entre dois deles o trecho é reto (ou em
+    L, de origem a destino no mesmo retângulo), ver reconstruir_saltos.
+    """
+    grafo = grade.grafo
+    inicio, destinos, custos, largura = grafo.inicio, grafo.destinos, grafo.custos, grafo.largura
+    ret, rx0, ry0, rx1, ry1, rcusto = grade.retangulo, grade.x0, grade.y0, grade.x1, grade.y1, grade.custo
+    ay, ax = divmod(alvo, largura); sy, sx = divmod(s, largura); cmin = grafo.custo_minimo
+    desligados = {ret[b] for b in bloqueadas}
+    r_alvo = ret[alvo]
+    if r_alvo < 0 or r_alvo in desligados or not (rx0[r_alvo] < ax < rx1[r_alvo] and ry0[r_alvo] < ay < ry1[r_alvo]):
+        r_alvo = -1  # destino fora de interior: chega-se a ele por passos normais
+    g = {s: 0}; pred = {s: -1}
+    if fechados is None: fechados = set()
+    heap = [((abs(sx - ax) + abs(sy - ay)) * cmin, 0, s)]
+
+    def relaxar(v, novo, u):
+        if novo < g.get(v, novo + 1) and novo <= limite:
+            vy, vx = divmod(v, largura)
+            h = (abs(vx - ax) + abs(vy - ay)) * cmin
+            if novo + h <= limite:
+                g[v] = novo; pred[v] = u
+                heappush(heap, (novo + h, -novo, v))
+
+    while heap:
+        _, d, u = heappop(heap); d = -d
+        if u == alvo: return True, pred, g
+        if u in fechados: continue
+        fechados.add(u)
+        r = ret[u]
+        if r < 0 or r in desligados:
+            for k in range(inicio[u], inicio[u + 1]):
+                v = destinos[k]
+                if v not in bloqueadas: relaxar(v, d + custos[k], u)
+            continue
+
+        y, x = divmod(u, largura)
+        x0, y0, x1, y1, c = rx0[r], ry0[r], rx1[r], ry1[r], rcusto[r]
+        interior = x0 < x < x1 and y0 < y < y1
+        if r == r_alvo and (interior or x == ax or y == ay):
+            relaxar(alvo, d + c * (abs(x - ax) + abs(y - ay)), u)
+        if interior:
+            # origem no interior: saltos retos até as quatro bordas
+            linha = y * largura
+            relaxar(linha + x0, d + c * (x - x0), u); relaxar(linha + x1, d + c * (x1 - x), u)
+            relaxar(y0 * largura + x, d + c * (y - y0), u); relaxar(y1 * largura + x, d + c * (y1 - y), u)
+            continue
+        for k in range(inicio[u], inicio[u + 1]):
+            v = destinos[k]
+            if ret[v] == r:
+                vy, vx = divmod(v, largura)
+                if x0 < vx < x1 and y0 < vy < y1:
+                    # passo para o interior: pula até a borda oposta
+                    if vx != x:
+                        fim = x1 if vx > x else x0
+                        relaxar(y * largura + fim, d + c * abs(fim - x), u)
+                    else:
+                        fim = y1 if vy > y else y0
+                        relaxar(fim * largura + x, d + c * abs(fim - y), u)
+                    continue
+            if v not in bloqueadas: relaxar(v, d + custos[k], u)
+    return False, pred, g
+
+
+def reconstruir_saltos(grafo, pred, alvo: int) -> List[Tuple[int, int]]:
+    """Caminho célula a célula: preenche os trechos entre nós (primeiro em x, depois em y)."""
+    nos = []
+    while alvo != -1:
+        nos.append(grafo.posicao_de(alvo)); alvo = pred[alvo]
+    nos.reverse()
+    caminho = nos[:1]
+    for bx, by in nos[1:]:
+        x, y = caminho[-1]
+        passo = 1 if bx > x else -1
+        caminho.extend((xx, y) for xx in range(x + passo, bx + passo, passo))
+        passo = 1 if by > y else -1
+        caminho.extend((bx, yy) for yy in range(y + passo, by + passo, passo))
+    return caminho
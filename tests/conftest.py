@@ -0,0 +1,83 @@
+import os
+import sys
+
+import pytest
+
+# os testes importam model/ e core/ a partir da raiz do projeto, sem abrir janela
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from model.board import Tabuleiro
+from model.movement import SistemaMovimento
+
+
+# === BUSCAS ===
+def _bloquear(tabuleiro, posicao):
+    # duas entidades na célula a tornam intransitável (SistemaMovimento.pode_passar)
+    tabuleiro.adicionar_ocupante(posicao, object())
+    tabuleiro.adicionar_ocupante(posicao, object())
+
+
+@pytest.fixture
+def bloquear():
+    """bloquear(tabuleiro, posicao): ocupa a célula até ela não dar passagem."""
+    return _bloquear
+
+
+@pytest.fixture
+def tabuleiro_bloqueado():
+    """tabuleiro_bloqueado(largura, altura, mapa_id, seed, bloqueios, rng): Tabuleiro
+    com `bloqueios` células livres sorteadas de `rng` e bloqueadas."""
+    def criar(largura, altura, mapa_id, seed, bloqueios, rng):
+        t = Tabuleiro(largura, altura, mapa_id=mapa_id, seed=seed)
+        for _ in range(bloqueios):
+            _bloquear(t, t.sortear_posicao_livre(rng))
+        return t
+    return criar
+
+
+@pytest.fixture
+def custo_caminho():
+    """custo_caminho(tabuleiro, caminho): soma do custo de entrada das células
+    depois da origem (-1 para caminho vazio)."""
+    sm = SistemaMovimento()
+
+    def custo(tabuleiro, caminho):
+        if not caminho:
+            return -1
+        return sum(sm.calcular_custo_movimento(tabuleiro.get_celula(p)) for p in caminho[1:])
+    return custo
+
+
+@pytest.fixture
+def caminho_valido():
+    """caminho_valido(tabuleiro, caminho, origem, destino): confere pontas,
+    passos ortogonais de uma célula e passagem em cada célula depois da origem."""
+    sm = SistemaMovimento()
+
+    def conferir(tabuleiro, caminho, origem, destino):
+        assert caminho[0] == origem and caminho[-1] == destino
+        for a, b in zip(caminho, caminho[1:]):
+            assert abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1
+        assert all(sm.pode_passar(tabuleiro.get_celula(p)) for p in caminho[1:])
+    return conferir
+
+
+# === MOTOR ===
+@pytest.fixture
+def so_com_itens():
+    """so_com_itens(motor, *itens): tira todos os itens do tabuleiro, põe `itens`
+    na célula do personagem da vez e passa para a fase de ação (sem eventos pendentes)."""
+    def preparar(motor, *itens):
+        t = motor.tabuleiro
+        for pos, lista in list(t.itens_por_posicao()):
+            for i in list(lista):
+                t.remover_item(pos, i)
+        p = motor.personagem_selecionado
+        for item in itens:
+            t.adicionar_item(p.posicao, item)
+        motor.fase_atual = "acao"
+        motor.coletar_eventos()
+        return p
+    return preparar
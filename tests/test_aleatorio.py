@@ -0,0 +1,43 @@
+from core.aleatorio import ServicoAleatorio, semear, ALEATORIO
+
+
+def _amostra(servico, nome, n=200):
+    return [servico.fluxo(nome).random() for _ in range(n)]
+
+
+def test_mesma_seed_e_nome_repetem_a_sequencia():
+    a, b = ServicoAleatorio(42), ServicoAleatorio(42)
+    assert _amostra(a, "dados") == _amostra(b, "dados")
+    assert a.numpy("batalha").integers(0, 1000, 50).tolist() == b.numpy("batalha").integers(0, 1000, 50).tolist()
+    assert [a.bloco("dados", 1, 6).proximo() for _ in range(5000)] == \
+           [b.bloco("dados", 1, 6).proximo() for _ in range(5000)]
+
+
+def test_seeds_diferentes_dao_sequencias_diferentes():
+    assert _amostra(ServicoAleatorio(1), "dados") != _amostra(ServicoAleatorio(2), "dados")
+
+
+def test_fluxos_sao_independentes():
+    a, b = ServicoAleatorio(7), ServicoAleatorio(7)
+    assert _amostra(ServicoAleatorio(7), "itens") != _amostra(ServicoAleatorio(7), "cartas")
+    # sortear muito de um fluxo não desloca os outros
+    _amostra(a, "cartas", 10_000)
+    a.inteiros("batalha", 1, 20, 10_000)
+    assert _amostra(a, "itens") == _amostra(b, "itens")
+    assert a.bloco("dados", 1, 6).proximo() == b.bloco("dados", 1, 6).proximo()
+
+
+def test_inteiros_em_lote_seguem_a_sequencia_do_bloco():
+    a, b = ServicoAleatorio(3), ServicoAleatorio(3)
+    um_a_um = [a.bloco("dados", 1, 6).proximo() for _ in range(5000)]
+    em_lote = b.inteiros("dados", 1, 6, 3000).tolist() + [b.bloco("dados", 1, 6).proximo() for _ in range(2000)]
+    assert um_a_um == em_lote
+    assert set(um_a_um) == {1, 2, 3, 4, 5, 6}
+
+
+def test_semear_reinicia_o_servico_padrao_no_lugar():
+    servico = semear(9)
+    assert servico is ALEATORIO
+    primeiro = _amostra(ALEATORIO, "mapa")
+    semear(9)
+    assert _amostra(ALEATORIO, "mapa") == primeiro
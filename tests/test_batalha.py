@@ -0,0 +1,89 @@
+from itertools import product
+
+import pytest
+
+from core.aleatorio import ServicoAleatorio
+from core.enums import ClassePersonagem, TipoTerreno
+from model.batalha import FACES, RODADAS, Lutador, simular_batalhas
+from model.board import Tabuleiro
+from model.characters import Personagem
+from model.chances import chances
+from model.movement import SistemaMovimento
+
+CASOS = [
+    (Lutador(), Lutador()),
+    (Lutador(vida=25, bonus=2), Lutador(dano=15)),
+    (Lutador(vida=30), Lutador(bonus=1)),
+]
+
+
+def _exatas(atacante, defensor):
+    """Chances contadas à mão: os 400 pares de d20 de uma rodada e as 3^RODADAS sequências."""
+    pares = [(a + atacante.bonus, d + defensor.bonus) for a in range(1, FACES + 1) for d in range(1, FACES + 1)]
+    rodada = {"a": sum(a > d for a, d in pares) / len(pares), "d": sum(d > a for a, d in pares) / len(pares)}
+    rodada["e"] = 1 - rodada["a"] - rodada["d"]
+    r = dict.fromkeys(("vitoria", "derrota", "empate", "morte_atacante", "morte_defensor"), 0.0)
+    for seq in product("ade", repeat=RODADAS):
+        p = 1.0
+        for s in seq:
+            p *= rodada[s]
+        va, vd = seq.count("a"), seq.count("d")
+        r["vitoria" if va > vd else "derrota" if vd > va else "empate"] += p
+        r["morte_atacante"] += p * (defensor.dano * vd >= atacante.vida)
+        r["morte_defensor"] += p * (atacante.dano * va >= defensor.vida)
+    return r
+
+
+@pytest.mark.parametrize("atacante,defensor", CASOS)
+def test_simulacao_converge_para_chances_exatas(atacante, defensor):
+    n = 400_000
+    r = simular_batalhas(atacante, defensor, n, seed=7)
+    c = _exatas(atacante, defensor)
+    assert r.total == n
+    assert r.vitorias + r.derrotas + r.empates == n
+    # 400 mil batalhas: desvio padrão de uma proporção fica abaixo de 0,0008
+    tol = 0.004
+    assert r.vitorias / n == pytest.approx(c["vitoria"], abs=tol)
+    assert r.derrotas / n == pytest.approx(c["derrota"], abs=tol)
+    assert r.empates / n == pytest.approx(c["empate"], abs=tol)
+    assert r.mortes_atacante / n == pytest.approx(c["morte_atacante"], abs=tol)
+    assert r.mortes_defensor / n == pytest.approx(c["morte_defensor"], abs=tol)
+
+
+@pytest.mark.parametrize("atacante,defensor", [
+    (Lutador(vida=25, bonus=2, dano=10, modificador=0.8), Lutador(vida=100, dano=15, modificador=1.2)),
+    (Lutador(vida=30, modificador=1.2), Lutador(bonus=1)),
+])
+def test_simulacao_com_modificadores_converge_para_model_chances(atacante, defensor):
+    n = 400_000
+    r = simular_batalhas(atacante, defensor, n, seed=7)
+    c = chances(atacante, defensor)
+    tol = 0.004
+    assert r.vitorias / n == pytest.approx(c.vitoria, abs=tol)
+    assert r.derrotas / n == pytest.approx(c.derrota, abs=tol)
+    assert r.mortes_atacante / n == pytest.approx(c.morte_atacante, abs=tol)
+    assert set(r.delta_atacante) == set(c.delta_atacante)
+    for delta, p in c.delta_atacante.items():
+        assert r.delta_atacante[delta] / n == pytest.approx(p, abs=tol)
+
+
+def test_mesma_seed_mesmo_resultado():
+    a = simular_batalhas(Lutador(), Lutador(bonus=1), 10_000, seed=3)
+    b = simular_batalhas(Lutador(), Lutador(bonus=1), 10_000, seed=3)
+    assert (a.conjunta == b.conjunta).all()
+
+
+def test_batalha_do_jogo_compara_os_dados_sem_modificador_de_terreno():
+    for seed in range(40):
+        t = Tabuleiro(6, 6, mapa_id=1, seed=1)
+        t.set_terreno((2, 2), TipoTerreno.FLORESTA); t.set_terreno((3, 2), TipoTerreno.MONTANHA)
+        atacante = Personagem("A", (2, 2), ClassePersonagem.GUERREIRO)
+        defensor = Personagem("D", (3, 2), ClassePersonagem.MAGO)
+        t.adicionar_ocupante((2, 2), atacante); t.adicionar_ocupante((3, 2), defensor)
+        sm = SistemaMovimento(ServicoAleatorio(seed))
+        sm.movimentos_disponiveis[atacante] = 5
+        assert sm.mover_personagem(t, atacante, (3, 2))
+        b = sm.batalha_em_andamento
+        assert b["vitorias_atacante"] == sum(d1 > d2 for d1, d2 in b["dados"])
+        assert b["vitorias_defensor"] == sum(d2 > d1 for d1, d2 in b["dados"])
+        assert defensor.vida_atual == 100 - 10 * b["vitorias_atacante"]
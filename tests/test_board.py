@@ -0,0 +1,26 @@
+import pytest
+
+from core.enums import TipoTerreno
+from model.board import Tabuleiro
+
+
+@pytest.mark.parametrize("chunk", [None, 16])
+@pytest.mark.parametrize("pos", [(-1, 0), (0, -1), (40, 5), (45, 5), (3, 30)])
+def test_fora_do_tabuleiro_levanta_index_error_sem_gerar_chunks(chunk, pos):
+    t = Tabuleiro(40, 30, mapa_id=4, seed=1, chunk=chunk)
+    t.get_tipo_terreno((0, 0))
+    chunks, revisao = t.chunks_alocados, t.revisao
+    with pytest.raises(IndexError):
+        t.get_tipo_terreno(pos)
+    with pytest.raises(IndexError):
+        t.get_codigo_terreno(pos)
+    with pytest.raises(IndexError):
+        t.set_terreno(pos, TipoTerreno.AGUA)
+    with pytest.raises(IndexError):
+        t.adicionar_ocupante(pos, object())
+    with pytest.raises(IndexError):
+        t.adicionar_item(pos, object())
+    assert t.chunks_alocados == chunks and t.revisao == revisao
+    assert pos not in t.posicoes_ocupadas() and pos not in t.posicoes_com_itens()
+    assert t.total_itens == 0
+    assert t.get_celula(pos) is None and not t.esta_livre(pos)
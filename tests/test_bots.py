@@ -0,0 +1,26 @@
+import random
+
+from benchmarks.torneio import jogar
+from model.board import Tabuleiro
+from model.bots import VIDA_ARMADILHA, bot_guloso
+from model.items import Armadilha, Tesouro
+from model.motor import PROBABILIDADES, MotorJogo
+
+
+def test_guloso_so_desarma_armadilha_quando_nao_ha_outro_item(so_com_itens):
+    motor = MotorJogo(Tabuleiro(30, 20, mapa_id=1, seed=1), seed=1)
+    p = so_com_itens(motor, Armadilha("💀 Armadilha", None, 20))
+    rng = random.Random(0)
+    assert bot_guloso(motor, rng) == ("coletar",)
+    p.vida_atual = VIDA_ARMADILHA - 1
+    assert bot_guloso(motor, rng) == ("passar",)
+    # com um item bom em outra célula, a armadilha fica onde está
+    p.vida_atual = 100
+    outra = motor.tabuleiro.sortear_posicao_livre(rng, sem_itens=True)
+    motor.tabuleiro.adicionar_item(outra, Tesouro("🏆 Tesouro", outra, 50))
+    assert bot_guloso(motor, rng) == ("passar",)
+
+
+def test_torneio_so_de_gulosos_termina_com_vencedor():
+    fins = [jogar(4, seed, ["guloso"], tuple(PROBABILIDADES))["fim"] for seed in range(4)]
+    assert "vitoria" in fins
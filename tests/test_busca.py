@@ -0,0 +1,40 @@
+import random
+
+from model.board import Tabuleiro
+from model.movement import a_estrela, dijkstra, SistemaMovimento
+
+
+def test_a_estrela_tem_o_custo_do_dijkstra(custo_caminho, caminho_valido):
+    t = Tabuleiro(60, 60, mapa_id=4, seed=1)
+    rng = random.Random(0)
+    for _ in range(20):
+        o = t.sortear_posicao_livre(rng)
+        dist = dijkstra(t, o).dist
+        for _ in range(10):
+            d = t.sortear_posicao_livre(rng)
+            caminho = a_estrela(t, o, d)
+            alvo = t.grafo.id_de(d)
+            assert bool(caminho) == (alvo in dist)
+            if caminho:
+                caminho_valido(t, caminho, o, d)
+                assert custo_caminho(t, caminho) == dist[alvo]
+
+
+def test_a_estrela_respeita_o_limite():
+    t = Tabuleiro(60, 60, mapa_id=4, seed=1)
+    rng = random.Random(1)
+    for _ in range(50):
+        o, d = t.sortear_posicao_livre(rng), t.sortear_posicao_livre(rng)
+        custo = dijkstra(t, o).dist.get(t.grafo.id_de(d))
+        if custo is None:
+            continue
+        assert a_estrela(t, o, d, custo)
+        assert a_estrela(t, o, d, custo - 1) == []
+
+
+
+def test_fora_do_tabuleiro_nao_tem_caminho():
+    t = Tabuleiro(20, 20, mapa_id=4, seed=1)
+    assert a_estrela(t, (0, 0), (20, 5)) == []
+    assert a_estrela(t, (-1, 0), (3, 3)) == []
+    assert SistemaMovimento().calcular_caminho(t, (3, 3), (3, 20)) == []
@@ -0,0 +1,77 @@
+import random
+
+from core.enums import TipoTerreno
+from model.board import Tabuleiro
+from model.movement import CacheBuscas, a_estrela, dijkstra
+
+
+def _par(tabuleiro, rng, minimo=6):
+    while True:
+        o, d = tabuleiro.sortear_posicao_livre(rng), tabuleiro.sortear_posicao_livre(rng)
+        caminho = a_estrela(tabuleiro, o, d)
+        if len(caminho) > minimo:
+            return o, d, caminho
+
+
+def test_consulta_repetida_nao_busca_de_novo():
+    t = Tabuleiro(60, 60, mapa_id=4, seed=1)
+    cache = CacheBuscas()
+    o, d, esperado = _par(t, random.Random(0))
+    assert cache.caminho(t, o, d) == esperado
+    assert cache.caminho(t, o, d) == esperado
+    assert (cache.buscas, cache.acertos) == (1, 1)
+
+
+def test_revisao_na_area_invalida_o_caminho(bloquear):
+    t = Tabuleiro(60, 60, mapa_id=4, seed=1)
+    cache = CacheBuscas()
+    o, d, caminho = _par(t, random.Random(2))
+    cache.caminho(t, o, d)
+    revisao = t.revisao
+    meio = caminho[len(caminho) // 2]
+    bloquear(t, meio)
+    assert t.revisao > revisao
+    novo = cache.caminho(t, o, d)
+    assert cache.buscas == 2 and cache.acertos == 0
+    assert novo == a_estrela(t, o, d)
+    assert meio not in novo
+
+
+def test_revisao_fora_da_area_mantem_o_caminho(bloquear):
+    t = Tabuleiro(60, 60, mapa_id=4, seed=1)
+    cache = CacheBuscas()
+    # vizinhos num canto: a busca não passa perto do canto oposto
+    o, d = next(((x, y), (x + 1, y)) for y in range(8) for x in range(8)
+                if len(a_estrela(t, (x, y), (x + 1, y))) == 2)
+    cache.caminho(t, o, d)
+    bloquear(t, (59, 59))
+    cache.caminho(t, o, d)
+    assert (cache.buscas, cache.acertos) == (1, 1)
+
+
+def test_troca_de_terreno_invalida_alcances_e_caminhos():
+    t = Tabuleiro(60, 60, mapa_id=4, seed=1)
+    cache = CacheBuscas()
+    o, d, caminho = _par(t, random.Random(3))
+    # limite folgado: o meio do caminho cai dentro do alcance
+    limite = 5 * len(caminho)
+    cache.caminho(t, o, d)
+    cache.alcance(t, o, limite)
+    meio = caminho[len(caminho) // 2]
+    t.set_terreno(meio, TipoTerreno.AGUA)
+    assert cache.caminho(t, o, d) == a_estrela(t, o, d)
+    assert cache.alcance(t, o, limite).dist == dijkstra(t, o, limite).dist
+    assert cache.buscas == 4 and cache.acertos == 0
+
+
+def test_troca_de_terreno_fora_da_area_mantem_as_entradas():
+    t = Tabuleiro(60, 60, mapa_id=4, seed=1)
+    cache = CacheBuscas()
+    o, d = next(((x, y), (x + 1, y)) for y in range(8) for x in range(8)
+                if len(a_estrela(t, (x, y), (x + 1, y))) == 2)
+    cache.caminho(t, o, d)
+    cache.alcance(t, o, 4)
+    t.set_terreno((59, 59), TipoTerreno.AGUA)
+    cache.caminho(t, o, d)
+    cache.alcance(t, o, 4)
+    assert (cache.buscas, cache.acertos) == (2, 2)
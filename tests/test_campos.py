@@ -0,0 +1,54 @@
+import random
+
+import numpy as np
+import pytest
+
+from model.campos import campos_distancia, custos_entre, origem_mais_proxima
+from model.movement import dijkstra
+
+LARGURA, ALTURA = 50, 40
+
+
+@pytest.fixture
+def com_origens(tabuleiro_bloqueado):
+    def criar(mapa_id):
+        rng = random.Random(mapa_id)
+        t = tabuleiro_bloqueado(LARGURA, ALTURA, mapa_id, 1, 5, rng)
+        return t, [t.sortear_posicao_livre(rng) for _ in range(8)]
+    return criar
+
+
+def _campo_dijkstra(tabuleiro, origem, limite=float("inf")):
+    ref = np.full((ALTURA, LARGURA), np.inf, np.float32)
+    for i, c in dijkstra(tabuleiro, origem, limite).dist.items():
+        ref[i // LARGURA, i % LARGURA] = c
+    return ref
+
+
+def test_campos_coincidem_com_o_dijkstra_em_cada_celula(com_origens):
+    for mapa_id in (4, 12):
+        t, origens = com_origens(mapa_id)
+        campos = campos_distancia(t, origens)
+        assert campos.shape == (len(origens), ALTURA, LARGURA)
+        for k, o in enumerate(origens):
+            assert np.array_equal(campos[k], _campo_dijkstra(t, o)), (mapa_id, o)
+
+
+def test_limite_corta_o_campo(com_origens):
+    t, origens = com_origens(4)
+    campos = campos_distancia(t, origens)
+    cortados = campos_distancia(t, origens, limite=7)
+    assert np.array_equal(cortados, np.where(campos > 7, np.inf, campos))
+    assert np.array_equal(cortados[0], _campo_dijkstra(t, origens[0], 7))
+
+
+def test_origem_mais_proxima_e_custos_entre(com_origens):
+    t, origens = com_origens(4)
+    campos = campos_distancia(t, origens)
+    indice, custo = origem_mais_proxima(campos)
+    assert np.array_equal(custo, campos.min(axis=0))
+    assert (indice[np.isinf(custo)] == -1).all()
+    x, y = origens[3]
+    assert custo[y, x] == 0
+    assert np.array_equal(custos_entre(campos, origens[:2]), campos[:, [origens[0][1], origens[1][1]],
+                                                                      [origens[0][0], origens[1][0]]])
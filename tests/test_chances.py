@@ -0,0 +1,54 @@
+from fractions import Fraction
+
+import pytest
+
+from model.batalha import Lutador, escalas_rodada
+from model.chances import chances, chances_rodada
+
+CASOS = [
+    (Lutador(), Lutador()),
+    (Lutador(vida=25, bonus=2, modificador=0.8), Lutador(dano=15, modificador=1.2)),
+    (Lutador(vida=10, bonus=-3), Lutador(vida=20, bonus=4, dano=7)),
+]
+
+
+@pytest.mark.parametrize("atacante,defensor", CASOS)
+def test_probabilidades_somam_um(atacante, defensor):
+    c = chances(atacante, defensor)
+    assert c.vitoria + c.derrota + c.empate == pytest.approx(1)
+    assert sum(c.delta_atacante.values()) == pytest.approx(1)
+    assert sum(c.delta_defensor.values()) == pytest.approx(1)
+    assert sum(map(sum, c.conjunta)) == pytest.approx(1)
+
+
+def test_rodada_d20_contra_d20():
+    # 400 pares: 20 empates, os outros 380 divididos ao meio
+    assert chances_rodada(*escalas_rodada(Lutador(), Lutador())) == (
+        Fraction(190, 400), Fraction(190, 400), Fraction(20, 400))
+
+
+def test_tres_rodadas_sem_modificadores():
+    c = chances(Lutador(), Lutador())
+    pv, pe = 0.475, 0.05
+    # empata com três rodadas empatadas ou uma vitória, uma derrota e um empate (3! ordens)
+    empate = pe ** 3 + 6 * pv * pv * pe
+    assert c.empate == pytest.approx(empate)
+    assert c.vitoria == pytest.approx((1 - empate) / 2)
+    assert c.derrota == pytest.approx(c.vitoria)
+    # perde k rodadas com chance C(3, k) 0,475^k 0,525^(3-k); nunca morre com 100 de vida
+    assert c.delta_atacante == pytest.approx({0: 0.525 ** 3, -10: 3 * 0.475 * 0.525 ** 2,
+                                              -20: 3 * 0.475 ** 2 * 0.525, -30: 0.475 ** 3})
+    assert c.morte_atacante == 0
+
+
+def test_bonus_que_garante_todas_as_rodadas():
+    # d20 + 20 sempre supera um d20: o defensor perde 3 x 10, limitado à vida de 25
+    c = chances(Lutador(bonus=20), Lutador(vida=25))
+    assert c.vitoria == 1 and c.empate == 0
+    assert c.delta_defensor == {-25: 1.0}
+    assert c.morte_defensor == 1
+
+
+def test_resultado_memorizado():
+    a, d = Lutador(vida=40), Lutador(bonus=1)
+    assert chances(a, d) is chances(a, d)
@@ -0,0 +1,41 @@
+import random
+
+import numpy as np
+import pytest
+
+from model.consultas import alcances_em_lote, caminhos_em_lote, coletar_custos
+from model.movement import a_estrela, dijkstra
+
+N = 120
+
+
+@pytest.fixture
+def lote(tabuleiro_bloqueado):
+    rng = random.Random(4)
+    t = tabuleiro_bloqueado(50, 50, 4, 1, 5, rng)
+    origens = np.array([t.sortear_posicao_livre(rng) for _ in range(N)])
+    destinos = np.array([t.sortear_posicao_livre(rng) for _ in range(N)])
+    limites = np.random.default_rng(0).integers(10, 120, N)
+    return t, origens, destinos, limites
+
+
+def test_caminhos_em_lote_coincidem_com_a_estrela(lote, custo_caminho):
+    t, origens, destinos, limites = lote
+    for processos in (1, 2):
+        resultados = list(caminhos_em_lote(t, origens, destinos, limites, com_caminhos=True,
+                                           processos=processos, tamanho_pedaco=32))
+        custos = coletar_custos(resultados, N)
+        for r in resultados:
+            for i, q in enumerate(r.indices.tolist()):
+                esperado = a_estrela(t, tuple(origens[q]), tuple(destinos[q]), limites[q])
+                assert custos[q] == custo_caminho(t, esperado)
+                ids = r.celulas[r.inicio[i]:r.inicio[i + 1]].tolist()
+                assert [(c % t.largura, c // t.largura) for c in ids] == esperado
+                assert r.passos[i] == len(esperado)
+
+
+def test_alcances_em_lote_coincidem_com_dijkstra(lote):
+    t, origens, _, _ = lote
+    contagens = coletar_custos(list(alcances_em_lote(t, origens, 12, processos=2, tamanho_pedaco=32)), N)
+    for q in range(N):
+        assert contagens[q] == len(dijkstra(t, tuple(origens[q]), 12).dist) - 1
@@ -0,0 +1,66 @@
+import random
+
+from core.enums import TipoTerreno
+from model.board import Tabuleiro
+from model.grafo import GrafoTabuleiro
+from model.movement import SistemaMovimento, a_estrela, dijkstra
+
+
+def _igual_ao_montado_do_zero(grafo, terreno):
+    novo = GrafoTabuleiro.do_terreno(terreno)
+    assert grafo.destinos == novo.destinos
+    assert grafo.custos == novo.custos
+    assert grafo.custo_celula == novo.custo_celula
+
+
+def test_set_terreno_corrige_o_grafo_no_lugar():
+    t = Tabuleiro(40, 30, mapa_id=4, seed=1)
+    g = t.grafo
+    rng = random.Random(0)
+    tipos = list(TipoTerreno)
+    for _ in range(60):
+        # inclui cantos e bordas, onde a célula tem menos de quatro vizinhos
+        pos = rng.choice([(0, 0), (39, 29), (rng.randrange(40), 0), (rng.randrange(40), rng.randrange(30))])
+        t.set_terreno(pos, rng.choice(tipos))
+    assert t.grafo is g
+    _igual_ao_montado_do_zero(g, t.terreno)
+
+
+def test_chunks_entram_no_grafo_conforme_sao_gerados():
+    t = Tabuleiro(100, 90, mapa_id=12, seed=2, chunk=16)
+    g = t.grafo
+    assert t.chunks_alocados == 0
+    t.set_terreno((20, 20), TipoTerreno.MONTANHA)  # antes dos vizinhos existirem
+    t.grafo_area(10, 10, 40, 40)
+    assert t.chunks_alocados == 9
+    assert t.grafo_completo is g
+    _igual_ao_montado_do_zero(g, t.terreno)
+
+
+def test_buscas_em_chunks_geram_so_a_regiao_e_acham_o_otimo():
+    base = Tabuleiro(120, 120, mapa_id=4, seed=3, chunk=16)
+    completo = Tabuleiro(120, 120, terreno=base.terreno, mapa_id=4)
+    rng = random.Random(1)
+    for _ in range(15):
+        t = Tabuleiro(120, 120, mapa_id=4, seed=3, chunk=16)
+        o, d = completo.sortear_posicao_livre(rng), completo.sortear_posicao_livre(rng)
+        esperado = dijkstra(completo, o).dist.get(completo.grafo.id_de(d))
+        caminho = a_estrela(t, o, d)
+        assert bool(caminho) == (esperado is not None), (o, d)
+        if caminho:
+            sm = SistemaMovimento()
+            assert sum(sm.calcular_custo_movimento(t.get_celula(p)) for p in caminho[1:]) == esperado
+        assert dijkstra(t, o, 20).dist == dijkstra(completo, o, 20).dist
+
+
+def test_caminho_curto_em_mundo_grande_nao_gera_o_mundo():
+    t = Tabuleiro(2000, 2000, mapa_id=4, seed=1, chunk=32)
+    sm = SistemaMovimento()
+    o = next((x, 1000) for x in range(1000, 1032) if t.esta_livre((x, 1000)) and t.esta_livre((x + 1, 1000)))
+    assert sm.calcular_caminho(t, o, (o[0] + 1, 1000)) == [o, (o[0] + 1, 1000)]
+    assert t.chunks_alocados <= 9
+    agua = (o[0] + 1, 1001)
+    t.set_terreno(agua, TipoTerreno.AGUA)
+    alcance = dijkstra(t, o, 6)
+    assert t.grafo.id_de(agua) not in alcance.dist and t.grafo.id_de((o[0] + 1, 1000)) in alcance.dist
+    assert t.chunks_alocados <= 9
@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from core.enums import TipoTerreno
+from model.board import Tabuleiro
+from model.hpa import CaminhoHierarquico
+from model.movement import AREA_HIERARQUICA, DISTANCIA_HIERARQUICA, SistemaMovimento, dijkstra
+
+
+@pytest.fixture
+def conferir_hpa(custo_caminho, caminho_valido):
+    """conferir_hpa(tabuleiro, hpa, rng, consultas): sorteia pares e compara com o Dijkstra."""
+    def conferir(tabuleiro, hpa, rng, consultas):
+        for _ in range(consultas):
+            o, d = tabuleiro.sortear_posicao_livre(rng), tabuleiro.sortear_posicao_livre(rng)
+            caminho = hpa.caminho(o, d)
+            otimo = dijkstra(tabuleiro, o).dist.get(tabuleiro.grafo.id_de(d))
+            assert bool(caminho) == (otimo is not None), (o, d)
+            if caminho:
+                caminho_valido(tabuleiro, caminho, o, d)
+                assert custo_caminho(tabuleiro, caminho) >= otimo
+    return conferir
+
+
+def test_hpa_refina_caminhos_validos_nunca_abaixo_do_otimo(conferir_hpa):
+    for mapa_id in (4, 12):
+        t = Tabuleiro(96, 96, mapa_id=mapa_id, seed=1)
+        conferir_hpa(t, CaminhoHierarquico(t), random.Random(mapa_id), 15)
+
+
+def test_hpa_acompanha_mudancas_no_terreno(conferir_hpa):
+    t = Tabuleiro(96, 96, mapa_id=4, seed=1)
+    hpa = CaminhoHierarquico(t)
+    rng = random.Random(5)
+    conferir_hpa(t, hpa, rng, 3)
+    for _ in range(30):
+        t.set_terreno(t.sortear_posicao_livre(rng), TipoTerreno.AGUA)
+    conferir_hpa(t, hpa, rng, 10)
+
+
+def test_fora_do_tabuleiro_nao_tem_caminho():
+    t = Tabuleiro(40, 40, mapa_id=4, seed=1)
+    assert CaminhoHierarquico(t).caminho((0, 0), (40, 0)) == []
+
+
+def test_calcular_caminho_so_usa_hpa_quando_pedido(custo_caminho, caminho_valido):
+    lado = int(AREA_HIERARQUICA ** 0.5)
+    t = Tabuleiro(lado, lado, mapa_id=4, seed=1)
+    sm = SistemaMovimento()
+    rng = random.Random(0)
+    while True:
+        o, d = t.sortear_posicao_livre(rng), t.sortear_posicao_livre(rng)
+        if sm.distancia_manhattan(o, d) >= DISTANCIA_HIERARQUICA and sm.calcular_caminho(t, o, d):
+            break
+    otimo = dijkstra(t, o).dist[t.grafo.id_de(d)]
+    assert custo_caminho(t, sm.calcular_caminho(t, o, d)) == otimo
+    assert sm.hierarquico is None
+    caminho = sm.calcular_caminho(t, o, d, hierarquico=True)
+    assert sm.hierarquico is not None
+    caminho_valido(t, caminho, o, d)
+    assert custo_caminho(t, caminho) >= otimo
@@ -0,0 +1,132 @@
+import pytest
+
+from core.enums import TipoItem
+from model.board import Tabuleiro
+from model.items import Armadilha, Carta, Tesouro
+from model.motor import TOTAL_ITENS, MotorJogo, ProbabilidadesItens
+
+
+def _motor(seed=1):
+    return MotorJogo(Tabuleiro(30, 20, mapa_id=1, seed=seed), seed=seed)
+
+
+def test_carta_nao_repoe_itens(so_com_itens):
+    motor = _motor()
+    p = so_com_itens(motor, Carta("📜 Carta Misteriosa", None, motor))
+    eventos = motor.step(("coletar",))
+    assert eventos[0].tipo == "carta"
+    assert motor.tabuleiro.total_itens == 0
+    assert not any(i.tipo == TipoItem.CARTA for i in p.inventario)
+
+
+def test_item_comum_vai_para_o_inventario_e_repoe(so_com_itens):
+    motor = _motor()
+    p = so_com_itens(motor, Tesouro("🏆 Tesouro", None, 50))
+    motor.step(("coletar",))
+    assert [i.tipo for i in p.inventario] == [TipoItem.TESOURO]
+    assert motor.tabuleiro.total_itens == TOTAL_ITENS
+
+
+def test_itens_iniciais_seguem_a_distribuicao_original():
+    # as probabilidades só valem para repor_itens: o começo é cartas e armadilhas
+    tipos = set()
+    for seed in range(10):
+        motor = MotorJogo(Tabuleiro(30, 20, mapa_id=1, seed=seed), seed=seed,
+                          probabilidades=ProbabilidadesItens(vida=0.5, tesouro=0.5, carta=0.0))
+        assert motor.tabuleiro.total_itens == TOTAL_ITENS
+        tipos |= {i.tipo for _, itens in motor.tabuleiro.itens_por_posicao() for i in itens}
+    assert tipos == {TipoItem.CARTA, TipoItem.ARMADILHA}
+
+
+def test_repor_itens_usa_as_probabilidades(so_com_itens):
+    motor = MotorJogo(Tabuleiro(30, 20, mapa_id=1, seed=1), seed=1,
+                      probabilidades=ProbabilidadesItens(vida=0.0, tesouro=1.0, carta=0.0))
+    so_com_itens(motor, Tesouro("🏆 Tesouro", None, 50))
+    motor.step(("coletar",))
+    repostos = [i for _, itens in motor.tabuleiro.itens_por_posicao() for i in itens]
+    assert len(repostos) == TOTAL_ITENS and all(i.tipo == TipoItem.TESOURO for i in repostos)
+
+
+def test_cada_heroi_recebe_o_bonus_da_sua_classe():
+    motor = _motor()
+    atributos = {p.classe.name: (p.vida_maxima, p.vida_atual, p.velocidade) for p in motor.jogador.personagens}
+    assert atributos == {"GUERREIRO": (130, 130, 4), "MAGO": (100, 100, 4),
+                         "LADINO": (100, 100, 5), "CLERIGO": (110, 110, 3)}
+
+
+def _tipos(eventos):
+    return [e.tipo for e in eventos]
+
+
+def test_turno_completo_pelo_step():
+    motor = _motor()
+    p = motor.personagem_selecionado
+    assert motor.fase_atual == "selecao" and motor.acoes_validas() == [("rolar",)]
+    # o "turno" emitido na criação sai junto com os eventos da primeira ação
+    eventos = motor.step(("rolar",))
+    assert _tipos(eventos) == ["turno", "dado", "fase"] and motor.fase_atual == "movimento"
+    assert eventos[1].dados["valor"] == motor.ultimo_resultado_dado
+    acoes = motor.acoes_validas()
+    assert acoes[-1] == ("encerrar_movimento",)
+    livres = [a for a in acoes[:-1] if not motor.tabuleiro.get_celula(a[1]).ocupantes]
+    origem, destino = p.posicao, livres[0][1]
+    eventos = motor.step(livres[0])
+    assert eventos[0].tipo == "movimento" and eventos[0].dados["destino"] == destino
+    assert p.posicao == destino and p not in motor.tabuleiro.get_celula(origem).ocupantes
+    if motor.fase_atual == "movimento":
+        assert _tipos(motor.step(("encerrar_movimento",))) == ["fase"]
+    assert motor.fase_atual == "acao"
+    assert motor.acoes_validas()[-2:] == [("habilidade",), ("passar",)]
+    eventos = motor.step(("passar",))
+    assert _tipos(eventos) == ["turno"] and motor.turno_atual == 2 and motor.fase_atual == "selecao"
+    assert motor.personagem_selecionado is motor.ordem_turnos[1] is eventos[0].dados["personagem"]
+    assert not p.rolou_dados
+
+
+def test_acao_fora_da_fase_nao_tem_efeito():
+    motor = _motor()
+    motor.coletar_eventos()
+    p, posicao = motor.personagem_selecionado, motor.personagem_selecionado.posicao
+    for acao in (("mover", (0, 0)), ("encerrar_movimento",), ("coletar",), ("passar",)):
+        assert motor.step(acao) == []
+    assert motor.fase_atual == "selecao" and p.posicao == posicao and motor.turno_atual == 1
+    motor.step(("rolar",))
+    assert motor.step(("rolar",)) == [] and motor.fase_atual == "movimento"
+
+
+def test_acao_desconhecida_levanta_value_error():
+    with pytest.raises(ValueError):
+        _motor().step(("voar",))
+
+
+def test_morte_de_outro_heroi_o_tira_do_jogo():
+    motor = _motor()
+    morto = motor.ordem_turnos[2]
+    morto.vida_atual = 0
+    motor.coletar_eventos()
+    eventos = motor.step(("rolar",))
+    assert ("morte", morto) in [(e.tipo, e.dados.get("personagem")) for e in eventos]
+    assert morto not in motor.jogador.personagens
+    assert morto not in motor.tabuleiro.get_celula(morto.posicao).ocupantes
+    motor.step(("encerrar_turno",))
+    motor.step(("encerrar_turno",))
+    assert motor.personagem_selecionado is motor.ordem_turnos[3]
+
+
+def test_morte_do_heroi_da_vez_encerra_o_turno(so_com_itens):
+    motor = _motor()
+    p = so_com_itens(motor, Armadilha("💀 Armadilha", None, 10_000))
+    eventos = motor.step(("coletar",))
+    assert _tipos(eventos) == ["item", "morte", "turno"]
+    assert motor.personagem_selecionado is motor.ordem_turnos[1] and motor.fase_atual == "selecao"
+    assert p not in motor.jogador.personagens
+
+
+def test_sem_herois_vivos_o_jogo_termina():
+    motor = _motor()
+    for p in motor.jogador.personagens:
+        p.vida_atual = 0
+    tipos = _tipos(motor.step(("rolar",)))
+    assert tipos.count("morte") == 4 and tipos.count("fim") == 1
+    assert motor.jogo_finalizado and motor.personagem_selecionado is None
+    assert motor.acoes_validas() == [] and motor.step(("rolar",)) == []
@@ -0,0 +1,73 @@
+import random
+
+from core.enums import ClassePersonagem
+from model.characters import Personagem
+from model.movement import SistemaMovimento, dijkstra
+
+PONTOS = 14
+
+
+def _em_jogo(tabuleiro, rng, nome="Herói"):
+    p = Personagem(nome, tabuleiro.sortear_posicao_livre(rng, sem_itens=True), ClassePersonagem.GUERREIRO)
+    tabuleiro.adicionar_ocupante(p.posicao, p)
+    return p
+
+
+def _contar_reenraizamentos(monkeypatch, sm):
+    chamadas = []
+    original = sm._reenraizar
+    monkeypatch.setattr(sm, "_reenraizar", lambda *a: (chamadas.append(a[1].posicao), original(*a)))
+    return chamadas
+
+
+def _confere_com_busca_nova(tabuleiro, sm, p):
+    restante = sm.movimentos_disponiveis[p]
+    novo = dijkstra(tabuleiro, p.posicao, restante)
+    origem = tabuleiro.grafo.id_de(p.posicao)
+    esperado = {tabuleiro.grafo.posicao_de(i): c for i, c in novo.dist.items() if i != origem}
+    assert sm.posicoes_alcancaveis[p] == esperado
+    for destino, custo in esperado.items():
+        caminho = sm.caminho_alcance(tabuleiro, p, destino)
+        assert caminho[0] == p.posicao and caminho[-1] == destino
+        assert sum(sm.calcular_custo_movimento(tabuleiro.get_celula(c)) for c in caminho[1:]) == custo
+
+
+def test_passos_reenraizam_a_arvore_sem_perder_celulas(tabuleiro_bloqueado, monkeypatch):
+    rng = random.Random(3)
+    t = tabuleiro_bloqueado(40, 40, 4, 1, 30, rng)
+    p, sm = _em_jogo(t, rng), SistemaMovimento()
+    sm.movimentos_disponiveis[p] = PONTOS
+    sm.calcular_alcance(t, p)
+    chamadas = _contar_reenraizamentos(monkeypatch, sm)
+    passos = 0
+    while sm.posicoes_alcancaveis[p]:
+        destino = min(sm.posicoes_alcancaveis[p].items(), key=lambda pc: (pc[1], pc[0]))[0]
+        assert sm.mover_personagem(t, p, destino)
+        passos += 1
+        _confere_com_busca_nova(t, sm, p)
+    assert passos > 1 and len(chamadas) == passos
+
+
+def test_mudanca_no_tabuleiro_refaz_a_busca(tabuleiro_bloqueado, bloquear, monkeypatch):
+    rng = random.Random(4)
+    t = tabuleiro_bloqueado(40, 40, 4, 1, 10, rng)
+    p, sm = _em_jogo(t, rng), SistemaMovimento()
+    sm.movimentos_disponiveis[p] = PONTOS
+    sm.calcular_alcance(t, p)
+    # bloqueio de outro agente entre dois passos: a área da árvore mudou
+    alcancaveis = sorted(sm.posicoes_alcancaveis[p].items(), key=lambda pc: (pc[1], pc[0]))
+    destino, bloqueio = alcancaveis[0][0], alcancaveis[-1][0]
+    bloquear(t, bloqueio)
+    assert bloqueio not in sm.calcular_alcance(t, p)
+    _confere_com_busca_nova(t, sm, p)
+    # mudança durante o próprio passo (aqui, na batalha): não dá para re-enraizar
+    inimigo = Personagem("Inimigo", destino, ClassePersonagem.MAGO)
+    t.adicionar_ocupante(destino, inimigo)
+    vizinho = next(v for v in sm.posicoes_alcancaveis[p] if v not in (destino, bloqueio))
+    monkeypatch.setattr(sm, "iniciar_batalha", lambda atacante, defensor: bloquear(t, vizinho))
+    chamadas = _contar_reenraizamentos(monkeypatch, sm)
+    sm.calcular_alcance(t, p)
+    assert sm.mover_personagem(t, p, destino)
+    assert chamadas == []
+    _confere_com_busca_nova(t, sm, p)
+    assert vizinho not in sm.posicoes_alcancaveis[p]
@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from model.movement import SistemaMovimento, celulas_bloqueadas, dijkstra
+from model.saltos import GradeSaltos, reconstruir_saltos, saltos_ids
+
+
+@pytest.fixture
+def com_rng(tabuleiro_bloqueado):
+    def criar(mapa_id):
+        rng = random.Random(mapa_id)
+        return tabuleiro_bloqueado(60, 45, mapa_id, 3, 20, rng), rng
+    return criar
+
+
+def test_saltos_tem_o_custo_do_dijkstra(com_rng, custo_caminho, caminho_valido):
+    for mapa_id in (4, 12):
+        t, rng = com_rng(mapa_id)
+        g = t.grafo
+        grade, bloqueadas = GradeSaltos(g), celulas_bloqueadas(t)
+        for _ in range(15):
+            s = g.id_de(t.sortear_posicao_livre(rng))
+            dist = dijkstra(t, g.posicao_de(s)).dist
+            for _ in range(8):
+                alvo = g.id_de(t.sortear_posicao_livre(rng))
+                achou, pred, custos = saltos_ids(grade, bloqueadas, s, alvo)
+                assert achou == (alvo in dist)
+                if not achou:
+                    continue
+                assert custos[alvo] == dist[alvo]
+                caminho = reconstruir_saltos(g, pred, alvo)
+                caminho_valido(t, caminho, g.posicao_de(s), g.posicao_de(alvo))
+                assert custo_caminho(t, caminho) == dist[alvo]
+
+
+def test_modo_saltos_no_sistema_de_movimento(com_rng, custo_caminho):
+    t, rng = com_rng(12)
+    assert t.modo_caminho == "saltos"
+    sm = SistemaMovimento()
+    g = t.grafo
+    for _ in range(30):
+        o, d = t.sortear_posicao_livre(rng), t.sortear_posicao_livre(rng)
+        caminho = sm.calcular_caminho(t, o, d)
+        custo = dijkstra(t, o).dist.get(g.id_de(d))
+        assert bool(caminho) == (custo is not None)
+        if caminho:
+            assert custo_caminho(t, caminho) == custo
+    assert sm.saltos is not None
+    assert GradeSaltos(g).caminho(t, (0, 0), (60, 0)) == ([], [])
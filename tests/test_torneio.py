@@ -0,0 +1,63 @@
+import json
+
+from benchmarks import torneio
+
+ARGS = ["--mapas", "4", "12", "--bots", "guloso", "aleatorio", "--largura", "20", "--altura", "15",
+        "--max-turnos", "150", "--processos", "2"]
+
+
+def _linhas(caminho):
+    with open(caminho, encoding="utf-8") as f:
+        return [json.loads(linha) for linha in f if linha.strip()]
+
+
+def _resultados(caminho):
+    # "ms" é tempo de relógio: o resto da linha tem de se repetir
+    return sorted((json.dumps({k: v for k, v in r.items() if k != "ms"}, sort_keys=True)
+                   for r in _linhas(caminho)))
+
+
+def test_torneio_retomado_igual_ao_continuo(tmp_path):
+    continuo = tmp_path / "continuo.jsonl"
+    assert torneio.main(ARGS + ["--seeds", "0-3", "--saida", str(continuo)]) == 0
+    assert len(_linhas(continuo)) == 8
+
+    retomado = tmp_path / "retomado.jsonl"
+    torneio.main(ARGS + ["--seeds", "0,2", "--saida", str(retomado)])
+    # interrupção no meio da gravação: a última linha fica cortada
+    with open(continuo, encoding="utf-8") as f:
+        cortada = f.readlines()[-1][:40]
+    with open(retomado, "a", encoding="utf-8") as f:
+        f.write(cortada)
+    torneio.main(ARGS + ["--seeds", "0-3", "--saida", str(retomado)])
+
+    linhas = retomado.read_text(encoding="utf-8").splitlines()
+    assert cortada in linhas
+    linhas.remove(cortada)
+    retomado.write_text("\n".join(linhas) + "\n", encoding="utf-8")
+    assert _resultados(retomado) == _resultados(continuo)
+
+
+def test_retomar_sem_pendencias_nao_joga_de_novo(tmp_path):
+    saida = tmp_path / "torneio.jsonl"
+    torneio.main(ARGS + ["--seeds", "0-1", "--saida", str(saida)])
+    antes = saida.read_text(encoding="utf-8")
+    torneio.main(ARGS + ["--seeds", "0-1", "--saida", str(saida)])
+    assert saida.read_text(encoding="utf-8") == antes
+    config = {r["config"] for r in _linhas(saida)}
+    assert torneio.partidas_feitas(str(saida), config.pop()) == {(m, s) for m in (4, 12) for s in (0, 1)}
+
+
+def test_outra_configuracao_nao_conta_como_feita(tmp_path):
+    saida = tmp_path / "torneio.jsonl"
+    torneio.main(ARGS + ["--seeds", "0", "--saida", str(saida)])
+    torneio.main(ARGS[:-2] + ["--processos", "1", "--prob-carta", "0.2", "--seeds", "0", "--saida", str(saida)])
+    assert len({r["config"] for r in _linhas(saida)}) == 2
+    assert len(_linhas(saida)) == 4
+
+
+def test_mapas_padrao_sao_os_15_fixos(tmp_path):
+    saida = tmp_path / "torneio.jsonl"
+    torneio.main(["--seeds", "0", "--largura", "20", "--altura", "15", "--max-turnos", "4",
+                  "--processos", "1", "--saida", str(saida)])
+    assert sorted(r["mapa"] for r in _linhas(saida)) == list(range(1, 16))
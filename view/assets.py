@@ -1,7 +1,11 @@
 import os, pygame
+from collections import OrderedDict
 from core.constants import SPRITE_CONFIG, TAMANHO_CELULA
 from .animation import SimpleAnimation
 
+# Máximo de sprites de terreno escalados mantidos (tipo x tamanho)
+LIMITE_CACHE_TERRENO = 32
+
 
 # --------------------------
 # Mapa
@@ -14,6 +18,8 @@ class MapaUnico:
         self.largura_mapa = 0
         self.altura_mapa = 0
         self.ativo = False
+        # (tipo_terreno, tamanho) -> Surface escalada, compartilhada por todas as células
+        self.cache_terreno = OrderedDict()
         self._carregar_mapa()
 
     def _carregar_mapa(self):
@@ -79,10 +85,26 @@ class MapaUnico:
             return None
         if tamanho_celula is None:
             tamanho_celula = self.tamanho_atual
+        chave = (tipo_terreno, tamanho_celula)
+        sprite = self.cache_terreno.get(chave)
+        if sprite is not None:
+            self.cache_terreno.move_to_end(chave)
+            return sprite
+
         sprite_original = self.sprites_terreno[tipo_terreno]
         if SPRITE_CONFIG['qualidade_escala']:
-            return pygame.transform.smoothscale(sprite_original, (tamanho_celula, tamanho_celula))
-        return pygame.transform.scale(sprite_original, (tamanho_celula, tamanho_celula))
+            sprite = pygame.transform.smoothscale(sprite_original, (tamanho_celula, tamanho_celula))
+        else:
+            sprite = pygame.transform.scale(sprite_original, (tamanho_celula, tamanho_celula))
+
+        if SPRITE_CONFIG['cache_sprites']:
+            self.cache_terreno[chave] = sprite
+            if len(self.cache_terreno) > LIMITE_CACHE_TERRENO:
+                self.cache_terreno.popitem(last=False)
+        return sprite
+
+    def limpar_cache_terreno(self):
+        self.cache_terreno.clear()
 
 
 # --------------------------
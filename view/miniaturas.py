@@ -0,0 +1,88 @@
+import os
+import threading
+
+import numpy as np
+import pygame
+
+from core.regras_terreno import REGRAS
+from model.mapas import MAPAS, gerar_terreno
+
+PASTA_CACHE = os.path.join("cache", "miniaturas")
+SEED_MINIATURA = 0
+
+# código do terreno -> cor RGB principal
+TABELA_CORES = REGRAS.cor
+
+
+def renderizar_miniatura(terreno: np.ndarray, cel_tam: int) -> np.ndarray:
+    """Imagem RGB [y, x, 3] do terreno, cel_tam px por célula com 1 px de grade."""
+    rgb = TABELA_CORES[terreno]
+    rgb = np.repeat(np.repeat(rgb, cel_tam, axis=0), cel_tam, axis=1)
+    # a última linha/coluna de cada célula fica preta (grade)
+    rgb[cel_tam - 1::cel_tam, :] = 0
+    rgb[:, cel_tam - 1::cel_tam] = 0
+    return rgb
+
+
+class GeradorMiniaturas:
+    """Gera as miniaturas do seletor de mapas numa thread de fundo.
+
+    Cada miniatura sai de uma única execução do gerador do mapa e de uma
+    consulta à tabela de cores, e fica salva em disco por
+    (mapa, seed, versão do gerador, tamanho). `obter` nunca bloqueia: devolve
+    None enquanto a miniatura ainda não ficou pronta.
+    """
+
+    def __init__(self, largura: int, altura: int, cel_tam: int, seed: int = SEED_MINIATURA):
+        self.largura = largura
+        self.altura = altura
+        self.cel_tam = cel_tam
+        self.seed = seed
+        self._prontas = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def iniciar(self, mapa_ids):
+        ids = list(mapa_ids)
+        self._thread = threading.Thread(target=self._gerar_todas, args=(ids,), daemon=True)
+        self._thread.start()
+
+    def obter(self, mapa_id):
+        with self._lock:
+            return self._prontas.get(mapa_id)
+
+    def _caminho_cache(self, mapa_id) -> str:
+        versao = MAPAS[mapa_id].versao if mapa_id in MAPAS else 0
+        nome = (f"mapa{mapa_id}_s{self.seed}_v{versao}_"
+                f"{self.largura}x{self.altura}_{self.cel_tam}px.png")
+        return os.path.join(PASTA_CACHE, nome)
+
+    def _gerar_todas(self, mapa_ids):
+        for mapa_id in mapa_ids:
+            try:
+                surface = self._gerar(mapa_id)
+            except Exception as e:
+                print(f"❌ Erro gerando miniatura do mapa {mapa_id}: {e}")
+                continue
+            with self._lock:
+                self._prontas[mapa_id] = surface
+
+    def _gerar(self, mapa_id):
+        caminho = self._caminho_cache(mapa_id)
+        if os.path.exists(caminho):
+            try:
+                return pygame.image.load(caminho)
+            except Exception:
+                pass  # cache corrompido: gera de novo
+
+        terreno = gerar_terreno(mapa_id, self.largura, self.altura, self.seed)
+        # surfarray usa [x, y]
+        surface = pygame.surfarray.make_surface(
+            renderizar_miniatura(terreno, self.cel_tam).transpose(1, 0, 2)
+        )
+        try:
+            os.makedirs(PASTA_CACHE, exist_ok=True)
+            pygame.image.save(surface, caminho)
+        except Exception as e:
+            print(f"⚠️ Não foi possível salvar miniatura {caminho}: {e}")
+        return surface
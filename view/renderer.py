@@ -51,11 +51,18 @@ def _draw_heart_fallback(size: int) -> pygame.Surface:
 _ICON_TROFEU  = _get_icon_png("trofeu.png", 28)
 _ICON_RELOGIO = _get_icon_png("relogio.png", 28)
 _ICON_CORACAO = _get_icon_png("coracao.png", 22)
+_SPRITES_ITEM = {
+    TipoItem.TESOURO: "tesouro.png",
+    TipoItem.ARMADILHA: "armadilha.png",
+    TipoItem.VIDA: "vida.png",
+    TipoItem.CARTA: "carta.png",
+}
 
 class Renderer:
     def __init__(self, tela, jogo):
         self.tela = tela
         self.jogo = jogo
+        self._fonte_caminho = None
 
     # ================= Utilidades =================
 
@@ -128,10 +135,12 @@ class Renderer:
 
     def desenhar_item(self, it, pos_celula):
         px, py = self.coordenadas_celula_para_pixel(*pos_celula)
-        if getattr(it, 'sprite', None):
-            r = it.sprite.get_rect()
+        # itens do motor não trazem sprite: usa o do tipo (o sprite_manager guarda em cache)
+        sprite = getattr(it, 'sprite', None) or _get_icon_png(_SPRITES_ITEM.get(it.tipo, ""), TAMANHO_CELULA // 2)
+        if sprite:
+            r = sprite.get_rect()
             r.center = (px + TAMANHO_CELULA // 2, py + TAMANHO_CELULA // 2)
-            self.tela.blit(it.sprite, r)
+            self.tela.blit(sprite, r)
         else:
             cores_item = {
                 TipoItem.ARMADILHA: CORES['amarelo'],
@@ -147,24 +156,31 @@ class Renderer:
     def desenhar_tabuleiro(self):
         self.tela.fill(CORES['branco'])
 
-        for pos, cel in self.jogo.tabuleiro.celulas.items():
-            sp = cel.obter_sprite_celula()
-            if sp:
-                self.desenhar_sprite_celula(pos, sp)
-            else:
-                self.desenhar_celula(pos, cel.get_cores_terreno()[0])
-
-            # seleção do personagem
-            if (self.jogo.personagem_selecionado
-                and pos == self.jogo.personagem_selecionado.posicao):
-                self.desenhar_overlay_celula(pos, CORES['azul'], 150)
-
-            # ocupantes
-            for oc in cel.ocupantes:
+        tab = self.jogo.tabuleiro
+        # terreno: uma consulta de sprite/cor por tipo, não por célula
+        visuais = {}
+        for y, linha in enumerate(tab.terreno.tolist()):
+            for x, codigo in enumerate(linha):
+                visual = visuais.get(codigo)
+                if visual is None:
+                    cel = tab.get_celula((x, y))
+                    visual = visuais[codigo] = (cel.obter_sprite_celula(), cel.get_cores_terreno()[0])
+                sp, cor = visual
+                if sp:
+                    self.desenhar_sprite_celula((x, y), sp)
+                else:
+                    self.desenhar_celula((x, y), cor)
+
+        # seleção do personagem
+        if self.jogo.personagem_selecionado:
+            self.desenhar_overlay_celula(self.jogo.personagem_selecionado.posicao, CORES['azul'], 150)
+
+        # ocupantes e itens (só as posições que têm algo)
+        for pos, ocupantes in tab.ocupantes_por_posicao():
+            for oc in ocupantes:
                 self.desenhar_entidade(oc, pos)
-
-            # itens
-            for it in cel.itens:
+        for pos, itens in tab.itens_por_posicao():
+            for it in itens:
                 self.desenhar_item(it, pos)
 
         # alcance de movimento
@@ -176,11 +192,35 @@ class Renderer:
                 x, y = self.coordenadas_celula_para_pixel(*pos)
                 rect = pygame.Rect(x, y, TAMANHO_CELULA, TAMANHO_CELULA)
                 pygame.draw.rect(self.tela, cor_borda, rect, 3)
+            self.desenhar_caminho_hover()
 
         # HUDs + painel
         self._desenhar_huds_cantos()
         self.desenhar_painel_inferior()
 
+    def desenhar_caminho_hover(self):
+        """Caminho até a célula sob o mouse, com o custo no destino (e o dano de lava/gelo, se houver)."""
+        caminho = getattr(self.jogo, "caminho_hover", None)
+        if not caminho or len(caminho) < 2:
+            return
+        meio = TAMANHO_CELULA // 2
+        pontos = [(px + meio, py + meio)
+                  for px, py in (self.coordenadas_celula_para_pixel(*pos) for pos in caminho)]
+        pygame.draw.lines(self.tela, CORES['amarelo'], False, pontos, 4)
+        for ponto in pontos[1:-1]:
+            pygame.draw.circle(self.tela, CORES['amarelo'], ponto, 4)
+
+        if self._fonte_caminho is None:
+            self._fonte_caminho = pygame.font.Font(None, 24)
+        texto = self._fonte_caminho.render(str(self.jogo.custo_hover), True, CORES['preto'])
+        raio = max(texto.get_width(), texto.get_height()) // 2 + 4
+        pygame.draw.circle(self.tela, CORES['amarelo'], pontos[-1], raio)
+        self.tela.blit(texto, texto.get_rect(center=pontos[-1]))
+        dano = getattr(self.jogo, "dano_hover", 0)
+        if dano:
+            txt_dano = self._fonte_caminho.render(f"-{dano} HP", True, (255, 80, 80))
+            self.tela.blit(txt_dano, txt_dano.get_rect(midleft=(pontos[-1][0] + raio + 4, pontos[-1][1])))
+
     def desenhar_interface(self):
         # Mantido para compatibilidade; a UI toda é feita em desenhar_tabuleiro()
         pass
@@ -201,20 +241,7 @@ class Renderer:
             rect_hab = pygame.Rect(panel.left + 150, ALTURA_TELA - 90, 160, 50)
 
             # cooldown
-            cd = 0
-            if p in self.jogo.classe_controller.cooldowns:
-                tempos_recarga = {
-                    "GUERREIRO": 60,
-                    "MAGO": 90,
-                    "LADINO": 110,
-                    "CLERIGO": 98
-                }
-                tempo_total = tempos_recarga.get(p.classe.name, 10)
-                agora = pygame.time.get_ticks() / 1000
-                decorrido = agora - self.jogo.classe_controller.cooldowns[p]
-                restante = tempo_total - decorrido
-                if restante > 0:
-                    cd = int(restante)
+            cd = int(self.jogo.habilidades.recarga_restante(p))
 
             cor_btn = (255, 215, 0) if cd == 0 else (100, 100, 100)
             pygame.draw.rect(self.tela, cor_btn, rect_hab, border_radius=10)